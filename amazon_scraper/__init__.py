@@ -0,0 +1,9 @@
+"""
+Amazon Product Scraper Pro: coleta, tradução para PT-BR, conversão de medidas e exportação
+de produtos da Amazon, sem dependência do Streamlit.
+
+Módulos: config, transporte, cache, parsing, traducao, medidas, pipeline, exportacao e cli
+(`python -m amazon_scraper --help`). A interface web fica em app.py.
+"""
+
+__version__ = '2.1'
@@ -0,0 +1,177 @@
+"""Cache em disco das páginas brutas e cache em memória dos resultados processados."""
+
+from typing import List
+import logging
+import json
+from urllib.parse import urlparse
+import time
+from datetime import datetime
+import threading
+import os
+import gzip
+import hashlib
+from collections import OrderedDict
+
+from .config import CACHE_PAGINAS_CONFIG, CACHE_RESULTADOS_CONFIG, SNAPSHOTS_CONFIG
+from .transporte import asin_da_url, limpar_url_amazon, obter_dominio_amazon
+
+def _caminho_produto(diretorio: str, url: str) -> str:
+    """`<diretorio>/<dominio>/<ASIN>` (ou hash da URL, se não houver ASIN), sem extensão"""
+    dominio = obter_dominio_amazon(url) or urlparse(url).netloc
+    chave = asin_da_url(url) or hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(diretorio, dominio, chave)
+
+class CachePaginas:
+    """
+    Guarda o HTML bruto de cada produto em disco (gzip), em `<diretorio>/<dominio>/<ASIN>.html.gz`,
+    com um `.json` ao lado contendo a URL e o horário da coleta.
+    Páginas mais velhas que `ttl_segundos` são ignoradas por `obter`, mas continuam disponíveis
+    para `reprocessar_cache`.
+    """
+
+    def __init__(self, diretorio: str, ttl_segundos: int):
+        self.diretorio = diretorio
+        self.ttl_segundos = ttl_segundos
+
+    def _caminho_base(self, url: str) -> str:
+        return _caminho_produto(self.diretorio, url)
+
+    def obter(self, url: str):
+        """Retorna (conteudo, data_coleta) se houver página válida no cache, senão None"""
+        base = self._caminho_base(url)
+        try:
+            with open(base + '.json', encoding='utf-8') as f:
+                meta = json.load(f)
+            if time.time() - meta['timestamp'] > self.ttl_segundos:
+                return None
+            with gzip.open(base + '.html.gz', 'rb') as f:
+                return f.read(), datetime.fromtimestamp(meta['timestamp'])
+        except (OSError, EOFError, ValueError, KeyError):
+            # EOFError: .html.gz truncado
+            return None
+
+    def ler(self, base: str):
+        """
+        (conteudo, url, data_coleta) da página em `base` (um item de `listar`), mesmo expirada.
+        Levanta OSError/EOFError/ValueError/KeyError se os arquivos faltarem ou estiverem corrompidos.
+        """
+        with open(base + '.json', encoding='utf-8') as f:
+            meta = json.load(f)
+        with gzip.open(base + '.html.gz', 'rb') as f:
+            return f.read(), meta['url'], datetime.fromtimestamp(meta['timestamp'])
+
+    def salvar(self, url: str, conteudo: bytes):
+        """Grava a página e depois o `.json` (que a torna visível em `listar`), ambos atomicamente"""
+        base = self._caminho_base(url)
+        try:
+            os.makedirs(os.path.dirname(base), exist_ok=True)
+            with gzip.open(base + '.html.gz.tmp', 'wb', compresslevel=6) as f:
+                f.write(conteudo)
+            os.replace(base + '.html.gz.tmp', base + '.html.gz')
+            with open(base + '.json.tmp', 'w', encoding='utf-8') as f:
+                json.dump({'url': url, 'timestamp': time.time()}, f)
+            os.replace(base + '.json.tmp', base + '.json')
+        except OSError as e:
+            logging.warning(f"Cache de páginas falhou: {e}")
+
+    def listar(self) -> List[str]:
+        """Caminhos base (sem extensão) de todas as páginas guardadas, inclusive expiradas"""
+        bases = []
+        if not os.path.isdir(self.diretorio):
+            return bases
+        for dominio in sorted(os.listdir(self.diretorio)):
+            pasta = os.path.join(self.diretorio, dominio)
+            if os.path.isdir(pasta):
+                for nome in sorted(os.listdir(pasta)):
+                    if nome.endswith('.json'):
+                        bases.append(os.path.join(pasta, nome[:-len('.json')]))
+        return bases
+
+cache_paginas = CachePaginas(CACHE_PAGINAS_CONFIG['diretorio'], CACHE_PAGINAS_CONFIG['ttl_segundos'])
+
+class SnapshotsProdutos:
+    """
+    Último registro traduzido de cada produto, campo a campo, junto com o hash do conteúdo
+    extraído de cada campo: base do modo incremental (ver `traduzir_e_converter_incremental`).
+    Um JSON por produto em `<diretorio>/<dominio>/<ASIN>.json`, sem expiração — cada
+    atualização substitui o anterior (gravação atômica).
+    """
+
+    def __init__(self, diretorio: str):
+        self.diretorio = diretorio
+
+    def obter(self, url: str):
+        try:
+            with open(_caminho_produto(self.diretorio, url) + '.json', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def salvar(self, url: str, snapshot: dict):
+        caminho = _caminho_produto(self.diretorio, url) + '.json'
+        try:
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+            with open(caminho + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(caminho + '.tmp', caminho)
+        except OSError as e:
+            logging.warning(f"Snapshot do produto falhou: {e}")
+
+snapshots_produtos = SnapshotsProdutos(SNAPSHOTS_CONFIG['diretorio'])
+
+class CacheResultados:
+    """
+    Produtos já coletados e processados, em memória e compartilhados pelo processo.
+    Chave: (domínio, ASIN canônico, método de tradução, traduzir, converter) — a mesma página
+    pedida por outra URL (com /ref, parâmetros, slug) ou por outro usuário cai na mesma entrada.
+    Entradas expiram após `ttl_segundos`; acima de `max_itens`, sai a usada há mais tempo.
+    """
+
+    def __init__(self, ttl_segundos: int, max_itens: int):
+        self.ttl_segundos = ttl_segundos
+        self.max_itens = max_itens
+        self._itens = OrderedDict()
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    @staticmethod
+    def chave(url: str, metodo: str, traduzir: bool, converter: bool) -> tuple:
+        produto = asin_da_url(url) or limpar_url_amazon(url)
+        return (obter_dominio_amazon(url), produto, metodo, bool(traduzir), bool(converter))
+
+    def obter(self, chave: tuple):
+        """Retorna (dados, data_cache) se houver resultado válido, senão None"""
+        with self._trava:
+            item = self._itens.get(chave)
+            if item and time.time() - item[1] <= self.ttl_segundos:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return item[0], datetime.fromtimestamp(item[1])
+            if item:
+                del self._itens[chave]
+            self.falhas += 1
+            return None
+
+    def salvar(self, chave: tuple, dados: dict):
+        with self._trava:
+            self._itens[chave] = (dados, time.time())
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+
+    def limpar(self):
+        with self._trava:
+            self._itens.clear()
+
+    def estatisticas(self) -> dict:
+        with self._trava:
+            consultas = self.acertos + self.falhas
+            return {
+                'itens': len(self._itens),
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+            }
+
+cache_resultados = CacheResultados(CACHE_RESULTADOS_CONFIG['ttl_segundos'], CACHE_RESULTADOS_CONFIG['max_itens'])
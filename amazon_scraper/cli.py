@@ -0,0 +1,154 @@
+"""
+Linha de comando para coletas em lote (cron, workers), sem Streamlit e sem pandas.
+
+    python -m amazon_scraper B08N5WRWNW https://www.amazon.com/dp/B0... -o produtos.jsonl
+    cat urls.txt | python -m amazon_scraper -f csv --workers 8 > produtos.csv
+    python -m amazon_scraper --reprocessar --sem-traducao -o catalogo.jsonl
+"""
+import argparse
+import logging
+import os
+import sys
+from typing import Iterator
+
+FORMATOS = ['jsonl', 'csv', 'xlsx', 'parquet']
+
+def _argumentos(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python -m amazon_scraper',
+        description='Coleta produtos da Amazon, traduz para PT-BR, converte medidas e exporta.',
+    )
+    parser.add_argument('entradas', nargs='*', metavar='URL_OU_ASIN',
+                        help='URLs ou ASINs (sem nenhum e sem --arquivo, lê da entrada padrão)')
+    parser.add_argument('-a', '--arquivo', help="arquivo com uma URL/ASIN por linha ('-' = entrada padrão)")
+    parser.add_argument('-o', '--saida', default='-',
+                        help="arquivo de saída ('-' = saída padrão); para parquet, prefixo dos arquivos")
+    parser.add_argument('-f', '--formato', choices=FORMATOS,
+                        help='formato de exportação (padrão: pela extensão da saída, senão jsonl)')
+    parser.add_argument('--colunas', help='colunas do CSV, separadas por vírgula (escreve numa passada)')
+    parser.add_argument('--sem-traducao', action='store_true', help='não traduz para PT-BR')
+    parser.add_argument('--sem-conversao', action='store_true', help='não converte medidas')
+    parser.add_argument('--gemini', action='store_true', help='traduz com Gemini (GEMINI_API_KEY)')
+    parser.add_argument('--workers', type=int, default=4, help='coletas simultâneas (padrão: 4)')
+    parser.add_argument('--lote', type=int, default=50,
+                        help='produtos por lote de coleta/tradução (padrão: 50)')
+    parser.add_argument('--async', dest='usar_async', action='store_true',
+                        help='coleta com o motor assíncrono (requer httpx)')
+    parser.add_argument('--dominio', default='amazon.com', help='domínio para ASINs puros (padrão: amazon.com)')
+    parser.add_argument('--sem-cache', action='store_true', help='ignora o cache de páginas')
+    parser.add_argument('--reprocessar', action='store_true',
+                        help='refaz a extração de todas as páginas do cache, sem coletar (ignora as entradas)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='traduz só os campos que mudaram desde a última coleta de cada produto')
+    parser.add_argument('--incluir-erros', action='store_true', help='exporta também os produtos com erro')
+    parser.add_argument('--metricas', metavar='ARQUIVO',
+                        help='grava os tempos por etapa no formato Prometheus ao terminar (textfile collector)')
+    parser.add_argument('--metricas-porta', type=int, metavar='PORTA',
+                        help='expõe os tempos por etapa em http://0.0.0.0:PORTA/metrics durante a coleta')
+    parser.add_argument('-v', '--verboso', action='store_true', help='log detalhado na saída de erro')
+    return parser.parse_args(argv)
+
+def _ler_entradas(args) -> Iterator[str]:
+    yield from args.entradas
+    if args.arquivo is None and args.entradas:
+        return
+    if args.arquivo in (None, '-'):
+        arquivo = sys.stdin
+    else:
+        arquivo = open(args.arquivo, encoding='utf-8')
+    try:
+        for linha in arquivo:
+            linha = linha.strip()
+            if linha and not linha.startswith('#'):
+                yield linha
+    finally:
+        if arquivo is not sys.stdin:
+            arquivo.close()
+
+def _formato(args) -> str:
+    if args.formato:
+        return args.formato
+    extensao = os.path.splitext(args.saida)[1].lstrip('.').lower()
+    return extensao if extensao in FORMATOS else 'jsonl'
+
+def main(argv=None) -> int:
+    args = _argumentos(argv)
+    logging.basicConfig(level=logging.INFO if args.verboso else logging.WARNING,
+                        format='%(levelname)s %(message)s', stream=sys.stderr)
+    formato = _formato(args)
+    if formato == 'parquet' and args.saida == '-':
+        logging.error("Parquet precisa de um prefixo de arquivo em --saida")
+        return 2
+
+    from .pipeline import processar_produtos, reprocessar_produtos
+    from .metricas import registro_metricas, servir_metricas
+
+    if args.metricas_porta:
+        servir_metricas(args.metricas_porta)
+
+    gemini_key = os.getenv('GEMINI_API_KEY') if args.gemini else None
+    if args.gemini and not gemini_key:
+        logging.warning("GEMINI_API_KEY não definida: usando as APIs de tradução padrão")
+
+    erros = 0
+
+    opcoes = dict(
+        traduzir=not args.sem_traducao,
+        converter=not args.sem_conversao,
+        usar_gemini=bool(gemini_key),
+        gemini_key=gemini_key,
+        tamanho_lote=args.lote,
+        incremental=args.incremental,
+    )
+
+    def produtos():
+        nonlocal erros
+        if args.reprocessar:
+            fonte = reprocessar_produtos(**opcoes)
+        else:
+            fonte = processar_produtos(
+                _ler_entradas(args),
+                max_workers=args.workers,
+                dominio_padrao=args.dominio,
+                usar_async=args.usar_async,
+                usar_cache=not args.sem_cache,
+                **opcoes,
+            )
+        for dados in fonte:
+            if 'erro' in dados:
+                erros += 1
+                logging.warning(f"Produto com erro: {dados['erro']}")
+                if not args.incluir_erros:
+                    continue
+            yield dados
+
+    if formato in ('jsonl', 'csv'):
+        from .exportacao import exportar_produtos
+        colunas = args.colunas.split(',') if args.colunas else None
+        total = exportar_produtos(produtos(), sys.stdout if args.saida == '-' else args.saida, formato, colunas)
+    elif formato == 'xlsx':
+        from .exportacao import gerar_excel
+        registros = list(produtos())
+        conteudo = gerar_excel(registros)
+        if args.saida == '-':
+            sys.stdout.buffer.write(conteudo)
+        else:
+            with open(args.saida, 'wb') as arquivo:
+                arquivo.write(conteudo)
+        total = len(registros)
+    else:
+        from .exportacao import exportar_parquet
+        registros = list(produtos())
+        prefixo = args.saida[:-len('.parquet')] if args.saida.endswith('.parquet') else args.saida
+        exportar_parquet(registros, prefixo)
+        total = len(registros)
+
+    if args.metricas:
+        # Escreve num temporário e renomeia: o coletor nunca lê um arquivo pela metade
+        temporario = args.metricas + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(registro_metricas.exportar_prometheus())
+        os.replace(temporario, args.metricas)
+
+    logging.info(f"{total} produto(s) exportado(s), {erros} com erro")
+    return 1 if erros else 0
@@ -0,0 +1,309 @@
+"""Configuração: domínios, limites de taxa, caches, provedores de tradução, seletores e glossário."""
+
+import importlib.util
+import os
+from typing import Optional
+
+def _arquivo_env() -> Optional[str]:
+    """Primeiro .env da pasta do pacote para cima (a mesma busca do load_dotenv() sem argumentos)"""
+    pasta = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        caminho = os.path.join(pasta, '.env')
+        if os.path.isfile(caminho):
+            return caminho
+        pai = os.path.dirname(pasta)
+        if pai == pasta:
+            return None
+        pasta = pai
+
+# Carrega variáveis de ambiente do arquivo .env (python-dotenv só é importado se houver um)
+_ENV = _arquivo_env()
+if _ENV:
+    from dotenv import load_dotenv
+    load_dotenv(_ENV)
+
+def modulo_instalado(nome: str) -> bool:
+    """Verifica se um pacote opcional está instalado, sem importá-lo"""
+    try:
+        return importlib.util.find_spec(nome) is not None
+    except (ImportError, ValueError):
+        return False
+
+DOMINIOS_AMAZON = ['amazon.com', 'amazon.com.br', 'amazon.co.uk']
+
+# Limite de requisições por domínio (token bucket): `taxa` req/s, rajada de `capacidade`
+LIMITES_TAXA = {
+    'amazon.com': {'taxa': 0.5, 'capacidade': 2},
+    'amazon.com.br': {'taxa': 0.5, 'capacidade': 2},
+    'amazon.co.uk': {'taxa': 0.5, 'capacidade': 2},
+}
+LIMITE_TAXA_PADRAO = {'taxa': 0.3, 'capacidade': 1}
+
+# Pool de conexões HTTP compartilhado (uma sessão keep-alive por host e política de retry).
+# `tentativas` vale para as falhas de conexão do motor assíncrono (httpx).
+TRANSPORTE_CONFIG = {
+    'pool_connections': 10,
+    'pool_maxsize': 20,
+    'tentativas': 3,
+}
+
+# Novas tentativas feitas pelo urllib3 em cada tipo de sessão (ver `obter_sessao`): só GET e
+# nunca depois de um timeout de leitura (o servidor já recebeu o pedido; tentar de novo só
+# multiplica o timeout). `status` são os códigos HTTP repetidos, com backoff exponencial.
+POLITICAS_RETRY = {
+    'padrao': {'tentativas': 3, 'backoff': 0.5, 'status': [429, 500, 502, 503, 504]},
+    # Páginas da Amazon: 429/503 são bloqueio e ficam com a fila de reagendamento (BLOQUEIO_CONFIG)
+    'paginas': {'tentativas': 3, 'backoff': 0.5, 'status': [500, 502, 504]},
+    # APIs de tradução: nenhuma; cada falha chega ao RoteadorTraducao (saúde e circuit breaker)
+    'traducao': {'tentativas': 0, 'backoff': 0, 'status': []},
+}
+
+# Páginas de bloqueio/captcha: reconhecidas nos primeiros `bytes_inspecionados` da resposta
+# (antes do parsing) pelos marcadores abaixo ou pelo status HTTP. URLs bloqueadas voltam para
+# a fila até `tentativas` vezes, com backoff exponencial (base * 2^n, até `backoff_max`) e jitter.
+# Coletas simultâneas por domínio se adaptam (AIMD): cada bloqueio corta o limite pela metade,
+# `aumento_apos` sucessos seguidos devolvem uma vaga, entre `concorrencia_min` e `concorrencia_max`.
+BLOQUEIO_CONFIG = {
+    'marcadores': [
+        (b'To discuss automated access', 'acesso_automatizado'),
+        (b'/errors/validateCaptcha', 'captcha'),
+        (b'captchacharacters', 'captcha'),
+        (b"Sorry, we just need to make sure you're not a robot", 'robo'),
+    ],
+    'status': [429, 503],
+    'bytes_inspecionados': 64 * 1024,
+    'tentativas': 4,
+    'backoff_base': 2.0,
+    'backoff_max': 120.0,
+    'concorrencia_max': 4,
+    'concorrencia_min': 1,
+    'aumento_apos': 10,
+    'alfa': 0.2,
+    # Latência presumida (s) de um provedor ainda sem chamadas, para ele entrar na disputa
+    'latencia_inicial': 1.0,
+}
+
+# Limites de requisições simultâneas do motor assíncrono
+LIMITES_ASYNC = {
+    'coleta': 20,
+    'traducao': 100,
+}
+
+# Cache em disco das páginas brutas (HTML comprimido), por marketplace e ASIN
+CACHE_PAGINAS_CONFIG = {
+    'diretorio': os.getenv('CACHE_PAGINAS_DIR', '.cache_paginas'),
+    'ttl_segundos': int(os.getenv('CACHE_PAGINAS_TTL', 24 * 3600)),
+}
+
+# Último registro traduzido de cada produto, com o hash de cada campo extraído (modo incremental).
+# `metadados` ficam fora do hash e da tradução: mudam a cada coleta (data) ou nunca são traduzidos.
+SNAPSHOTS_CONFIG = {
+    'diretorio': os.getenv('SNAPSHOTS_DIR', '.snapshots_produtos'),
+    'metadados': ['asin', 'url_produto', 'data_coleta'],
+}
+
+# Cache de resultados prontos (coleta + tradução + conversão), compartilhado por todas as sessões
+CACHE_RESULTADOS_CONFIG = {
+    'ttl_segundos': int(os.getenv('CACHE_RESULTADOS_TTL', 6 * 3600)),
+    'max_itens': int(os.getenv('CACHE_RESULTADOS_MAX', 500)),
+}
+
+# Memória de tradução persistente (SQLite) com LRU em memória na frente
+MEMORIA_TRADUCAO_CONFIG = {
+    'arquivo': os.getenv('MEMORIA_TRADUCAO_DB', '.memoria_traducao.sqlite3'),
+    'tamanho_lru': 5000,
+    'max_entradas': 200000,
+}
+
+# Tradução com Gemini: modelo, tamanho máximo (caracteres) por requisição JSON e
+# quantas vezes re-pedir só os campos que faltaram na resposta
+GEMINI_CONFIG = {
+    'modelo': 'gemini-1.5-flash',
+    'max_caracteres': 6000,
+    'tentativas': 2,
+}
+
+# Roteador de provedores de tradução: falhas seguidas que abrem o circuit breaker,
+# segundos até tentar de novo, peso da média móvel (latência e taxa de erro) e quais
+# provedores usar (PROVEDORES_TRADUCAO=mymemory,libre,google; vazio = todos os instalados)
+ROTEADOR_CONFIG = {
+    'limite_falhas': 3,
+    'tempo_abertura': 60,
+    'alfa': 0.2,
+    # Latência presumida (s) de um provedor ainda sem chamadas, para ele entrar na disputa
+    'latencia_inicial': 1.0,
+    'provedores': [p.strip() for p in os.getenv('PROVEDORES_TRADUCAO', '').split(',') if p.strip()],
+}
+
+# Métricas de tempo por etapa: prefixo dos nomes no formato Prometheus e limites (segundos)
+# dos buckets dos histogramas, de extrair_* (~µs) até coletas lentas (dezenas de segundos)
+METRICAS_CONFIG = {
+    'prefixo': 'amazon_scraper',
+    'buckets': (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+}
+
+# User Agents mais diversos e recentes
+USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36 Edg/121.0.0.0'
+]
+
+SELECTORS = {
+    "titulo": [('span', {'id': 'productTitle'}), ('h1', {'class': 'a-size-large'})],
+    "imagem": [('img', {'id': 'landingImage'}), ('img', {'class': 'a-dynamic-image'})],
+    "preco": [('span', {'class': 'a-price-whole'}), ('span', {'id': 'priceblock_ourprice'})],
+    "avaliacao": [('span', {'id': 'acrPopover'}), ('i', {'class': 'a-icon-star'})],
+    "num_avaliacoes": [('span', {'id': 'acrCustomerReviewText'})],
+    "disponibilidade": [('div', {'id': 'availability'})],
+    "marca": [('a', {'id': 'bylineInfo'})],
+    "about_item": [('div', {'id': 'feature-bullets'})],
+    "product_info": [('table', {'id': 'productDetails_detailBullets_sections1'})]
+}
+
+# Backend de parsing HTML: 'html.parser' (bs4 puro), 'lxml' (bs4 + lxml) ou 'selectolax'
+PARSER_BACKEND = os.getenv('PARSER_BACKEND', 'html.parser')
+
+# Tabelas lidas por extrair_product_info (na ordem de prioridade)
+TABELAS_PRODUCT_INFO = [
+    'productDetails_detailBullets_sections1',
+    'productDetails_techSpec_section_1',
+    'productDetails_techSpec_section_2'
+]
+
+TRADUCOES_MANUAIS = {
+    'titulo_h1': 'Título', 'url_imagem': 'URL da Imagem', 'preco': 'Preço',
+    'avaliacao': 'Avaliação', 'num_avaliacoes': 'Número de Avaliações',
+    'disponibilidade': 'Disponibilidade', 'marca': 'Marca', 'asin': 'ASIN',
+    'about_item': 'Sobre este Item', 'product_info': 'Informações do Produto',
+    'technical_details': 'Detalhes Técnicos', 'data_coleta': 'Data da Coleta',
+    'url_produto': 'URL do Produto',
+}
+
+# Glossário EN -> PT-BR de chaves de especificação e valores frequentes.
+# Consultado antes de qualquer API de tradução (ver Glossario).
+GLOSSARIO_PT = {
+    # Chaves de especificação
+    'ASIN': 'ASIN',
+    'Additional Features': 'Recursos Adicionais',
+    'Age Range (Description)': 'Faixa Etária',
+    'Assembly Required': 'Montagem Necessária',
+    'Batteries': 'Pilhas/Baterias',
+    'Batteries Included': 'Pilhas Incluídas',
+    'Batteries Required': 'Pilhas Necessárias',
+    'Battery Cell Composition': 'Composição da Bateria',
+    'Battery Life': 'Duração da Bateria',
+    'Best Sellers Rank': 'Ranking de Mais Vendidos',
+    'Brand': 'Marca',
+    'Brand Name': 'Nome da Marca',
+    'Capacity': 'Capacidade',
+    'Care Instructions': 'Instruções de Cuidado',
+    'Closure Type': 'Tipo de Fechamento',
+    'Color': 'Cor',
+    'Compatible Devices': 'Dispositivos Compatíveis',
+    'Connectivity Technology': 'Tecnologia de Conectividade',
+    'Country of Origin': 'País de Origem',
+    'Customer Reviews': 'Avaliações de Clientes',
+    'Date First Available': 'Disponível desde',
+    'Department': 'Departamento',
+    'Discontinued by manufacturer': 'Descontinuado pelo fabricante',
+    'Fabric Type': 'Tipo de Tecido',
+    'Finish Type': 'Tipo de Acabamento',
+    'Form Factor': 'Formato',
+    'Fuel Type': 'Tipo de Combustível',
+    'Included Components': 'Componentes Incluídos',
+    'Is Discontinued By Manufacturer': 'Descontinuado pelo Fabricante',
+    'Item Dimensions LxWxH': 'Dimensões do Item (CxLxA)',
+    'Item Height': 'Altura do Item',
+    'Item Length': 'Comprimento do Item',
+    'Item model number': 'Número do Modelo',
+    'Item Package Quantity': 'Quantidade por Pacote',
+    'Item Weight': 'Peso do Item',
+    'Item Width': 'Largura do Item',
+    'Manufacturer': 'Fabricante',
+    'Material': 'Material',
+    'Material Type': 'Tipo de Material',
+    'Model Name': 'Nome do Modelo',
+    'Model Number': 'Número do Modelo',
+    'Number of Items': 'Número de Itens',
+    'Number of Pieces': 'Número de Peças',
+    'Operating System': 'Sistema Operacional',
+    'Package Dimensions': 'Dimensões da Embalagem',
+    'Package Weight': 'Peso da Embalagem',
+    'Part Number': 'Número da Peça',
+    'Pattern': 'Estampa',
+    'Power Source': 'Fonte de Energia',
+    'Product Dimensions': 'Dimensões do Produto',
+    'Recommended Uses For Product': 'Usos Recomendados',
+    'Shape': 'Formato',
+    'Size': 'Tamanho',
+    'Special Feature': 'Recurso Especial',
+    'Specific Uses For Product': 'Usos Específicos',
+    'Style': 'Estilo',
+    'Theme': 'Tema',
+    'UPC': 'UPC',
+    'Voltage': 'Voltagem',
+    'Warranty Description': 'Descrição da Garantia',
+    'Wattage': 'Potência',
+    # Valores frequentes
+    'Yes': 'Sim',
+    'No': 'Não',
+    'In Stock': 'Em estoque',
+    'In Stock.': 'Em estoque.',
+    'Out of Stock': 'Fora de estoque',
+    'Currently unavailable.': 'Indisponível no momento.',
+    'Temporarily out of stock.': 'Temporariamente fora de estoque.',
+    'New': 'Novo',
+    'Used': 'Usado',
+    'Refurbished': 'Recondicionado',
+    'Black': 'Preto',
+    'White': 'Branco',
+    'Silver': 'Prata',
+    'Gray': 'Cinza',
+    'Grey': 'Cinza',
+    'Blue': 'Azul',
+    'Red': 'Vermelho',
+    'Green': 'Verde',
+    'Pink': 'Rosa',
+    'Gold': 'Dourado',
+    'Rose Gold': 'Ouro Rosé',
+    'Stainless Steel': 'Aço Inoxidável',
+    'Plastic': 'Plástico',
+    'Metal': 'Metal',
+    'Wood': 'Madeira',
+    'Glass': 'Vidro',
+    'Cotton': 'Algodão',
+    'Polyester': 'Poliéster',
+    'Leather': 'Couro',
+    'Unisex': 'Unissex',
+    "Men's": 'Masculino',
+    "Women's": 'Feminino',
+    'Boys': 'Meninos',
+    'Girls': 'Meninas',
+    'Battery Powered': 'Alimentado por Bateria',
+    'Corded Electric': 'Elétrico com Fio',
+    'Rechargeable': 'Recarregável',
+    'Lithium Ion': 'Íon de Lítio',
+    'Propane': 'Propano',
+    'Bluetooth': 'Bluetooth',
+    'Wireless': 'Sem fio',
+    'China': 'China',
+    'USA': 'EUA',
+    'United States': 'Estados Unidos',
+    'Mexico': 'México',
+    'Vietnam': 'Vietnã',
+    'Taiwan': 'Taiwan',
+    'Japan': 'Japão',
+    'Germany': 'Alemanha',
+    'India': 'Índia',
+    '1 Count': '1 unidade',
+    '2 Count': '2 unidades',
+    '1 Piece': '1 peça',
+    '1 Year': '1 ano',
+    '1 year manufacturer': '1 ano (fabricante)',
+    'Machine Wash': 'Lavar à máquina',
+    'Hand Wash Only': 'Lavar somente à mão',
+}
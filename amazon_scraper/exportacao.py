@@ -0,0 +1,367 @@
+"""Exportação: CSV, JSON, JSON Lines, Excel, VTEX e Parquet, inclusive em streaming."""
+
+from typing import List, Iterable, Iterator
+import csv
+import json
+import io
+import threading
+import os
+import hashlib
+import tempfile
+import time
+import zipfile
+from collections import OrderedDict
+
+from .config import modulo_instalado
+from .medidas import extrair_medidas
+from .metricas import medir, registrar_span
+
+try:
+    import orjson
+    ORJSON_DISPONIVEL = True
+except ImportError:
+    ORJSON_DISPONIVEL = False
+
+# pyarrow e openpyxl só são importados ao gerar Parquet/planilha
+PYARROW_DISPONIVEL = modulo_instalado('pyarrow')
+OPENPYXL_DISPONIVEL = modulo_instalado('openpyxl')
+
+@medir('exportacao', 'vtex')
+def gerar_vtex_markdown(dados: dict) -> str:
+    """Gera formato HTML específico para VTEX"""
+    titulo = dados.get('Título', dados.get('titulo_h1', 'Produto'))
+    marca = dados.get('Marca', dados.get('marca', 'N/A'))
+    
+    tech_details = dados.get('Detalhes Técnicos', dados.get('technical_details', {}))
+    product_info = dados.get('Informações do Produto', dados.get('product_info', {}))
+    
+    # Tenta montar uma descrição fluida a partir dos bullets
+    about_list = dados.get('Sobre este Item', dados.get('about_item', []))
+    descricao = ""
+    if isinstance(about_list, list) and about_list and about_list != ["N/A"]:
+        # Junta os bullets em um parágrafo único.
+        descricao = " ".join(about_list)
+    else:
+        descricao = f"O {titulo} da marca {marca} oferece qualidade e praticidade."
+
+    specs = {**tech_details, **product_info}
+    
+    # Formato solicitado:
+    # <h4>Titulo<h4> (Note: user showed closing with <h4> too, but standard is </h4>, let's allow standard or user exact req? User said: <h4>...<h4>. I'll stick to standard valid HTML </h4> but keeps the visual structure.)
+    # Actually user typed <h4>...<h4>. Browsers treat unclosed tags weirdly. Best to use </h4>.
+    # <p>Descricao</p>
+    # <endDescription>
+    # Chave: Valor <br>
+    
+    output = f"<h4>{titulo}</h4>\n"
+    output += f"<p>{descricao}</p>\n"
+    output += "<endDescription>\n"
+    
+    # Priorizar Marca e Cor se existirem
+    if marca != "N/A":
+         output += f"Marca: {marca} <br>\n"
+
+    # Adiciona specs
+    for chave, valor in specs.items():
+        if chave != "N/A" and valor != "N/A":
+            # Limpa chave para ficar bonito (remove 'prodDetAttrValue' lixo se houver)
+            chave_limpa = chave.strip()
+            # Evita duplicar marca
+            if chave_limpa.lower() != 'marca' and chave_limpa.lower() != 'nome da marca':
+                output += f"{chave_limpa}: {valor} <br>\n"
+    
+    output += f"ASIN: {dados.get('ASIN', dados.get('asin', 'N/A'))} <br>\n"
+    output += "Aviso: Imagens meramente ilustrativas <br>\n"
+    
+    return output
+
+def _achatar_registro(dados: dict, separador_lista: str = ' | ') -> dict:
+    """Uma linha de CSV: listas viram 'a | b', dicts viram JSON"""
+    dados_flat = {}
+    for chave, valor in dados.items():
+        if isinstance(valor, list):
+            dados_flat[chave] = separador_lista.join(str(v) for v in valor)
+        elif isinstance(valor, dict):
+            dados_flat[chave] = json.dumps(valor, ensure_ascii=False)
+        else:
+            dados_flat[chave] = valor
+    return dados_flat
+
+@medir('exportacao', 'csv')
+def gerar_csv(dados: dict) -> str:
+    output = io.StringIO()
+    dados_flat = _achatar_registro(dados)
+    
+    writer = csv.DictWriter(output, fieldnames=dados_flat.keys())
+    writer.writeheader()
+    writer.writerow(dados_flat)
+    return output.getvalue()
+
+@medir('exportacao', 'json')
+def gerar_json(dados: dict) -> str:
+    return json.dumps(dados, ensure_ascii=False, indent=2)
+
+# --- Exportação em streaming (muitos produtos, memória constante) ---
+
+TAMANHO_BLOCO_EXPORTACAO = 64 * 1024
+
+def _json_linha(dados: dict) -> str:
+    """JSON compacto de uma linha; usa orjson quando instalado"""
+    if ORJSON_DISPONIVEL:
+        try:
+            return orjson.dumps(dados).decode('utf-8')
+        except TypeError:
+            pass  # tipos que o orjson não serializa: cai no json padrão
+    return json.dumps(dados, ensure_ascii=False, separators=(',', ':'))
+
+def _json_carregar(linha: str) -> dict:
+    return orjson.loads(linha) if ORJSON_DISPONIVEL else json.loads(linha)
+
+def gerar_jsonl_stream(registros: Iterable[dict]) -> Iterator[str]:
+    """JSON Lines em blocos de ~64 KB: um produto por linha, sem acumular a saída"""
+    bloco = []
+    tamanho = 0
+    for dados in registros:
+        linha = _json_linha(dados) + '\n'
+        bloco.append(linha)
+        tamanho += len(linha)
+        if tamanho >= TAMANHO_BLOCO_EXPORTACAO:
+            yield ''.join(bloco)
+            bloco, tamanho = [], 0
+    if bloco:
+        yield ''.join(bloco)
+
+def _blocos_csv(linhas: Iterable[dict], colunas: List[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=colunas, extrasaction='ignore')
+    writer.writeheader()
+    for linha in linhas:
+        writer.writerow(linha)
+        if buffer.tell() >= TAMANHO_BLOCO_EXPORTACAO:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def gerar_csv_stream(registros: Iterable[dict], colunas: List[str] = None) -> Iterator[str]:
+    """
+    CSV de vários produtos em blocos de ~64 KB.
+    Com `colunas`, escreve direto numa passada (chaves fora da lista são ignoradas).
+    Sem `colunas`, o cabeçalho é a união das chaves de todos os produtos, na ordem em que
+    aparecem: as linhas já achatadas vão para um arquivo temporário enquanto as chaves são
+    coletadas, e só então o CSV é emitido — a memória fica limitada ao conjunto de chaves.
+    """
+    if colunas is not None:
+        yield from _blocos_csv((_achatar_registro(dados) for dados in registros), list(colunas))
+        return
+    
+    with tempfile.TemporaryFile('w+', encoding='utf-8') as spool:
+        todas_colunas = {}
+        for dados in registros:
+            dados_flat = _achatar_registro(dados)
+            todas_colunas.update(dict.fromkeys(dados_flat))
+            spool.write(_json_linha(dados_flat) + '\n')
+        spool.seek(0)
+        yield from _blocos_csv((_json_carregar(linha) for linha in spool), list(todas_colunas))
+
+def exportar_produtos(registros: Iterable[dict], destino, formato: str = 'jsonl', colunas: List[str] = None) -> int:
+    """
+    Escreve `registros` (qualquer iterável, inclusive gerador) em `destino` no formato 'csv' ou 'jsonl'.
+    `destino` é um caminho ou um objeto com write(): arquivo, sys.stdout, corpo de resposta HTTP
+    (texto ou binário — blocos são codificados em UTF-8 quando o destino não é de texto).
+    Retorna o número de produtos exportados.
+    """
+    total = 0
+    espera = 0.0
+    
+    def contar(iteravel):
+        # Conta os produtos e o tempo gasto esperando por eles (quando `registros` é o próprio
+        # pipeline), que não entra no span da exportação
+        nonlocal total, espera
+        iterador = iter(iteravel)
+        while True:
+            inicio = time.perf_counter()
+            dados = next(iterador, None)
+            espera += time.perf_counter() - inicio
+            if dados is None:
+                return
+            total += 1
+            yield dados
+    
+    if formato == 'csv':
+        blocos = gerar_csv_stream(contar(registros), colunas)
+    elif formato == 'jsonl':
+        blocos = gerar_jsonl_stream(contar(registros))
+    else:
+        raise ValueError(f"Formato de exportação desconhecido: {formato}")
+    
+    inicio = time.perf_counter()
+    if isinstance(destino, (str, os.PathLike)):
+        with open(destino, 'w', encoding='utf-8', newline='') as arquivo:
+            for bloco in blocos:
+                arquivo.write(bloco)
+    else:
+        texto = isinstance(destino, io.TextIOBase)
+        for bloco in blocos:
+            destino.write(bloco if texto else bloco.encode('utf-8'))
+    registrar_span('exportacao', f"{formato}_stream", inicio, time.perf_counter() - inicio - espera)
+    return total
+
+@medir('exportacao', 'xlsx')
+def gerar_excel(registros: Iterable[dict], colunas: List[str] = None) -> bytes:
+    """
+    Planilha .xlsx com um produto por linha, no modo write-only do openpyxl: as linhas vão
+    direto para o XML da planilha, sem montar DataFrame nem manter células em memória.
+    Sem `colunas`, o cabeçalho é a união das chaves (na ordem em que aparecem).
+    """
+    from openpyxl import Workbook
+    
+    if colunas is None:
+        registros = list(registros)
+        colunas = list(dict.fromkeys(chave for dados in registros for chave in dados))
+    
+    workbook = Workbook(write_only=True)
+    planilha = workbook.create_sheet()
+    planilha.append(colunas)
+    for dados in registros:
+        dados_flat = _achatar_registro(dados, separador_lista='\n')
+        planilha.append([dados_flat.get(coluna) for coluna in colunas])
+    
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+# --- Exportações memorizadas (UI) ---
+
+MAX_EXPORTACOES_MEMORIZADAS = 32
+_exportacoes_memorizadas = OrderedDict()
+_trava_exportacoes = threading.Lock()
+
+def hash_conteudo(dados) -> str:
+    """Hash estável do conteúdo (independe da ordem das chaves)"""
+    serializado = json.dumps(dados, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(serializado.encode('utf-8')).hexdigest()
+
+def exportacao_memorizada(hash_dados: str, formato: str, gerar):
+    """
+    Gera a exportação só na primeira vez que é pedida para este conteúdo; depois devolve a cópia
+    memorizada. Chamado fora do script do Streamlit (data= do download_button), por isso o cache
+    é do processo e não do session_state.
+    """
+    chave = (hash_dados, formato)
+    with _trava_exportacoes:
+        if chave in _exportacoes_memorizadas:
+            _exportacoes_memorizadas.move_to_end(chave)
+            return _exportacoes_memorizadas[chave]
+    
+    conteudo = gerar()
+    with _trava_exportacoes:
+        _exportacoes_memorizadas[chave] = conteudo
+        while len(_exportacoes_memorizadas) > MAX_EXPORTACOES_MEMORIZADAS:
+            _exportacoes_memorizadas.popitem(last=False)
+    return conteudo
+
+# --- Exportação colunar (Parquet/Arrow) ---
+
+def _valor_numerico_spec(valor, medidas: list):
+    """Número da especificação: valor SI da medida (se escalar) ou o próprio texto, se for só um número"""
+    for medida in medidas:
+        if not isinstance(medida['valor_si'], list):
+            return medida['valor_si'], medida['unidade_si']
+    try:
+        return float(valor), None
+    except (TypeError, ValueError):
+        return None, None
+
+def tabelas_catalogo(registros: Iterable[dict]):
+    """
+    Monta as tabelas Arrow do catálogo:
+    - produtos: uma linha por produto, uma coluna por campo (união das chaves; listas como list<string>,
+      com textos soltos da mesma coluna como listas de um item);
+    - specs: formato longo (asin, grupo, chave, valor, valor_numerico, unidade_si), uma linha por
+      especificação de cada dict do produto (product_info, technical_details...).
+    O valor numérico vem de 'Medidas' (produtos traduzidos) ou de extrair_medidas sobre o texto original.
+    Grupo, chave e unidade são dictionary-encoded: poucos valores distintos repetidos em todo o catálogo.
+    """
+    import pyarrow as pa
+    
+    colunas = {}
+    specs = {'asin': [], 'grupo': [], 'chave': [], 'valor': [], 'valor_numerico': [], 'unidade_si': []}
+    total = 0
+    
+    for dados in registros:
+        asin = dados.get('ASIN', dados.get('asin'))
+        medidas = dados.get('Medidas', {})
+        
+        for chave, valor in dados.items():
+            if isinstance(valor, dict):
+                if chave == 'Medidas':
+                    continue
+                for sub_chave, sub_valor in valor.items():
+                    if sub_chave == "N/A":
+                        continue
+                    numero, unidade = _valor_numerico_spec(
+                        sub_valor, medidas.get(sub_chave, []) if medidas else extrair_medidas(sub_valor))
+                    specs['asin'].append(asin)
+                    specs['grupo'].append(chave)
+                    specs['chave'].append(sub_chave)
+                    specs['valor'].append(None if sub_valor is None else str(sub_valor))
+                    specs['valor_numerico'].append(numero)
+                    specs['unidade_si'].append(unidade)
+                continue
+            
+            if chave not in colunas:
+                colunas[chave] = [None] * total
+            if isinstance(valor, list):
+                colunas[chave].append([str(v) for v in valor])
+            else:
+                colunas[chave].append(None if valor is None else str(valor))
+        
+        total += 1
+        for valores in colunas.values():
+            if len(valores) < total:
+                valores.append(None)
+    
+    for chave, valores in colunas.items():
+        # Coluna com listas em algum produto vira list<string>: textos soltos entram como lista de um item
+        if any(isinstance(v, list) for v in valores):
+            colunas[chave] = [v if v is None or isinstance(v, list) else [v] for v in valores]
+    produtos = pa.table({
+        chave: pa.array(valores, type=pa.list_(pa.string()) if any(isinstance(v, list) for v in valores) else pa.string())
+        for chave, valores in colunas.items()
+    })
+    tabela_specs = pa.table({
+        'asin': pa.array(specs['asin'], type=pa.string()),
+        'grupo': pa.array(specs['grupo'], type=pa.string()).dictionary_encode(),
+        'chave': pa.array(specs['chave'], type=pa.string()).dictionary_encode(),
+        'valor': pa.array(specs['valor'], type=pa.string()),
+        'valor_numerico': pa.array(specs['valor_numerico'], type=pa.float64()),
+        'unidade_si': pa.array(specs['unidade_si'], type=pa.string()).dictionary_encode(),
+    })
+    return produtos, tabela_specs
+
+@medir('exportacao', 'parquet')
+def exportar_parquet(registros: Iterable[dict], prefixo: str, compressao: str = 'zstd') -> List[str]:
+    """Grava <prefixo>_produtos.parquet e <prefixo>_specs.parquet; retorna os caminhos"""
+    import pyarrow.parquet as pq
+    
+    produtos, specs = tabelas_catalogo(registros)
+    caminhos = [f"{prefixo}_produtos.parquet", f"{prefixo}_specs.parquet"]
+    for tabela, caminho in zip((produtos, specs), caminhos):
+        pq.write_table(tabela, caminho, compression=compressao)
+    return caminhos
+
+@medir('exportacao', 'parquet')
+def gerar_parquet_zip(registros: Iterable[dict], compressao: str = 'zstd') -> bytes:
+    """As duas tabelas Parquet num .zip (para download)"""
+    import pyarrow.parquet as pq
+    
+    produtos, specs = tabelas_catalogo(registros)
+    buffer_zip = io.BytesIO()
+    with zipfile.ZipFile(buffer_zip, 'w', zipfile.ZIP_STORED) as arquivo_zip:
+        for nome, tabela in (('produtos.parquet', produtos), ('specs.parquet', specs)):
+            buffer = io.BytesIO()
+            pq.write_table(tabela, buffer, compression=compressao)
+            arquivo_zip.writestr(nome, buffer.getvalue())
+    return buffer_zip.getvalue()
@@ -0,0 +1,475 @@
+"""Conversão de medidas (imperial -> métrico BR), tamanhos de roupa/calçado e medidas numéricas."""
+
+from typing import List
+import re
+
+# Tabelas de conversão expandidas
+# Tabelas de conversão expandidas (EN + PT)
+CONVERSAO_MEDIDAS = {
+    # Comprimento
+    'inch': {'para': 'cm', 'multiplicador': 2.54, 'precisao': 1, 'tipo': 'linear'},
+    'inches': {'para': 'cm', 'multiplicador': 2.54, 'precisao': 1, 'tipo': 'linear'},
+    'in': {'para': 'cm', 'multiplicador': 2.54, 'precisao': 1, 'tipo': 'linear'},
+    '"': {'para': 'cm', 'multiplicador': 2.54, 'precisao': 1, 'tipo': 'linear'},
+    'polegada': {'para': 'cm', 'multiplicador': 2.54, 'precisao': 1, 'tipo': 'linear'},
+    'polegadas': {'para': 'cm', 'multiplicador': 2.54, 'precisao': 1, 'tipo': 'linear'},
+    
+    'ft': {'para': 'm', 'multiplicador': 0.3048, 'precisao': 2, 'tipo': 'linear'},
+    'feet': {'para': 'm', 'multiplicador': 0.3048, 'precisao': 2, 'tipo': 'linear'},
+    'foot': {'para': 'm', 'multiplicador': 0.3048, 'precisao': 2, 'tipo': 'linear'},
+    "'": {'para': 'm', 'multiplicador': 0.3048, 'precisao': 2, 'tipo': 'linear'},
+    'pé': {'para': 'm', 'multiplicador': 0.3048, 'precisao': 2, 'tipo': 'linear'},
+    'pes': {'para': 'm', 'multiplicador': 0.3048, 'precisao': 2, 'tipo': 'linear'},
+    'pés': {'para': 'm', 'multiplicador': 0.3048, 'precisao': 2, 'tipo': 'linear'},
+    
+    'yd': {'para': 'm', 'multiplicador': 0.9144, 'precisao': 2, 'tipo': 'linear'},
+    'yard': {'para': 'm', 'multiplicador': 0.9144, 'precisao': 2, 'tipo': 'linear'},
+    'yards': {'para': 'm', 'multiplicador': 0.9144, 'precisao': 2, 'tipo': 'linear'},
+    'jarda': {'para': 'm', 'multiplicador': 0.9144, 'precisao': 2, 'tipo': 'linear'},
+    'jardas': {'para': 'm', 'multiplicador': 0.9144, 'precisao': 2, 'tipo': 'linear'},
+    
+    'mi': {'para': 'km', 'multiplicador': 1.60934, 'precisao': 2, 'tipo': 'linear'},
+    'mile': {'para': 'km', 'multiplicador': 1.60934, 'precisao': 2, 'tipo': 'linear'},
+    'miles': {'para': 'km', 'multiplicador': 1.60934, 'precisao': 2, 'tipo': 'linear'},
+    'milha': {'para': 'km', 'multiplicador': 1.60934, 'precisao': 2, 'tipo': 'linear'},
+    'milhas': {'para': 'km', 'multiplicador': 1.60934, 'precisao': 2, 'tipo': 'linear'},
+
+    # Peso
+    'lb': {'para': 'kg', 'multiplicador': 0.453592, 'precisao': 2, 'tipo': 'peso'},
+    'lbs': {'para': 'kg', 'multiplicador': 0.453592, 'precisao': 2, 'tipo': 'peso'},
+    'pound': {'para': 'kg', 'multiplicador': 0.453592, 'precisao': 2, 'tipo': 'peso'},
+    'pounds': {'para': 'kg', 'multiplicador': 0.453592, 'precisao': 2, 'tipo': 'peso'},
+    'libra': {'para': 'kg', 'multiplicador': 0.453592, 'precisao': 2, 'tipo': 'peso'},
+    'libras': {'para': 'kg', 'multiplicador': 0.453592, 'precisao': 2, 'tipo': 'peso'},
+    
+    'oz': {'para': 'g', 'multiplicador': 28.3495, 'precisao': 0, 'tipo': 'peso'},
+    'ounce': {'para': 'g', 'multiplicador': 28.3495, 'precisao': 0, 'tipo': 'peso'},
+    'ounces': {'para': 'g', 'multiplicador': 28.3495, 'precisao': 0, 'tipo': 'peso'},
+    'onça': {'para': 'g', 'multiplicador': 28.3495, 'precisao': 0, 'tipo': 'peso'},
+    'onças': {'para': 'g', 'multiplicador': 28.3495, 'precisao': 0, 'tipo': 'peso'},
+    
+    'us ton': {'para': 'kg', 'multiplicador': 907.185, 'precisao': 0, 'tipo': 'peso'},
+
+    # Volume
+    'fl oz': {'para': 'ml', 'multiplicador': 29.5735, 'precisao': 0, 'tipo': 'volume'},
+    'fluid ounce': {'para': 'ml', 'multiplicador': 29.5735, 'precisao': 0, 'tipo': 'volume'}, 
+    'fluid ounces': {'para': 'ml', 'multiplicador': 29.5735, 'precisao': 0, 'tipo': 'volume'},
+    
+    'cup': {'para': 'ml', 'multiplicador': 236.588, 'precisao': 0, 'tipo': 'volume'},
+    'cups': {'para': 'ml', 'multiplicador': 236.588, 'precisao': 0, 'tipo': 'volume'},
+    
+    'pint': {'para': 'ml', 'multiplicador': 473.176, 'precisao': 0, 'tipo': 'volume'},
+    'pt': {'para': 'ml', 'multiplicador': 473.176, 'precisao': 0, 'tipo': 'volume'},
+    
+    'quart': {'para': 'L', 'multiplicador': 0.946353, 'precisao': 3, 'tipo': 'volume'},
+    'qt': {'para': 'L', 'multiplicador': 0.946353, 'precisao': 3, 'tipo': 'volume'},
+    
+    'gal': {'para': 'L', 'multiplicador': 3.78541, 'precisao': 2, 'tipo': 'volume'},
+    'gallon': {'para': 'L', 'multiplicador': 3.78541, 'precisao': 2, 'tipo': 'volume'},
+    'gallons': {'para': 'L', 'multiplicador': 3.78541, 'precisao': 2, 'tipo': 'volume'},
+    'galão': {'para': 'L', 'multiplicador': 3.78541, 'precisao': 2, 'tipo': 'volume'},
+    'galões': {'para': 'L', 'multiplicador': 3.78541, 'precisao': 2, 'tipo': 'volume'},
+    
+    'cu ft': {'para': 'L', 'multiplicador': 28.3168, 'precisao': 0, 'tipo': 'volume'},
+    'cubic foot': {'para': 'L', 'multiplicador': 28.3168, 'precisao': 0, 'tipo': 'volume'},
+    'cubic feet': {'para': 'L', 'multiplicador': 28.3168, 'precisao': 0, 'tipo': 'volume'},
+    'pé cúbico': {'para': 'L', 'multiplicador': 28.3168, 'precisao': 0, 'tipo': 'volume'},
+    'pés cúbicos': {'para': 'L', 'multiplicador': 28.3168, 'precisao': 0, 'tipo': 'volume'},
+
+    # Area
+    'sq in': {'para': 'cm²', 'multiplicador': 6.4516, 'precisao': 1, 'tipo': 'area'},
+    'sq ft': {'para': 'm²', 'multiplicador': 0.0929, 'precisao': 2, 'tipo': 'area'},
+    'acre': {'para': 'm²', 'multiplicador': 4046.86, 'precisao': 0, 'tipo': 'area'},
+    
+    # Potencia/Energia
+    'hp': {'para': 'kW', 'multiplicador': 0.7457, 'precisao': 2, 'tipo': 'power'},
+    'horsepower': {'para': 'kW', 'multiplicador': 0.7457, 'precisao': 2, 'tipo': 'power'},
+    'btu': {'para': 'J', 'multiplicador': 1055.06, 'precisao': 0, 'tipo': 'energy'}, 
+}
+
+# Unidade de destino ('para') -> (unidade SI, fator) para os campos numéricos de extrair_medidas
+UNIDADES_SI = {
+    'kg': ('kg', 1), 'g': ('kg', 0.001),
+    'm': ('m', 1), 'cm': ('m', 0.01), 'km': ('m', 1000),
+    'L': ('m³', 0.001), 'ml': ('m³', 0.000001),
+    'm²': ('m²', 1), 'cm²': ('m²', 0.0001),
+    'kW': ('W', 1000), 'J': ('J', 1),
+}
+
+# Conversão de tamanhos de roupa (simplificado para detecção direta na string)
+CONVERSAO_TAMANHOS = {
+    # Genérico / Masculino Padrão
+    'XS': 'PP', 'S': 'M', 'M': 'G', 'L': 'GG', 'XL': 'XGG', 
+    '2XL': 'XXGG', '3XL': 'XXXGG', 'XXL': 'XXGG', 'XXS': 'PPP'
+}
+
+# Mapas de Roupas Específicos
+CONVERSAO_FEMININO = {
+    '0': '34', '2': '36', '4': '38', '6': '40', '8': '42', '10': '44', 
+    '12': '46', '14': '48', '16': '50', '18': '52'
+}
+
+CONVERSAO_CALCADOS_FEM = {
+    '5': '34', '5.5': '35', '6': '36', '6.5': '36', '7': '37', '7.5': '37',
+    '8': '38', '8.5': '38', '9': '39', '9.5': '39', '10': '40', '11': '41'
+}
+
+CONVERSAO_CALCADOS_MASC = {
+    '6': '38', '6.5': '38', '7': '39', '7.5': '39', '8': '40', '8.5': '40',
+    '9': '41', '9.5': '41', '10': '42', '10.5': '42', '11': '43', '12': '44', '13': '45'
+}
+
+def identificar_genero(texto: str) -> str:
+    """Identifica contexto de gênero no texto"""
+    texto = texto.lower()
+    if any(p in texto for p in ['women', 'woman', 'feminino', 'mulher', 'senhora', 'ladies']):
+        return 'feminino'
+    if any(p in texto for p in ['men', 'man', 'masculino', 'homem', 'senhor']):
+        return 'masculino'
+    if any(p in texto for p in ['kid', 'child', 'baby', 'infant', 'toddler', 'crianca', 'bebe', 'infantil']):
+        return 'infantil'
+    return 'unisex'
+
+def formatar_numero_br(valor: float, precisao: int = 2) -> str:
+    """Formata número para padrão brasileiro (vírgula decimal)"""
+    if precisao == 0:
+        s = f"{int(round(valor))}"
+    else:
+        s = f"{valor:.{precisao}f}"
+    return s.replace('.', ',')
+
+# --- Motor de conversão: padrões compilados e tabela de unidades montados uma vez ---
+
+# Temperatura: 98.6°F, 98.6 F, 98.6 degrees F, 98.6 graus F
+_RE_TEMPERATURA = re.compile(r'(-?[\d\.,]+)\s*(?:°|º|deg|degrees|graus)?\s*F\b', re.IGNORECASE)
+# Mesmo padrão sem grupos, só para a máscara de `converter_medidas_serie` (str.contains avisa com grupos)
+_RE_TEMPERATURA_MASCARA = re.compile(r'-?[\d\.,]+\s*(?:°|º|deg|degrees|graus)?\s*F\b', re.IGNORECASE)
+
+# Números com vírgulas OU pontos (e dimensões AxBxC) + unidade com possíveis acentos
+_RE_FISICO = re.compile(
+    r'((?:[\d]+(?:[.,][\d]{3})*|\d+)(?:[.,]\d+)?(?:\s*[xX]\s*(?:[\d]+(?:[.,][\d]{3})*|\d+)(?:[.,]\d+)?)*)'
+    r'\s*([a-zA-Z\u00C0-\u00FF"\']+(?:\s+[a-zA-Z\u00C0-\u00FF]+)?)',
+    re.IGNORECASE
+)
+_RE_SEPARADOR_DIMENSAO = re.compile(r'\s*[xX]\s*')
+_RE_DIGITO = re.compile(r'\d')
+_RE_NUMERO_CALCADO = re.compile(r'\b(\d+(?:\.\d)?)\b')
+_RE_NUMERO_ISOLADO = re.compile(r'^\s*\d+\s*$')
+
+# Letras (S, M, L...) - chaves por tamanho reverso para evitar match parcial (ex: XXL vs XL).
+# Regex: (?<![\d.,]\s)(?<!['])\b(XXL|XL|L|...)\b
+# Evita: "10 L" (Liters), "Men's" ('s -> S -> M)
+_RE_TAMANHOS = re.compile(
+    r'(?<![\d.,]\s)(?<![\'])\b('
+    + '|'.join(map(re.escape, sorted(CONVERSAO_TAMANHOS.keys(), key=len, reverse=True)))
+    + r')\b',
+    re.IGNORECASE
+)
+
+# Se a unidade é PT (ex: libras, pés), o número usa vírgula decimal
+_UNIDADES_PT = ['libra', 'polegada', 'pé', 'jarda', 'milha', 'onça', 'galão']
+
+def _montar_unidades() -> dict:
+    """
+    Tabela unidade (minúscula) -> (info de CONVERSAO_MEDIDAS, unidade_pt), incluindo as
+    variantes de plural aceitas ('s' final e 'ao' -> 'oes'). Exatas têm precedência.
+    """
+    unidades = {}
+    for unidade, info in CONVERSAO_MEDIDAS.items():
+        unidades[unidade] = info
+    for unidade, info in CONVERSAO_MEDIDAS.items():
+        unidades.setdefault(unidade + 's', info)
+    for unidade, info in CONVERSAO_MEDIDAS.items():
+        if unidade.endswith('ao'):
+            unidades.setdefault(unidade[:-2] + 'oes', info)
+    return {
+        unidade: (info, any(u in unidade for u in _UNIDADES_PT))
+        for unidade, info in unidades.items()
+    }
+
+_UNIDADES_MEDIDA = _montar_unidades()
+
+# A mesma tabela em colunas (unidade -> escalar), para lookups vetorizados com Series.map
+_COLUNAS_UNIDADES = {
+    'multiplicador': {u: info['multiplicador'] for u, (info, _) in _UNIDADES_MEDIDA.items()},
+    'para': {u: info['para'] for u, (info, _) in _UNIDADES_MEDIDA.items()},
+    'precisao': {u: info['precisao'] for u, (info, _) in _UNIDADES_MEDIDA.items()},
+    'tipo': {u: info.get('tipo', 'geral') for u, (info, _) in _UNIDADES_MEDIDA.items()},
+    'unidade_pt': {u: unidade_pt for u, (_, unidade_pt) in _UNIDADES_MEDIDA.items()},
+}
+
+def _conv_temp(match) -> str:
+    orig = match.group(0)
+    try:
+        val_str = match.group(1).replace(',', '.')
+        # Se existirem multiplos pontos (ex 1.200.5), falha
+        if val_str.count('.') > 1: return orig
+        
+        val_f = float(val_str)
+        val_c = (val_f - 32) * 5/9
+        return f"{formatar_numero_br(val_c, 1)}°C ({orig})"
+    except Exception:
+        return orig
+
+def _conv_fisico(match) -> str:
+    unidade = match.group(2).lower()
+    encontrada = _UNIDADES_MEDIDA.get(unidade)
+    if not encontrada:
+        return match.group(0)
+    
+    info_unidade, unidade_pt = encontrada
+    numeros_str = match.group(1)
+    novo_std = info_unidade['para']
+    fator = info_unidade['multiplicador']
+    precisao = info_unidade['precisao']
+    tipo = info_unidade.get('tipo', 'geral')
+    
+    if 'x' in numeros_str or 'X' in numeros_str:
+        partes = _RE_SEPARADOR_DIMENSAO.split(numeros_str)
+    else:
+        partes = [numeros_str]
+    partes_convertidas = []
+    
+    for parte in partes:
+        try:
+            parte_limpa = parte.replace(' ', '')
+            
+            if unidade_pt: 
+                # Formato BR: 1.200,50 ou 1200,50
+                # Remove pontos de milhar, troca vírgula decimal por ponto
+                val_float = float(parte_limpa.replace('.', '').replace(',', '.'))
+            else:
+                # Formato US: 1,200.50 ou 1200.50
+                # Remove vírgulas de milhar
+                val_float = float(parte_limpa.replace(',', ''))
+                
+            val_conv = val_float * fator
+            
+            # Lógica de escala inteligente
+            std_final = novo_std
+            val_final = val_conv
+            
+            if tipo == 'peso':
+                if std_final == 'kg' and val_final < 1:
+                    val_final *= 1000
+                    std_final = 'g'
+                    precisao = 0
+                elif std_final == 'g' and val_final >= 1000:
+                    val_final /= 1000
+                    std_final = 'kg'
+                    precisao = 2
+                    
+            elif tipo == 'linear':
+                if std_final == 'm' and val_final < 1:
+                    val_final *= 100
+                    std_final = 'cm'
+                    precisao = 1
+                elif std_final == 'cm' and val_final >= 100:
+                    val_final /= 100
+                    std_final = 'm'
+                    precisao = 2
+            
+            elif tipo == 'volume':
+                if std_final == 'L' and val_final < 1:
+                    val_final *= 1000
+                    std_final = 'ml'
+                    precisao = 0
+            
+            partes_convertidas.append(formatar_numero_br(val_final, precisao))
+            novo_std = std_final 
+            
+        except ValueError:
+            partes_convertidas.append(parte)
+    
+    valores_formatados = " x ".join(partes_convertidas)
+    return f"{valores_formatados} {novo_std}"
+
+def _conv_tamanho(match) -> str:
+    return CONVERSAO_TAMANHOS.get(match.group(0).upper(), match.group(0))
+
+def converter_medidas(texto: str, genero_ctx: str = 'unisex') -> str:
+    """
+    Converte medidas americanas para brasileiras e tamanhos de roupa.
+    Suporta: Peso, Comprimento, Volume, Área, Temperatura, Roupas/Calçados.
+    Usa os padrões pré-compilados e a tabela _UNIDADES_MEDIDA (nada é montado por chamada).
+    """
+    if not texto or texto == "N/A":
+        return texto
+    
+    texto_final = texto
+    
+    # Temperatura e medidas físicas só convertem com algum dígito no texto
+    if _RE_DIGITO.search(texto):
+        # --- 1. Conversão de Temperatura (F -> C) ---
+        texto_final = _RE_TEMPERATURA.sub(_conv_temp, texto_final)
+        
+        # --- 2. Conversão de Medidas Físicas (Peso, Dimensão, Volume) ---
+        texto_final = _RE_FISICO.sub(_conv_fisico, texto_final)
+
+    # --- 3. Conversão de Tamanhos (Roupas/Calçados) ---
+    # Apenas se o texto for curto (provavelmente um campo de "Tamanho") ou parecer um tamanho isolado
+    if len(texto) < 50: 
+        texto_lower = texto.lower()
+        # Calçados
+        if 'shoe' in texto_lower or 'tênis' in texto_lower or 'calçado' in texto_lower or 'boot' in texto_lower:
+            mapa = CONVERSAO_CALCADOS_MASC if genero_ctx == 'masculino' else CONVERSAO_CALCADOS_FEM
+            # Procura número isolado
+            match_num = _RE_NUMERO_CALCADO.search(texto_final)
+            if match_num:
+                num_us = match_num.group(1)
+                if num_us in mapa:
+                    texto_final = texto_final.replace(num_us, f"BR {mapa[num_us]} (US {num_us})")
+        
+        # Roupas (Numérico Feminino)
+        elif genero_ctx == 'feminino' and _RE_NUMERO_ISOLADO.match(texto_final):
+             num = texto_final.strip()
+             if num in CONVERSAO_FEMININO:
+                 texto_final = f"BR {CONVERSAO_FEMININO[num]} (US {num})"
+
+        # Letras (S, M, L...) - Single Pass Replacement + Lookbehind Protection
+        texto_final = _RE_TAMANHOS.sub(_conv_tamanho, texto_final)
+
+    return texto_final
+
+# Célula que é só "<número>[ x <número>[ x <número>]] <unidade>" (com espaços nas pontas).
+# Mesmos subpadrões de _RE_FISICO, então número e unidade casam exatamente igual.
+_NUMERO_MEDIDA = r'(?:[\d]+(?:[.,][\d]{3})*|\d+)(?:[.,]\d+)?'
+_RE_MEDIDA_SIMPLES = re.compile(
+    rf'^(\s*)({_NUMERO_MEDIDA})(?:\s*[xX]\s*({_NUMERO_MEDIDA}))?(?:\s*[xX]\s*({_NUMERO_MEDIDA}))?'
+    r'\s*([a-zA-Z\u00C0-\u00FF"\']+(?:\s+[a-zA-Z\u00C0-\u00FF]+)?)(\s*)$'
+)
+
+def converter_medidas_serie(textos, generos=None):
+    """
+    Versão em lote de `converter_medidas` para colunas de catálogo (pandas Series ou lista),
+    com o contexto de gênero por célula (`generos`: Series/lista alinhada ou uma string).
+    Células que são só medidas ("2.2 pounds", "10 x 5 x 3 inches") são tokenizadas com
+    `str.extract` e convertidas com aritmética NumPy sobre os fatores de CONVERSAO_MEDIDAS;
+    as demais passam por `converter_medidas` uma vez por par (texto, gênero) distinto.
+    O resultado é idêntico a aplicar `converter_medidas` célula a célula.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    como_lista = not isinstance(textos, pd.Series)
+    serie = pd.Series(textos, dtype=object) if como_lista else textos
+    if isinstance(generos, pd.Series):
+        generos = generos.to_numpy(dtype=object)
+    elif generos is None or isinstance(generos, str):
+        generos = np.full(len(serie), generos or 'unisex', dtype=object)
+    generos = np.asarray(generos, dtype=object)
+    generos[pd.isna(generos)] = 'unisex'
+    
+    valores = serie.to_numpy(dtype=object)
+    resultado = valores.copy()
+    eh_texto = np.fromiter((isinstance(v, str) for v in valores), dtype=bool, count=len(valores))
+    if not eh_texto.any():
+        return resultado.tolist() if como_lista else serie.copy()
+    
+    # Catálogos repetem muito ("No", "1 Count", "2.2 pounds"): trabalha só com os pares distintos
+    codigos, unicos = pd.factorize(pd.MultiIndex.from_arrays([valores[eh_texto], generos[eh_texto]]))
+    textos_unicos = pd.Series(unicos.get_level_values(0), dtype=object)
+    generos_unicos = unicos.get_level_values(1)
+    convertidos_unicos = np.empty(len(textos_unicos), dtype=object)
+    
+    # --- Células só com medida: caminho vetorizado ---
+    partes = textos_unicos.str.extract(_RE_MEDIDA_SIMPLES)
+    unidades = partes[4].str.lower()
+    simples = (unidades.isin(_UNIDADES_MEDIDA.keys()) & ~textos_unicos.str.contains(_RE_TEMPERATURA_MASCARA)).to_numpy()
+    
+    if simples.any():
+        partes = partes[simples]
+        unidades = unidades[simples]
+        fator = unidades.map(_COLUNAS_UNIDADES['multiplicador']).to_numpy(dtype=float)
+        tipo = unidades.map(_COLUNAS_UNIDADES['tipo']).to_numpy(dtype=object)
+        unidade_pt = unidades.map(_COLUNAS_UNIDADES['unidade_pt']).to_numpy(dtype=bool)
+        std = unidades.map(_COLUNAS_UNIDADES['para']).to_numpy(dtype=object)
+        precisao = unidades.map(_COLUNAS_UNIDADES['precisao']).to_numpy(dtype=int)
+        
+        formatadas = []
+        for coluna in (1, 2, 3):
+            parte = partes[coluna]
+            presente = parte.notna().to_numpy()
+            numero_br = parte.str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+            numero_us = parte.str.replace(',', '', regex=False)
+            numero = pd.to_numeric(numero_us.where(~unidade_pt, numero_br), errors='coerce').to_numpy(dtype=float)
+            
+            valor = numero * fator
+            ok = presente & ~np.isnan(valor)
+            
+            # Lógica de escala inteligente (mesmas regras de _conv_fisico), avaliada no estado atual
+            regras = [
+                (ok & (tipo == 'peso') & (std == 'kg') & (valor < 1), np.multiply, 1000, 'g', 0),
+                (ok & (tipo == 'peso') & (std == 'g') & (valor >= 1000), np.divide, 1000, 'kg', 2),
+                (ok & (tipo == 'linear') & (std == 'm') & (valor < 1), np.multiply, 100, 'cm', 1),
+                (ok & (tipo == 'linear') & (std == 'cm') & (valor >= 100), np.divide, 100, 'm', 2),
+                (ok & (tipo == 'volume') & (std == 'L') & (valor < 1), np.multiply, 1000, 'ml', 0),
+            ]
+            std = std.copy()
+            for mascara, operacao, escala, nova_std, nova_precisao in regras:
+                valor = np.where(mascara, operacao(valor, escala), valor)
+                std[mascara] = nova_std
+                precisao = np.where(mascara, nova_precisao, precisao)
+            
+            originais = parte.to_numpy(dtype=object)
+            formatadas.append([
+                (formatar_numero_br(v, p) if o else t) if pres else None
+                for v, p, o, t, pres in zip(valor, precisao, ok, originais, presente)
+            ])
+        
+        convertidos_unicos[simples] = [
+            f"{prefixo}{' x '.join(p for p in (p1, p2, p3) if p is not None)} {unidade}{sufixo}"
+            for prefixo, p1, p2, p3, unidade, sufixo in zip(
+                partes[0], formatadas[0], formatadas[1], formatadas[2], std, partes[5])
+        ]
+    
+    # --- Demais células: converter_medidas uma vez por (texto, gênero) distinto ---
+    for i in np.flatnonzero(~simples):
+        convertidos_unicos[i] = converter_medidas(textos_unicos.iat[i], generos_unicos[i])
+    
+    resultado[eh_texto] = convertidos_unicos[codigos]
+    if como_lista:
+        return resultado.tolist()
+    return pd.Series(resultado, index=serie.index, name=serie.name, dtype=object)
+
+def extrair_medidas(texto: str) -> List[dict]:
+    """
+    Medidas numéricas do texto de origem, com a mesma tokenização de `converter_medidas`.
+    Cada medida: {'tipo', 'valor', 'unidade', 'valor_si', 'unidade_si'}, onde 'tipo' vem de
+    CONVERSAO_MEDIDAS. Em dimensões "C x L x A", 'valor'/'valor_si' são listas e
+    'comprimento'/'largura'/'altura' trazem cada eixo já em unidade SI.
+    """
+    if not isinstance(texto, str) or not _RE_DIGITO.search(texto):
+        return []
+    
+    medidas = []
+    for match in _RE_FISICO.finditer(texto):
+        unidade = match.group(2)
+        encontrada = _UNIDADES_MEDIDA.get(unidade.lower())
+        if not encontrada:
+            continue
+        
+        info_unidade, unidade_pt = encontrada
+        unidade_si, fator_si = UNIDADES_SI[info_unidade['para']]
+        try:
+            valores = [
+                float(parte.replace(' ', '').replace('.', '').replace(',', '.')) if unidade_pt
+                else float(parte.replace(' ', '').replace(',', ''))
+                for parte in _RE_SEPARADOR_DIMENSAO.split(match.group(1))
+            ]
+        except ValueError:
+            continue
+        valores_si = [round(v * info_unidade['multiplicador'] * fator_si, 9) for v in valores]
+        
+        medida = {
+            'tipo': info_unidade.get('tipo', 'geral'),
+            'valor': valores[0] if len(valores) == 1 else valores,
+            'unidade': unidade,
+            'valor_si': valores_si[0] if len(valores_si) == 1 else valores_si,
+            'unidade_si': unidade_si,
+        }
+        if medida['tipo'] == 'linear' and len(valores_si) > 1:
+            medida.update(zip(('comprimento', 'largura', 'altura'), valores_si))
+        medidas.append(medida)
+    
+    return medidas
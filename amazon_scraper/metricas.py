@@ -0,0 +1,230 @@
+"""Métricas de tempo por etapa: spans, contadores/histogramas no formato Prometheus e tempos por produto."""
+
+from typing import List, Dict
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import ContextDecorator, contextmanager
+
+from .config import METRICAS_CONFIG
+
+DESCRICOES = {
+    'etapa_segundos': 'Duração de cada etapa do pipeline (coleta, parsing, extrair_*, provedores, conversão, exportação)',
+    'etapa_total': 'Execuções de cada etapa do pipeline, por resultado',
+    'bloqueios_total': 'Páginas de bloqueio/captcha recebidas, por domínio e motivo',
+    'reagendamentos_total': 'URLs bloqueadas recolocadas na fila com backoff',
+    'campos_incrementais_total': 'Campos de produto no modo incremental: traduzidos de novo ou reaproveitados do snapshot',
+}
+
+def _rotulos_texto(rotulos: tuple) -> str:
+    if not rotulos:
+        return ''
+    partes = []
+    for nome, valor in rotulos:
+        valor = str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        partes.append(f'{nome}="{valor}"')
+    return '{' + ','.join(partes) + '}'
+
+class Histograma:
+    """Contagens por bucket (não acumuladas), soma e total de observações"""
+
+    def __init__(self, limites: tuple):
+        self.limites = limites
+        self.contagens = [0] * (len(limites) + 1)
+        self.soma = 0.0
+        self.total = 0
+
+    def observar(self, valor: float):
+        self.contagens[bisect.bisect_left(self.limites, valor)] += 1
+        self.soma += valor
+        self.total += 1
+
+class RegistroMetricas:
+    """
+    Contadores e histogramas do processo, identificados por (nome, rótulos).
+    `exportar_prometheus` gera o formato de texto do Prometheus (para um arquivo do
+    textfile collector no fim de um lote, ou para o endpoint de `servir_metricas`).
+    """
+
+    def __init__(self, prefixo: str, buckets: tuple):
+        self.prefixo = prefixo
+        self.buckets = tuple(sorted(buckets))
+        self._contadores = {}
+        self._histogramas = {}
+        self._trava = threading.Lock()
+
+    def incrementar(self, nome: str, rotulos: tuple = (), valor: float = 1):
+        with self._trava:
+            self._contadores[(nome, rotulos)] = self._contadores.get((nome, rotulos), 0) + valor
+
+    def observar(self, nome: str, rotulos: tuple, segundos: float):
+        with self._trava:
+            histograma = self._histogramas.get((nome, rotulos))
+            if histograma is None:
+                histograma = self._histogramas[(nome, rotulos)] = Histograma(self.buckets)
+            histograma.observar(segundos)
+
+    def limpar(self):
+        with self._trava:
+            self._contadores.clear()
+            self._histogramas.clear()
+
+    def resumo(self) -> List[dict]:
+        """Uma linha por série de histograma: rótulos, chamadas, soma e média (ms)"""
+        with self._trava:
+            return [
+                {**dict(rotulos), 'chamadas': h.total, 'total_ms': h.soma * 1000,
+                 'media_ms': h.soma * 1000 / h.total if h.total else 0.0}
+                for (nome, rotulos), h in sorted(self._histogramas.items())
+            ]
+
+    def exportar_prometheus(self) -> str:
+        linhas = []
+        with self._trava:
+            contadores = sorted(self._contadores.items())
+            histogramas = sorted(
+                (chave, (list(h.contagens), h.soma, h.total)) for chave, h in self._histogramas.items()
+            )
+
+        declarados = set()
+        for (nome, rotulos), valor in contadores:
+            metrica = f"{self.prefixo}_{nome}"
+            if metrica not in declarados:
+                declarados.add(metrica)
+                linhas.append(f"# HELP {metrica} {DESCRICOES.get(nome, nome)}")
+                linhas.append(f"# TYPE {metrica} counter")
+            linhas.append(f"{metrica}{_rotulos_texto(rotulos)} {valor}")
+
+        for (nome, rotulos), (contagens, soma, total) in histogramas:
+            metrica = f"{self.prefixo}_{nome}"
+            if metrica not in declarados:
+                declarados.add(metrica)
+                linhas.append(f"# HELP {metrica} {DESCRICOES.get(nome, nome)}")
+                linhas.append(f"# TYPE {metrica} histogram")
+            acumulado = 0
+            for limite, contagem in zip(self.buckets + ('+Inf',), contagens):
+                acumulado += contagem
+                linhas.append(f"{metrica}_bucket{_rotulos_texto(rotulos + (('le', limite),))} {acumulado}")
+            linhas.append(f"{metrica}_sum{_rotulos_texto(rotulos)} {soma}")
+            linhas.append(f"{metrica}_count{_rotulos_texto(rotulos)} {total}")
+
+        return '\n'.join(linhas) + '\n'
+
+registro_metricas = RegistroMetricas(METRICAS_CONFIG['prefixo'], METRICAS_CONFIG['buckets'])
+
+class TemposProduto:
+    """
+    Spans de um único produto: (etapa, detalhe, início relativo, duração, erro), em segundos.
+    Etapas paralelas (traduções no pool de threads) se sobrepõem, então a soma das durações
+    pode passar do tempo de parede (`total`).
+    """
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.spans = []
+
+    def adicionar(self, etapa: str, detalhe: str, inicio: float, duracao: float, erro: bool):
+        self.spans.append((etapa, detalhe, inicio - self.inicio, duracao, erro))
+
+    @property
+    def total(self) -> float:
+        return max((inicio + duracao for _, _, inicio, duracao, _ in self.spans), default=0.0)
+
+    def resumo(self) -> List[Dict]:
+        """Spans agrupados por (etapa, detalhe), na ordem em que cada grupo começou"""
+        grupos = {}
+        for etapa, detalhe, inicio, duracao, erro in self.spans:
+            grupo = grupos.setdefault((etapa, detalhe), {
+                'etapa': etapa, 'detalhe': detalhe, 'inicio_ms': inicio * 1000,
+                'chamadas': 0, 'erros': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+            })
+            grupo['chamadas'] += 1
+            grupo['erros'] += erro
+            grupo['total_ms'] += duracao * 1000
+            grupo['max_ms'] = max(grupo['max_ms'], duracao * 1000)
+        return sorted(grupos.values(), key=lambda g: g['inicio_ms'])
+
+_tempos_atuais = contextvars.ContextVar('tempos_produto', default=None)
+
+class Span(ContextDecorator):
+    """Mede um bloco (ou função, como decorador) e registra no processo e no produto atual"""
+
+    def __init__(self, etapa: str, detalhe: str = ''):
+        self.etapa = etapa
+        self.detalhe = detalhe
+
+    def _recreate_cm(self):
+        # Como decorador, cada chamada precisa do seu próprio início
+        return Span(self.etapa, self.detalhe)
+
+    def __enter__(self):
+        self._inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo_exc, exc, tb):
+        registrar_span(self.etapa, self.detalhe, self._inicio, time.perf_counter() - self._inicio, tipo_exc is not None)
+        return False
+
+def registrar_span(etapa: str, detalhe: str, inicio: float, duracao: float, erro: bool = False):
+    """Registra um span já medido (`inicio` em time.perf_counter) no processo e no produto atual"""
+    rotulos = (('etapa', etapa), ('detalhe', detalhe)) if detalhe else (('etapa', etapa),)
+    registro_metricas.observar('etapa_segundos', rotulos, duracao)
+    registro_metricas.incrementar('etapa_total', rotulos + (('resultado', 'erro' if erro else 'ok'),))
+    tempos = _tempos_atuais.get()
+    if tempos is not None:
+        tempos.adicionar(etapa, detalhe, inicio, duracao, erro)
+
+def medir(etapa: str, detalhe: str = '') -> Span:
+    """`with medir('coleta'):` ou `@medir('exportacao', 'csv')`"""
+    return Span(etapa, detalhe)
+
+@contextmanager
+def registrar_tempos(tempos: TemposProduto = None):
+    """Direciona os spans do bloco (e das threads via `com_contexto`) para `tempos`, se houver"""
+    if tempos is None:
+        yield None
+        return
+    token = _tempos_atuais.set(tempos)
+    try:
+        yield tempos
+    finally:
+        _tempos_atuais.reset(token)
+
+def com_contexto(funcao):
+    """Envolve `funcao` para que, rodando num pool de threads, seus spans vão para o produto atual"""
+    tempos = _tempos_atuais.get()
+    if tempos is None:
+        return funcao
+
+    def executar(*args, **kwargs):
+        token = _tempos_atuais.set(tempos)
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            _tempos_atuais.reset(token)
+    return executar
+
+def servir_metricas(porta: int, endereco: str = '0.0.0.0'):
+    """Endpoint /metrics (formato Prometheus) numa thread daemon; retorna o servidor"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            corpo = registro_metricas.exportar_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def log_message(self, *args):
+            pass
+
+    servidor = ThreadingHTTPServer((endereco, porta), Handler)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
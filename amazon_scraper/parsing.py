@@ -0,0 +1,256 @@
+"""Parsing das páginas de produto (html.parser, lxml ou selectolax) e funções extrair_*."""
+
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import List, Dict
+import logging
+
+from .config import PARSER_BACKEND, SELECTORS, TABELAS_PRODUCT_INFO, modulo_instalado
+from .transporte import asin_da_url
+
+# Backends opcionais: lxml é carregado pelo próprio BeautifulSoup; selectolax, no primeiro parsing
+LXML_DISPONIVEL = modulo_instalado('lxml')
+SELECTOLAX_DISPONIVEL = modulo_instalado('selectolax')
+
+class FiltroPagina(SoupStrainer):
+    """
+    SoupStrainer que só deixa o parser montar as subárvores usadas pelas funções extrair_*
+    (título, bloco de preço, feature-bullets, tabelas prodDet...). Uma tag é mantida se
+    casar com algum seletor (tag, {'id'|'class': valor}) — regra OU, que o SoupStrainer
+    padrão não expressa.
+    """
+
+    def __init__(self, seletores: list):
+        super().__init__()
+        self._ids = {}
+        self._classes = {}
+        for tag, attrs in seletores:
+            for attr, valor in attrs.items():
+                destino = self._ids if attr == 'id' else self._classes
+                destino.setdefault(tag, set()).add(valor)
+
+    def aceita(self, nome: str, attrs) -> bool:
+        attrs = attrs or {}
+        if attrs.get('id') in self._ids.get(nome, ()):
+            return True
+        classes = attrs.get('class') or ''
+        if isinstance(classes, str):
+            classes = classes.split()
+        return any(c in self._classes.get(nome, ()) for c in classes)
+
+    # bs4 >= 4.13
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self.aceita(name, attrs)
+
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+    # bs4 < 4.13
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        return markup_name if self.aceita(markup_name, markup_attrs) else None
+
+FILTRO_PAGINA = FiltroPagina(
+    [seletor for seletores in SELECTORS.values() for seletor in seletores]
+    + [('table', {'id': table_id}) for table_id in TABELAS_PRODUCT_INFO]
+    + [('table', {'class': 'prodDetTable'})]
+)
+
+class IndicePagina:
+    """
+    Índice dos elementos da página montado numa única travessia da árvore.
+    Responde às consultas `find(tag, {'id'|'class': valor})` e `find_all(tag, class_=...)`
+    que as funções extrair_* fazem, em O(1), no lugar de uma varredura por consulta.
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        self._primeiro = {}
+        self._por_classe = {}
+        for elemento in soup.find_all(True):
+            id_elemento = elemento.get('id')
+            if id_elemento:
+                self._primeiro.setdefault((elemento.name, 'id', id_elemento), elemento)
+            for classe in dict.fromkeys(elemento.get('class') or []):
+                self._primeiro.setdefault((elemento.name, 'class', classe), elemento)
+                self._por_classe.setdefault((elemento.name, classe), []).append(elemento)
+
+    def find(self, tag: str, attrs: dict):
+        (attr, valor), = attrs.items()
+        return self._primeiro.get((tag, attr, valor))
+
+    def find_all(self, tag: str, class_: str) -> list:
+        return self._por_classe.get((tag, class_), [])
+
+class NoSelectolax:
+    """
+    Adapta um nó do selectolax (lexbor) ao subconjunto da API do BeautifulSoup usado pelas
+    funções extrair_*: find, find_all, get, get_text e find(text=True, recursive=False).
+    As buscas viram seletores CSS executados em C.
+    """
+    __slots__ = ('_no',)
+
+    def __init__(self, no):
+        self._no = no
+
+    @property
+    def name(self) -> str:
+        return self._no.tag
+
+    @staticmethod
+    def _seletor(tag: str, attrs: dict = None, class_: str = None) -> str:
+        seletor = tag or '*'
+        for attr, valor in (attrs or {}).items():
+            seletor += f'[{attr}="{valor}"]' if attr == 'id' else f'[{attr}~="{valor}"]'
+        if class_:
+            seletor += f'[class~="{class_}"]'
+        return seletor
+
+    def find(self, tag: str = None, attrs: dict = None, class_: str = None, text=None, recursive: bool = True):
+        if text is True and not recursive:
+            # Primeira string filha direta, como no bs4: texto (inclusive só espaços) ou comentário
+            filho = self._no.child
+            while filho is not None:
+                if filho.tag == '-text':
+                    return filho.text_content
+                if filho.tag == '-comment':
+                    return filho.comment_content
+                filho = filho.next
+            return None
+        no = self._no.css_first(self._seletor(tag, attrs, class_))
+        return NoSelectolax(no) if no is not None else None
+
+    def find_all(self, tag: str, class_: str = None) -> list:
+        return [NoSelectolax(no) for no in self._no.css(self._seletor(tag, class_=class_))]
+
+    def get(self, attr: str, default=None):
+        valor = self._no.attributes.get(attr, default)
+        if attr == 'class' and valor:
+            return valor.split()
+        return valor
+
+    def get_text(self, strip: bool = False) -> str:
+        # Sem <script>/<style> dentro, o texto sai direto do lexbor (em C)
+        if self._no.css_first('script, style') is None:
+            return self._no.text(deep=True, separator='', strip=strip)
+        # Como no bs4, o conteúdo de <script> e <style> não entra no texto
+        textos = (
+            no.text_content for no in self._no.traverse(include_text=True)
+            if no.tag == '-text' and no.parent.tag not in ('script', 'style')
+        )
+        if strip:
+            return ''.join(texto.strip() for texto in textos if texto.strip())
+        return ''.join(textos)
+
+def analisar_pagina(conteudo: bytes, backend: str = None):
+    """
+    Faz o parsing da página com o backend escolhido e retorna um objeto com a API de
+    consulta usada pelos extrair_* (IndicePagina para bs4, NoSelectolax para selectolax).
+    Backends indisponíveis caem para 'html.parser'.
+    """
+    backend = backend or PARSER_BACKEND
+    
+    if backend == 'selectolax' and SELECTOLAX_DISPONIVEL:
+        from selectolax.lexbor import LexborHTMLParser
+        return NoSelectolax(LexborHTMLParser(conteudo).root)
+    
+    if backend == 'lxml' and LXML_DISPONIVEL:
+        return IndicePagina(BeautifulSoup(conteudo, 'lxml', parse_only=FILTRO_PAGINA))
+    
+    if backend != 'html.parser':
+        logging.warning(f"Parser '{backend}' indisponível, usando html.parser")
+    return IndicePagina(BeautifulSoup(conteudo, 'html.parser', parse_only=FILTRO_PAGINA))
+
+def extrair_texto(soup: BeautifulSoup, selectors: list) -> str:
+    for tag, attrs in selectors:
+        elemento = soup.find(tag, attrs)
+        if elemento:
+            texto = elemento.get_text(strip=True)
+            if texto:
+                return texto
+    return "N/A"
+
+def extrair_imagem(soup: BeautifulSoup) -> str:
+    for tag, attrs in SELECTORS["imagem"]:
+        elemento = soup.find(tag, attrs)
+        if elemento:
+            for attr in ['data-old-hires', 'src']:
+                url = elemento.get(attr)
+                if url and url.startswith('http'):
+                    return url
+    return "N/A"
+
+def extrair_about_item(soup: BeautifulSoup) -> List[str]:
+    """Extrai bullets de 'About this item'"""
+    items = []
+    feature_bullets = soup.find('div', {'id': 'feature-bullets'})
+    
+    if feature_bullets:
+        ul = feature_bullets.find('ul', {'class': 'a-unordered-list'})
+        if ul:
+            for li in ul.find_all('li'):
+                span = li.find('span', {'class': 'a-list-item'})
+                if span:
+                    texto = span.get_text(strip=True)
+                    if texto and len(texto) > 10:
+                        items.append(texto)
+    
+    return items if items else ["N/A"]
+
+def extrair_technical_details(soup: BeautifulSoup) -> Dict[str, str]:
+    """Extrai todos os detalhes técnicos (Summary e Other Technical Details)"""
+    technical_info = {}
+    
+    tables = soup.find_all('table', class_='prodDetTable')
+    
+    for table in tables:
+        rows = table.find_all('tr')
+        for row in rows:
+            th = row.find('th', class_='prodDetSectionEntry')
+            td = row.find('td', class_='prodDetAttrValue')
+            
+            if th and td:
+                chave = th.get_text(strip=True)
+                valor = td.get_text(strip=True)
+                
+                if chave and valor:
+                    technical_info[chave] = valor
+    
+    return technical_info if technical_info else {"N/A": "N/A"}
+
+def extrair_product_info(soup: BeautifulSoup) -> Dict[str, str]:
+    """Extrai tabela 'Product Information' e 'Additional Information'"""
+    info = {}
+    
+    for table_id in TABELAS_PRODUCT_INFO:
+        table = soup.find('table', {'id': table_id})
+        
+        if table:
+            rows = table.find_all('tr')
+            for row in rows:
+                th = row.find('th')
+                td = row.find('td')
+                
+                if th and td:
+                    chave = th.get_text(strip=True)
+                    valor = td.get_text(strip=True)
+                    
+                    if len(valor) > 200:
+                        simple_td = td.find(text=True, recursive=False)
+                        if simple_td:
+                            valor = simple_td.strip()
+                    
+                    if chave and valor and chave != 'Customer Reviews':
+                        info[chave] = valor
+    
+    return info if info else {"N/A": "N/A"}
+
+def extrair_asin(soup: BeautifulSoup, url: str) -> str:
+    table = soup.find('table', {'id': 'productDetails_detailBullets_sections1'})
+    if table:
+        rows = table.find_all('tr')
+        for row in rows:
+            th = row.find('th')
+            if th and 'ASIN' in th.get_text():
+                td = row.find('td')
+                if td:
+                    return td.get_text(strip=True)
+    
+    return asin_da_url(url) or "N/A"
@@ -0,0 +1,735 @@
+"""Pipeline coleta -> parsing -> tradução -> conversão, síncrono, em lote e assíncrono."""
+
+from typing import List, Dict, Iterable, Iterator
+import logging
+import json
+import time
+from datetime import datetime
+import concurrent.futures
+import multiprocessing
+import asyncio
+import hashlib
+import heapq
+
+from .config import (
+    BLOQUEIO_CONFIG, LIMITES_ASYNC, PARSER_BACKEND, SELECTORS, SNAPSHOTS_CONFIG, TRADUCOES_MANUAIS, TRANSPORTE_CONFIG,
+    modulo_instalado,
+)
+from .medidas import converter_medidas, extrair_medidas, identificar_genero
+from .transporte import (
+    atraso_backoff, detectar_bloqueio, limpar_url_amazon, normalizar_entrada_produto, obter_controle_bloqueio,
+    obter_dominio_amazon, obter_headers, obter_limitador, obter_sessao, validar_url_amazon,
+)
+from .metricas import TemposProduto, com_contexto, medir, registrar_span, registrar_tempos, registro_metricas
+from .cache import CacheResultados, cache_paginas, cache_resultados, snapshots_produtos
+from .traducao import (
+    FilaTraducao, GEMINI_DISPONIVEL, MYMEMORY_URL, _params_mymemory, _prompt_gemini, _resposta_mymemory,
+    glossario, memoria_traducao, obter_modelo_gemini, roteador_traducao, traduzir_com_gemini, traduzir_texto,
+)
+from .parsing import (
+    analisar_pagina, extrair_about_item, extrair_asin, extrair_imagem, extrair_product_info,
+    extrair_technical_details, extrair_texto,
+)
+
+# httpx (motor assíncrono) só é importado quando um MotorAssincrono é aberto
+HTTPX_DISPONIVEL = modulo_instalado('httpx')
+
+def _textos_do_produto(dados: dict):
+    """
+    Gera os itens de trabalho de tradução do produto, no nível de texto: ('chave', texto) para
+    nomes de campo/especificação e ('valor', texto) para valores, bullets e specs.
+    """
+    for chave, valor in dados.items():
+        if chave not in TRADUCOES_MANUAIS:
+            yield 'chave', chave.replace('_', ' ').title()
+        
+        if isinstance(valor, str):
+            if not valor.startswith(('http', 'www', 'https')) and valor != "N/A":
+                yield 'valor', valor
+        elif isinstance(valor, list):
+            for item in valor:
+                if isinstance(item, str) and item != "N/A":
+                    yield 'valor', item
+        elif isinstance(valor, dict):
+            for sub_chave, sub_valor in valor.items():
+                if sub_chave != "N/A":
+                    yield 'chave', sub_chave
+                    yield 'valor', sub_valor
+
+def _enfileirar_textos(dados: dict, fila: FilaTraducao, usar_gemini: bool = False):
+    """Adiciona à fila os textos que traduzir_e_converter_dados mandaria para a rede"""
+    provedor = 'gemini' if usar_gemini and fila.gemini_key else 'auto'
+    for _, texto in _textos_do_produto(dados):
+        if glossario.traduzir(texto) is None:
+            fila.adicionar(texto, provedor)
+
+def traduzir_e_converter_lote(lista_dados: List[dict], usar_gemini: bool = False, gemini_key: str = None,
+                              progress_bar=None, traduzir: bool = True, converter: bool = True) -> List[dict]:
+    """
+    Traduz e converte vários produtos juntando os textos de todos numa FilaTraducao:
+    cada texto distinto é traduzido uma única vez, em pacotes multi-texto.
+    Produtos com erro são devolvidos sem alteração.
+    """
+    fila = FilaTraducao(gemini_key if usar_gemini else None)
+    if traduzir:
+        for dados in lista_dados:
+            if 'erro' not in dados:
+                _enfileirar_textos(dados, fila, usar_gemini)
+        fila.resolver()
+    
+    resultados = []
+    for idx, dados in enumerate(lista_dados, 1):
+        if 'erro' in dados:
+            resultados.append(dados)
+        else:
+            resultados.append(traduzir_e_converter_dados(dados, usar_gemini, gemini_key, fila=fila,
+                                                         traduzir=traduzir, converter=converter))
+        if progress_bar:
+            progress_bar.progress(idx / len(lista_dados))
+    return resultados
+
+def traduzir_e_converter_dados(dados: dict, usar_gemini: bool = False, gemini_key: str = None, progress_bar=None,
+                               fila: FilaTraducao = None, traduzir: bool = True, converter: bool = True) -> dict:
+    """
+    Traduz e converte medidas de todos os dados usando Threads.
+    Com `fila` (já resolvida), as traduções vêm dela antes de ir para a rede.
+    Com Gemini, todos os textos do produto vão numa única requisição JSON (ver traduzir_lote_gemini).
+    Sem `traduzir` nenhum texto vai para a rede (só os rótulos de TRADUCOES_MANUAIS mudam);
+    sem `converter` os valores ficam com as medidas originais e não há 'Medidas'.
+    """
+    return _montar_produto(_traduzir_campos(dados, usar_gemini, gemini_key, progress_bar, fila,
+                                            traduzir=traduzir, converter=converter))
+
+def _genero_do_produto(dados: dict) -> str:
+    texto_contexto = (str(dados.get('titulo_h1', '')) + ' ' + str(dados.get('about_item', ''))).lower()
+    return identificar_genero(texto_contexto)
+
+def _traduzivel(texto: str) -> bool:
+    """Mesmo filtro de traduzir_texto: o que ele devolve sem consultar nenhum provedor"""
+    return bool(texto) and texto != "N/A" and len(texto) >= 3 and not texto.startswith(('http', 'www', 'https', '$', 'R$'))
+
+def _traduzir_campos(dados: dict, usar_gemini: bool = False, gemini_key: str = None, progress_bar=None,
+                     fila: FilaTraducao = None, genero_ctx: str = None, traduzir: bool = True,
+                     converter: bool = True, campos_falhos: set = None) -> Dict[str, list]:
+    """
+    Núcleo de traduzir_e_converter_dados, campo a campo: {campo original: [chave traduzida,
+    valor processado, medidas do campo]}. `genero_ctx` vem de fora quando `dados` é só parte
+    do produto (modo incremental). Com `campos_falhos`, recebe os campos com algum texto que
+    voltou sem tradução (a mesma regra de MemoriaTraducao.salvar: tradução igual à origem).
+    """
+    if traduzir and usar_gemini and gemini_key and fila is None:
+        fila = FilaTraducao(gemini_key)
+        _enfileirar_textos(dados, fila, usar_gemini)
+        fila.resolver()
+    
+    campos = {}
+    
+    # 1. Identificar Gênero Globalmente para contexto de conversão
+    if genero_ctx is None:
+        genero_ctx = _genero_do_produto(dados)
+
+    textos_falhos = set()
+
+    def traduzir_valor(texto: str) -> str:
+        if not traduzir:
+            return texto
+        # Glossário local primeiro; só vai para a rede o que ele não resolve
+        traducao = glossario.traduzir(texto)
+        if traducao is not None:
+            return traducao
+        if usar_gemini and gemini_key:
+            traducao = fila.obter(texto, 'gemini') if fila else None
+            traducao = traducao if traducao is not None else traduzir_com_gemini(texto, gemini_key)
+        else:
+            traducao = fila.obter(texto, 'auto') if fila else None
+            traducao = traducao if traducao is not None else traduzir_texto(texto)
+        if traducao == texto and _traduzivel(texto):
+            textos_falhos.add(texto)
+        return traducao
+
+    def traduzir_chave(texto: str) -> str:
+        if not traduzir:
+            return texto
+        traducao = glossario.traduzir(texto)
+        if traducao is not None:
+            return traducao
+        traducao = fila.obter(texto, 'gemini' if usar_gemini and gemini_key else 'auto') if fila else None
+        traducao = traducao if traducao is not None else traduzir_texto(texto)
+        if traducao == texto and _traduzivel(texto):
+            textos_falhos.add(texto)
+        return traducao
+
+    def processar_valor(texto: str) -> str:
+        # Passa o contexto de genero
+        traducao = traduzir_valor(texto)
+        if not converter:
+            return traducao
+        with medir('conversao', 'converter_medidas'):
+            return converter_medidas(traducao, genero_ctx)
+
+    # 2. Execução Paralela no nível de texto: cada chave/valor (inclusive bullets e
+    # entradas de product_info/technical_details) é um item de trabalho no pool
+    trabalhos = list(dict.fromkeys(_textos_do_produto(dados)))
+    funcoes = {'chave': com_contexto(traduzir_chave), 'valor': com_contexto(processar_valor)}
+    resultados = {}
+    
+    if not traduzir:
+        # Sem rede, o pool de threads não ajuda: só conversão, em sequência
+        resultados = {(tipo, texto): funcoes[tipo](texto) for tipo, texto in trabalhos}
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            futures = {executor.submit(funcoes[tipo], texto): (tipo, texto) for tipo, texto in trabalhos}
+            
+            completed_count = 0
+            for future in concurrent.futures.as_completed(futures):
+                resultados[futures[future]] = future.result()
+                
+                completed_count += 1
+                if progress_bar:
+                    progress_bar.progress(completed_count / len(trabalhos))
+    
+    # 3. Remonta cada campo
+    for chave, valor in dados.items():
+        chave_trad = TRADUCOES_MANUAIS.get(chave) or resultados[('chave', chave.replace('_', ' ').title())]
+        
+        if isinstance(valor, str):
+            if valor.startswith(('http', 'www', 'https')) or valor == "N/A":
+                valor_processado = valor
+            else:
+                valor_processado = resultados[('valor', valor)]
+        
+        elif isinstance(valor, list):
+            valor_processado = [
+                resultados[('valor', item)] if isinstance(item, str) and item != "N/A" else item
+                for item in valor
+            ]
+        
+        elif isinstance(valor, dict):
+            valor_processado = {}
+            for sub_chave, sub_valor in valor.items():
+                if sub_chave != "N/A":
+                    valor_processado[resultados[('chave', sub_chave)]] = resultados[('valor', sub_valor)]
+                else:
+                    valor_processado[sub_chave] = sub_valor
+        
+        else:
+            valor_processado = valor
+        
+        # 4. Medidas numéricas das especificações, extraídas do texto original (em inglês)
+        medidas = {}
+        if converter and isinstance(valor, dict):
+            with medir('conversao', 'extrair_medidas'):
+                for sub_chave, sub_valor in valor.items():
+                    medidas_campo = extrair_medidas(sub_valor) if sub_chave != "N/A" else []
+                    if medidas_campo:
+                        medidas[resultados[('chave', sub_chave)]] = medidas_campo
+        
+        campos[chave] = [chave_trad, valor_processado, medidas]
+        
+        if campos_falhos is not None and any(texto in textos_falhos for _, texto in _textos_do_produto({chave: valor})):
+            campos_falhos.add(chave)
+    
+    return campos
+
+def _montar_produto(campos: Dict[str, list]) -> dict:
+    """Produto traduzido a partir dos campos de _traduzir_campos, na ordem original"""
+    dados_traduzidos = {}
+    medidas = {}
+    for chave_trad, valor_processado, medidas_campo in campos.values():
+        dados_traduzidos[chave_trad] = valor_processado
+        medidas.update(medidas_campo)
+    
+    if medidas:
+        dados_traduzidos['Medidas'] = medidas
+    return dados_traduzidos
+
+def _hash_campo(valor) -> str:
+    serializado = json.dumps(valor, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(serializado.encode('utf-8')).hexdigest()
+
+def traduzir_e_converter_incremental(lista_dados: List[dict], usar_gemini: bool = False, gemini_key: str = None,
+                                     progress_bar=None, traduzir: bool = True, converter: bool = True) -> List[dict]:
+    """
+    Modo de atualização de traduzir_e_converter_lote, para catálogos recoletados com frequência:
+    compara o hash de cada campo extraído com o último snapshot do produto (snapshots_produtos)
+    e só traduz/converte os campos que mudaram (em geral preço, disponibilidade, avaliações);
+    os demais vêm do registro traduzido guardado. Campos cuja tradução falhou (texto devolvido
+    sem tradução) não entram no snapshot e são traduzidos de novo na próxima vez. Os metadados (asin, URL, data da coleta) não
+    entram no hash nem na tradução: vão direto para a saída com o rótulo de TRADUCOES_MANUAIS.
+    Outro método de tradução, outro contexto de gênero ou outras opções de tradução/conversão
+    invalidam o snapshot inteiro. Produtos com erro são devolvidos sem alteração.
+    """
+    metadados = SNAPSHOTS_CONFIG['metadados']
+    metodo = ('gemini' if usar_gemini and gemini_key else 'auto') if traduzir else 'sem_traducao'
+    fila = FilaTraducao(gemini_key if usar_gemini else None)
+    pendentes = []
+    for dados in lista_dados:
+        if 'erro' in dados:
+            pendentes.append(None)
+            continue
+        genero = _genero_do_produto(dados)
+        conteudo = {campo: valor for campo, valor in dados.items() if campo not in metadados}
+        hashes = {campo: _hash_campo(valor) for campo, valor in conteudo.items()}
+        anterior = snapshots_produtos.obter(dados['url_produto'])
+        if (anterior and anterior.get('metodo') == metodo and anterior.get('genero') == genero
+                and anterior.get('converter', True) == converter):
+            mudados = {
+                campo: valor for campo, valor in conteudo.items()
+                if anterior['hashes'].get(campo) != hashes[campo] or campo not in anterior['campos']
+            }
+        else:
+            anterior, mudados = None, conteudo
+        if traduzir:
+            _enfileirar_textos(mudados, fila, usar_gemini)
+        pendentes.append((genero, hashes, anterior, mudados))
+    fila.resolver()
+    
+    resultados = []
+    for idx, (dados, pendente) in enumerate(zip(lista_dados, pendentes), 1):
+        if pendente is None:
+            resultados.append(dados)
+        else:
+            genero, hashes, anterior, mudados = pendente
+            falhos = set()
+            novos = _traduzir_campos(mudados, usar_gemini, gemini_key, fila=fila, genero_ctx=genero,
+                                     traduzir=traduzir, converter=converter, campos_falhos=falhos) if mudados else {}
+            campos = {campo: novos[campo] if campo in novos else anterior['campos'][campo] for campo in hashes}
+            # Campo com tradução que falhou fica fora do snapshot: volta para a fila na próxima coleta
+            snapshots_produtos.salvar(dados['url_produto'], {
+                'metodo': metodo, 'genero': genero, 'converter': converter,
+                'hashes': {campo: h for campo, h in hashes.items() if campo not in falhos},
+                'campos': {campo: c for campo, c in campos.items() if campo not in falhos},
+            })
+            registro_metricas.incrementar('campos_incrementais_total', (('resultado', 'traduzido'),), len(novos))
+            registro_metricas.incrementar('campos_incrementais_total', (('resultado', 'reaproveitado'),),
+                                          len(hashes) - len(novos))
+            saida = {
+                campo: campos[campo] if campo in campos else [TRADUCOES_MANUAIS.get(campo, campo), dados[campo], {}]
+                for campo in dados
+            }
+            resultados.append(_montar_produto(saida))
+        if progress_bar:
+            progress_bar.progress(idx / len(lista_dados))
+    return resultados
+
+def coletar_dados_produto(url: str, usar_cache: bool = True) -> dict:
+    if not validar_url_amazon(url):
+        return {"erro": "URL não é da Amazon válida"}
+    
+    url_limpa = limpar_url_amazon(url)
+    
+    if usar_cache:
+        dados = _dados_do_cache(url_limpa)
+        if dados is not None:
+            return dados
+    
+    # Respeita as coletas simultâneas permitidas e o limite de requisições do domínio
+    controle = obter_controle_bloqueio(url_limpa)
+    with medir('espera_taxa'):
+        controle.adquirir()
+        obter_limitador(url_limpa).adquirir()
+    
+    try:
+        # Sessão compartilhada: reaproveita conexões TCP/TLS entre produtos
+        with medir('coleta', 'rede'):
+            response = obter_sessao(url_limpa, 'paginas').get(url_limpa, headers=obter_headers(), timeout=20)
+        bloqueio = _verificar_bloqueio(url_limpa, response.content, response.status_code, controle)
+        if bloqueio:
+            return bloqueio
+        response.raise_for_status()
+        return _extrair_e_guardar(url_limpa, response.content)
+        
+    except Exception as e:
+        return {"erro": f"Erro: {str(e)}"}
+    finally:
+        controle.liberar()
+
+# Etapas de coletar_dados_produto compartilhadas com MotorAssincrono.coletar (que roda no
+# executor as que fazem parsing ou IO de disco)
+
+def _dados_do_cache(url_limpa: str) -> dict:
+    """Produto extraído da página em cache_paginas, ou None se ela não estiver lá"""
+    with medir('coleta', 'cache'):
+        em_cache = cache_paginas.obter(url_limpa)
+    if not em_cache:
+        return None
+    conteudo, data_coleta = em_cache
+    return extrair_dados_pagina(conteudo, url_limpa, data_coleta)
+
+def _verificar_bloqueio(url_limpa: str, conteudo: bytes, status: int, controle) -> dict:
+    """
+    Bloqueio/captcha reconhecido nos bytes brutos, antes de qualquer parsing: informa o controle
+    do domínio e, se bloqueada, retorna o erro da página (senão None)
+    """
+    motivo = detectar_bloqueio(conteudo, status)
+    controle.registrar(motivo is not None)
+    return _pagina_bloqueada(url_limpa, motivo) if motivo else None
+
+def _extrair_e_guardar(url_limpa: str, conteudo: bytes) -> dict:
+    dados = extrair_dados_pagina(conteudo, url_limpa)
+    if 'erro' not in dados:
+        cache_paginas.salvar(url_limpa, conteudo)
+    return dados
+
+def _pagina_bloqueada(url_limpa: str, motivo: str) -> dict:
+    registro_metricas.incrementar('bloqueios_total', (('dominio', obter_dominio_amazon(url_limpa)), ('motivo', motivo)))
+    return {"erro": "Amazon bloqueou a requisição. Use VPN ou aguarde alguns minutos.", "bloqueio": motivo}
+
+def processar_produto(url: str, traduzir: bool = True, converter: bool = True, usar_gemini: bool = False,
+                      gemini_key: str = None, usar_cache: bool = True, progress_bar=None,
+                      tempos: TemposProduto = None):
+    """
+    Pipeline completo de um produto (coleta + tradução/conversão) passando pelo cache_resultados.
+    Retorna (dados, data_cache): `data_cache` é quando o resultado foi guardado, se veio do
+    cache, ou None se foi processado agora. Erros não são guardados.
+    Com `tempos`, os spans de cada etapa deste produto são guardados nele (ver metricas).
+    """
+    with registrar_tempos(tempos):
+        metodo = 'gemini' if usar_gemini and gemini_key else 'auto'
+        chave = CacheResultados.chave(url, metodo, traduzir, converter)
+        if usar_cache:
+            with medir('cache_resultados'):
+                em_cache = cache_resultados.obter(chave)
+            if em_cache:
+                return em_cache
+        
+        dados = coletar_dados_produto(url, usar_cache=usar_cache)
+        if 'erro' in dados:
+            return dados, None
+        if traduzir or converter:
+            with medir('traducao_conversao'):
+                dados = traduzir_e_converter_dados(dados, usar_gemini, gemini_key, progress_bar,
+                                                   traduzir=traduzir, converter=converter)
+        cache_resultados.salvar(chave, dados)
+        return dados, None
+
+def extrair_dados_pagina(conteudo: bytes, url_limpa: str, data_coleta: datetime = None,
+                         backend: str = None) -> dict:
+    """
+    Extrai os campos do produto de uma página já baixada (e já verificada com detectar_bloqueio).
+    O parsing usa o `backend` escolhido (padrão: PARSER_BACKEND); ver `analisar_pagina`.
+    """
+    with medir('parsing', backend or PARSER_BACKEND):
+        soup = analisar_pagina(conteudo, backend)
+    
+    def extrair(funcao, campo: str, *args):
+        with medir(funcao.__name__, campo):
+            return funcao(soup, *args)
+    
+    data_coleta = data_coleta or datetime.now()
+    dados = {
+        "titulo_h1": extrair(extrair_texto, 'titulo', SELECTORS["titulo"]),
+        "url_imagem": extrair(extrair_imagem, 'imagem'),
+        "preco": extrair(extrair_texto, 'preco', SELECTORS["preco"]),
+        "avaliacao": extrair(extrair_texto, 'avaliacao', SELECTORS["avaliacao"]),
+        "num_avaliacoes": extrair(extrair_texto, 'num_avaliacoes', SELECTORS["num_avaliacoes"]),
+        "disponibilidade": extrair(extrair_texto, 'disponibilidade', SELECTORS["disponibilidade"]),
+        "marca": extrair(extrair_texto, 'marca', SELECTORS["marca"]),
+        "about_item": extrair(extrair_about_item, 'about_item'),
+        "product_info": extrair(extrair_product_info, 'product_info'),
+        "technical_details": extrair(extrair_technical_details, 'technical_details'),
+        "asin": extrair(extrair_asin, 'asin', url_limpa),
+        "url_produto": url_limpa,
+        "data_coleta": data_coleta.strftime("%Y-%m-%d %H:%M:%S")
+    }
+    
+    return dados
+
+def _reprocessar_pagina(base: str) -> tuple:
+    """(dados, spans) de uma página do cache; roda num processo filho, que devolve os spans ao pai"""
+    tempos = TemposProduto()
+    with registrar_tempos(tempos):
+        try:
+            conteudo, url, data_coleta = cache_paginas.ler(base)
+        except (OSError, EOFError, ValueError, KeyError) as e:
+            return {"erro": f"Erro: {str(e)}"}, tempos.spans
+        
+        return extrair_dados_pagina(conteudo, url, data_coleta), tempos.spans
+
+def reprocessar_cache(max_workers: int = None) -> List[dict]:
+    """
+    Roda a extração sobre todas as páginas do cache (inclusive expiradas), sem nenhuma requisição.
+    Útil após mudar SELECTORS ou as funções extrair_*: reconstrói o catálogo em segundos.
+    Os processos filhos são criados com 'spawn' (sem herdar threads e travas do pai) e os
+    spans de parsing/extrair_* de cada página voltam para o registro_metricas deste processo.
+    """
+    bases = cache_paginas.listar()
+    if not bases:
+        return []
+    
+    resultados = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers,
+                                                mp_context=multiprocessing.get_context('spawn')) as executor:
+        for dados, spans in executor.map(_reprocessar_pagina, bases, chunksize=16):
+            for etapa, detalhe, inicio, duracao, erro in spans:
+                registrar_span(etapa, detalhe, inicio, duracao, erro)
+            resultados.append(dados)
+    return resultados
+
+def coletar_dados_produtos(entradas: List[str], max_workers: int = 4, dominio_padrao: str = 'amazon.com',
+                           usar_async: bool = False, usar_cache: bool = True) -> List[dict]:
+    """
+    Coleta vários produtos (URLs ou ASINs) em paralelo.
+    A concorrência é limitada por `max_workers` e pelo controle de bloqueio de cada domínio;
+    o ritmo, pelos limitadores de taxa. URLs bloqueadas voltam para a fila (ver _coletar_reagendando).
+    Com `usar_async` (requer httpx) a coleta roda no MotorAssincrono, numa única thread.
+    Retorna os resultados na mesma ordem das entradas.
+    """
+    urls = [normalizar_entrada_produto(e, dominio_padrao) for e in entradas if e and e.strip()]
+    if not urls:
+        return []
+    
+    if usar_async and HTTPX_DISPONIVEL:
+        async def _executar():
+            async with MotorAssincrono(limite_coleta=max_workers) as motor:
+                return await motor.coletar_varios(urls, usar_cache)
+        return asyncio.run(_executar())
+    
+    return _coletar_reagendando(urls, max_workers, usar_cache)
+
+def _coletar_reagendando(urls: List[str], max_workers: int, usar_cache: bool = True) -> List[dict]:
+    """
+    Coleta com fila de reagendamento: uma URL bloqueada volta para a fila e só é tentada de novo
+    depois de atraso_backoff(tentativa), até BLOQUEIO_CONFIG['tentativas'] vezes. Enquanto isso
+    as threads seguem com as outras URLs.
+    """
+    resultados = [None] * len(urls)
+    fila = [(0.0, indice, 0) for indice in range(len(urls))]
+    em_andamento = {}
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while fila or em_andamento:
+            agora = time.monotonic()
+            while fila and fila[0][0] <= agora and len(em_andamento) < max_workers:
+                _, indice, tentativa = heapq.heappop(fila)
+                futuro = executor.submit(com_contexto(coletar_dados_produto), urls[indice], usar_cache)
+                em_andamento[futuro] = (indice, tentativa)
+            
+            espera = max(0.0, fila[0][0] - agora) if fila and len(em_andamento) < max_workers else None
+            if not em_andamento:
+                time.sleep(espera)
+                continue
+            
+            prontos, _ = concurrent.futures.wait(em_andamento, timeout=espera,
+                                                 return_when=concurrent.futures.FIRST_COMPLETED)
+            for futuro in prontos:
+                indice, tentativa = em_andamento.pop(futuro)
+                dados = futuro.result()
+                if 'bloqueio' in dados and tentativa < BLOQUEIO_CONFIG['tentativas']:
+                    registro_metricas.incrementar('reagendamentos_total')
+                    heapq.heappush(fila, (time.monotonic() + atraso_backoff(tentativa), indice, tentativa + 1))
+                else:
+                    resultados[indice] = dados
+    return resultados
+
+def _em_lotes(itens: Iterable, tamanho: int) -> Iterator[list]:
+    lote = []
+    for item in itens:
+        lote.append(item)
+        if len(lote) >= tamanho:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+def processar_produtos(entradas: Iterable[str], traduzir: bool = True, converter: bool = True,
+                       usar_gemini: bool = False, gemini_key: str = None, max_workers: int = 4,
+                       tamanho_lote: int = 50, dominio_padrao: str = 'amazon.com', usar_async: bool = False,
+                       usar_cache: bool = True, incremental: bool = False) -> Iterator[dict]:
+    """
+    Pipeline em lote para muitos produtos: gera os resultados (na ordem das entradas) à medida
+    que cada lote de `tamanho_lote` fica pronto. Cada lote é coletado em paralelo e traduzido
+    com traduzir_e_converter_lote (textos repetidos entre produtos são traduzidos uma vez).
+    Só um lote fica em memória, então a entrada pode ser um gerador de tamanho qualquer.
+    Com `incremental`, só os campos que mudaram desde o último snapshot são traduzidos
+    (ver traduzir_e_converter_incremental).
+    """
+    entradas = (e.strip() for e in entradas if e and e.strip())
+    for lote in _em_lotes(entradas, tamanho_lote):
+        dados_lote = coletar_dados_produtos(lote, max_workers, dominio_padrao, usar_async, usar_cache)
+        yield from _traduzir_lote(dados_lote, traduzir, converter, usar_gemini, gemini_key, incremental)
+
+def reprocessar_produtos(traduzir: bool = True, converter: bool = True, usar_gemini: bool = False,
+                         gemini_key: str = None, tamanho_lote: int = 50, incremental: bool = False,
+                         max_workers: int = None) -> Iterator[dict]:
+    """
+    `processar_produtos` sobre todas as páginas de cache_paginas (reprocessar_cache), sem
+    nenhuma requisição de coleta: refaz o catálogo depois de mudar SELECTORS ou os extrair_*.
+    """
+    for lote in _em_lotes(reprocessar_cache(max_workers), tamanho_lote):
+        yield from _traduzir_lote(lote, traduzir, converter, usar_gemini, gemini_key, incremental)
+
+def _traduzir_lote(dados_lote: List[dict], traduzir: bool, converter: bool, usar_gemini: bool, gemini_key: str,
+                   incremental: bool) -> List[dict]:
+    if not (traduzir or converter):
+        return dados_lote
+    traduzir_lote = traduzir_e_converter_incremental if incremental else traduzir_e_converter_lote
+    with medir('traducao_conversao', 'incremental' if incremental else 'lote'):
+        return traduzir_lote(dados_lote, usar_gemini, gemini_key, traduzir=traduzir, converter=converter)
+
+def traduzir_textos(textos: List[str], gemini_key: str = None) -> List[str]:
+    """Traduz vários textos concorrentemente (motor assíncrono se httpx estiver disponível)"""
+    if not HTTPX_DISPONIVEL:
+        traduzir = (lambda t: traduzir_com_gemini(t, gemini_key)) if gemini_key else traduzir_texto
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            return list(executor.map(traduzir, textos))
+    
+    async def _executar():
+        async with MotorAssincrono() as motor:
+            return await motor.traduzir_varios(textos, gemini_key)
+    return asyncio.run(_executar())
+
+class MotorAssincrono:
+    """
+    Coleta e tradução com asyncio + httpx: centenas de requisições em andamento numa única thread.
+    Semáforos limitam a concorrência de coletas e traduções; os limitadores de taxa por domínio
+    continuam valendo. Uso: `async with MotorAssincrono() as motor: ...`
+    """
+
+    def __init__(self, limite_coleta: int = None, limite_traducao: int = None):
+        if not HTTPX_DISPONIVEL:
+            raise RuntimeError("Motor assíncrono indisponível. Instale: pip install httpx")
+        self._sem_coleta = asyncio.Semaphore(limite_coleta or LIMITES_ASYNC['coleta'])
+        self._sem_traducao = asyncio.Semaphore(limite_traducao or LIMITES_ASYNC['traducao'])
+        self._cliente = None
+
+    async def __aenter__(self):
+        import httpx
+        self._cliente = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=TRANSPORTE_CONFIG['pool_maxsize'] * TRANSPORTE_CONFIG['pool_connections'],
+                max_keepalive_connections=TRANSPORTE_CONFIG['pool_maxsize'],
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=TRANSPORTE_CONFIG['tentativas']),
+            follow_redirects=True,
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._cliente.aclose()
+
+    async def coletar(self, url: str, usar_cache: bool = True) -> dict:
+        """Equivalente assíncrono de `coletar_dados_produto`; parsing e cache em disco rodam no executor"""
+        if not validar_url_amazon(url):
+            return {"erro": "URL não é da Amazon válida"}
+        
+        url_limpa = limpar_url_amazon(url)
+        loop = asyncio.get_running_loop()
+        
+        if usar_cache:
+            dados = await loop.run_in_executor(None, com_contexto(_dados_do_cache), url_limpa)
+            if dados is not None:
+                return dados
+        
+        controle = obter_controle_bloqueio(url_limpa)
+        async with self._sem_coleta:
+            with medir('espera_taxa'):
+                await controle.adquirir_async()
+                await obter_limitador(url_limpa).adquirir_async()
+            try:
+                with medir('coleta', 'rede'):
+                    response = await self._cliente.get(url_limpa, headers=obter_headers(), timeout=20)
+                bloqueio = _verificar_bloqueio(url_limpa, response.content, response.status_code, controle)
+                if bloqueio:
+                    return bloqueio
+                response.raise_for_status()
+                return await loop.run_in_executor(None, com_contexto(_extrair_e_guardar), url_limpa, response.content)
+            except Exception as e:
+                return {"erro": f"Erro: {str(e)}"}
+            finally:
+                controle.liberar()
+
+    async def coletar_reagendando(self, url: str, usar_cache: bool = True) -> dict:
+        """`coletar`, com novas tentativas após backoff exponencial se a página vier bloqueada"""
+        for tentativa in range(BLOQUEIO_CONFIG['tentativas'] + 1):
+            dados = await self.coletar(url, usar_cache)
+            if 'bloqueio' not in dados or tentativa == BLOQUEIO_CONFIG['tentativas']:
+                return dados
+            registro_metricas.incrementar('reagendamentos_total')
+            await asyncio.sleep(atraso_backoff(tentativa))
+
+    async def coletar_varios(self, urls: List[str], usar_cache: bool = True) -> List[dict]:
+        return await asyncio.gather(*(self.coletar_reagendando(url, usar_cache) for url in urls))
+
+    async def traduzir_mymemory(self, texto: str) -> str:
+        """Equivalente assíncrono de `traduzir_com_mymemory`"""
+        if not texto or texto == "N/A" or len(texto) < 3:
+            return texto
+        
+        if texto.startswith(('http', 'www', 'https', '$', 'R$')):
+            return texto
+        
+        # Mesma reserva de RoteadorTraducao.chamar: com o circuito meio-aberto, só uma corrotina testa
+        if not roteador_traducao.reservar('mymemory'):
+            return texto
+        
+        try:
+            async with self._sem_traducao:
+                # A espera pelo semáforo não conta como latência do provedor
+                inicio = time.monotonic()
+                try:
+                    with medir('provedor', 'mymemory'):
+                        response = await self._cliente.get(MYMEMORY_URL, params=_params_mymemory(texto), timeout=5)
+                        traducao = _resposta_mymemory(response.status_code, response.json() if response.status_code == 200 else {})
+                except Exception as e:
+                    roteador_traducao.registrar('mymemory', time.monotonic() - inicio, False)
+                    logging.warning(f"MyMemory falhou: {e}")
+                    return texto
+                roteador_traducao.registrar('mymemory', time.monotonic() - inicio, True)
+                return traducao
+        finally:
+            # Cancelada antes de registrar, a chamada de teste do circuito meio-aberto não fica presa
+            roteador_traducao.liberar('mymemory')
+
+    async def traduzir(self, texto: str) -> str:
+        """Equivalente assíncrono de `traduzir_texto`; os fallbacks síncronos rodam no executor"""
+        if not texto or texto == "N/A" or len(texto) < 3:
+            return texto
+        
+        if texto.startswith(('http', 'www', 'https', '$', 'R$')):
+            return texto
+        
+        em_memoria = memoria_traducao.obter(texto, 'auto')
+        if em_memoria is not None:
+            return em_memoria
+        
+        resultado = await self.traduzir_mymemory(texto)
+        if resultado == texto:
+            async with self._sem_traducao:
+                loop = asyncio.get_running_loop()
+                resultado = await loop.run_in_executor(None, roteador_traducao.traduzir, texto, ('mymemory',))
+        
+        memoria_traducao.salvar(texto, resultado, 'auto')
+        return resultado
+
+    async def traduzir_gemini(self, texto: str, gemini_key: str = None) -> str:
+        """Equivalente assíncrono de `traduzir_com_gemini`"""
+        if not GEMINI_DISPONIVEL or not gemini_key:
+            return await self.traduzir(texto)
+        
+        if not texto or texto == "N/A":
+            return texto
+        
+        if texto.startswith(('http', 'www', 'https', '$', 'R$')):
+            return texto
+        
+        em_memoria = memoria_traducao.obter(texto, 'gemini')
+        if em_memoria is not None:
+            return em_memoria
+        
+        try:
+            async with self._sem_traducao:
+                with medir('provedor', 'gemini'):
+                    response = await obter_modelo_gemini(gemini_key).generate_content_async(_prompt_gemini(texto))
+            traducao = response.text.strip()
+            memoria_traducao.salvar(texto, traducao, 'gemini')
+            return traducao
+        except Exception as e:
+            logging.warning(f"Gemini falhou: {e}")
+        
+        return await self.traduzir(texto)
+
+    async def traduzir_varios(self, textos: List[str], gemini_key: str = None) -> List[str]:
+        if gemini_key:
+            return await asyncio.gather(*(self.traduzir_gemini(t, gemini_key) for t in textos))
+        return await asyncio.gather(*(self.traduzir(t) for t in textos))
@@ -0,0 +1,680 @@
+"""Tradução: glossário, memória de tradução, provedores, roteador com circuit breaker e fila em lote."""
+
+from typing import List, Dict
+import logging
+import json
+import time
+import concurrent.futures
+import threading
+import os
+import sqlite3
+from collections import OrderedDict
+
+from .config import GEMINI_CONFIG, GLOSSARIO_PT, MEMORIA_TRADUCAO_CONFIG, ROTEADOR_CONFIG, modulo_instalado
+from .transporte import obter_sessao
+from .metricas import com_contexto, medir
+
+# Provedores opcionais: aqui só se verifica se estão instalados; cada um é importado no
+# primeiro uso (google.generativeai sozinho leva perto de 1 s para importar)
+TRADUTOR_DISPONIVEL = modulo_instalado('deep_translator')
+LIBRE_DISPONIVEL = modulo_instalado('translate')
+GEMINI_DISPONIVEL = modulo_instalado('google.generativeai')
+
+class Glossario:
+    """
+    Índice de traduções fixas consultado antes das APIs. Busca exata primeiro; depois pela
+    forma normalizada (caixa, espaços, marcas de direção \u200e/\u200f e ':' final).
+    Extensível via `adicionar` ou um JSON em GLOSSARIO_ARQUIVO.
+    """
+
+    def __init__(self, entradas: Dict[str, str] = None):
+        self._exato = {}
+        self._normalizado = {}
+        self.adicionar(entradas or {})
+
+    @staticmethod
+    def normalizar(texto: str) -> str:
+        texto = texto.replace('\u200e', '').replace('\u200f', '')
+        return ' '.join(texto.split()).rstrip(':').casefold()
+
+    def adicionar(self, entradas: Dict[str, str]):
+        for origem, traducao in entradas.items():
+            self._exato[origem] = traducao
+            self._normalizado[self.normalizar(origem)] = traducao
+
+    def carregar_arquivo(self, caminho: str):
+        try:
+            with open(caminho, encoding='utf-8') as f:
+                self.adicionar(json.load(f))
+        except (OSError, ValueError) as e:
+            logging.warning(f"Glossário {caminho} não carregado: {e}")
+
+    def traduzir(self, texto: str):
+        """Tradução do glossário ou None"""
+        traducao = self._exato.get(texto)
+        if traducao is None:
+            traducao = self._normalizado.get(self.normalizar(texto))
+        return traducao
+
+glossario = Glossario(GLOSSARIO_PT)
+if os.getenv('GLOSSARIO_ARQUIVO'):
+    glossario.carregar_arquivo(os.getenv('GLOSSARIO_ARQUIVO'))
+
+class MemoriaTraducao:
+    """
+    Memória de tradução compartilhada entre execuções, chaveada por (provedor, idioma, texto
+    normalizado). Um LRU em memória atende os textos quentes; o SQLite guarda o resto.
+    Quando o banco passa de `max_entradas`, as entradas usadas há mais tempo são removidas.
+    Só traduções efetivas (diferentes do original) são guardadas, para não persistir falhas.
+    """
+
+    def __init__(self, arquivo: str, tamanho_lru: int = 5000, max_entradas: int = 200000):
+        self.arquivo = arquivo
+        self.tamanho_lru = tamanho_lru
+        self.max_entradas = max_entradas
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._conexao = None
+        self._insercoes = 0
+        self.acertos_lru = 0
+        self.acertos_disco = 0
+        self.falhas = 0
+
+    @staticmethod
+    def normalizar(texto: str) -> str:
+        return ' '.join(texto.split())
+
+    def _db(self):
+        """Abre o banco na primeira consulta; em caso de erro segue só com o LRU"""
+        if self._conexao is None and self.arquivo:
+            try:
+                self._conexao = sqlite3.connect(self.arquivo, check_same_thread=False)
+                self._conexao.execute('PRAGMA journal_mode=WAL')
+                self._conexao.execute(
+                    'CREATE TABLE IF NOT EXISTS traducoes ('
+                    'provedor TEXT, idioma TEXT, origem TEXT, traducao TEXT, ultimo_uso REAL, '
+                    'PRIMARY KEY (provedor, idioma, origem))'
+                )
+                self._conexao.execute('CREATE INDEX IF NOT EXISTS idx_ultimo_uso ON traducoes (ultimo_uso)')
+            except sqlite3.Error as e:
+                logging.warning(f"Memória de tradução sem persistência: {e}")
+                self.arquivo = None
+                self._conexao = None
+        return self._conexao
+
+    def _guardar_lru(self, chave: tuple, traducao: str):
+        self._lru[chave] = traducao
+        self._lru.move_to_end(chave)
+        if len(self._lru) > self.tamanho_lru:
+            self._lru.popitem(last=False)
+
+    def obter(self, texto: str, provedor: str, idioma: str = 'pt-br'):
+        """Tradução guardada ou None"""
+        chave = (provedor, idioma, self.normalizar(texto))
+        with self._lock:
+            if chave in self._lru:
+                self._lru.move_to_end(chave)
+                self.acertos_lru += 1
+                return self._lru[chave]
+            
+            db = self._db()
+            linha = None
+            if db is not None:
+                try:
+                    linha = db.execute(
+                        'SELECT traducao FROM traducoes WHERE provedor = ? AND idioma = ? AND origem = ?', chave
+                    ).fetchone()
+                    if linha:
+                        db.execute(
+                            'UPDATE traducoes SET ultimo_uso = ? WHERE provedor = ? AND idioma = ? AND origem = ?',
+                            (time.time(), *chave)
+                        )
+                        db.commit()
+                except sqlite3.Error as e:
+                    logging.warning(f"Memória de tradução falhou: {e}")
+            
+            if linha:
+                self.acertos_disco += 1
+                self._guardar_lru(chave, linha[0])
+                return linha[0]
+            
+            self.falhas += 1
+            return None
+
+    def salvar(self, texto: str, traducao: str, provedor: str, idioma: str = 'pt-br'):
+        if not traducao or traducao == texto:
+            return
+        chave = (provedor, idioma, self.normalizar(texto))
+        with self._lock:
+            self._guardar_lru(chave, traducao)
+            db = self._db()
+            if db is None:
+                return
+            try:
+                db.execute(
+                    'INSERT OR REPLACE INTO traducoes (provedor, idioma, origem, traducao, ultimo_uso) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (*chave, traducao, time.time())
+                )
+                self._insercoes += 1
+                if self._insercoes % 1000 == 0:
+                    self._evictar(db)
+                db.commit()
+            except sqlite3.Error as e:
+                logging.warning(f"Memória de tradução falhou: {e}")
+
+    def _evictar(self, db):
+        excesso = db.execute('SELECT COUNT(*) FROM traducoes').fetchone()[0] - self.max_entradas
+        if excesso > 0:
+            db.execute(
+                'DELETE FROM traducoes WHERE rowid IN '
+                '(SELECT rowid FROM traducoes ORDER BY ultimo_uso LIMIT ?)', (excesso,)
+            )
+
+    def limpar(self):
+        """Esvazia a LRU e, se houver arquivo, a tabela de traduções"""
+        with self._lock:
+            self._lru.clear()
+            db = self._db()
+            if db is not None:
+                db.execute('DELETE FROM traducoes')
+                db.commit()
+
+    def estatisticas(self) -> dict:
+        consultas = self.acertos_lru + self.acertos_disco + self.falhas
+        return {
+            'acertos_lru': self.acertos_lru,
+            'acertos_disco': self.acertos_disco,
+            'falhas': self.falhas,
+            'taxa_acerto': ((self.acertos_lru + self.acertos_disco) / consultas) if consultas else 0.0,
+            'entradas_lru': len(self._lru),
+        }
+
+memoria_traducao = MemoriaTraducao(
+    MEMORIA_TRADUCAO_CONFIG['arquivo'],
+    MEMORIA_TRADUCAO_CONFIG['tamanho_lru'],
+    MEMORIA_TRADUCAO_CONFIG['max_entradas'],
+)
+
+MYMEMORY_URL = os.getenv('MYMEMORY_URL', "https://api.mymemory.translated.net/get")
+
+def _params_mymemory(texto: str) -> dict:
+    return {
+        'q': texto[:500],  # Limita para não exceder
+        'langpair': 'en|pt-br'
+    }
+
+def traduzir_com_mymemory(texto: str) -> str:
+    """Traduz usando MyMemory API (gratuita, sem necessidade de chave)"""
+    if not texto or texto == "N/A" or len(texto) < 3:
+        return texto
+    
+    if texto.startswith(('http', 'www', 'https', '$', 'R$')):
+        return texto
+    
+    try:
+        return _mymemory_bruto(texto)
+    except Exception as e:
+        logging.warning(f"MyMemory falhou: {e}")
+    
+    return texto
+
+def _resposta_mymemory(status_code: int, data: dict) -> str:
+    if status_code != 200:
+        raise RuntimeError(f"HTTP {status_code}")
+    if data.get('responseStatus') != 200:
+        # Ex: 429 quando a cota diária acaba
+        raise RuntimeError(f"responseStatus {data.get('responseStatus')}: {data.get('responseDetails')}")
+    return data['responseData']['translatedText']
+
+def _mymemory_bruto(texto: str) -> str:
+    """Chamada ao MyMemory que levanta exceção em qualquer falha (usada pelo roteador)"""
+    # MyMemory API - gratuita, 1000 palavras/dia sem chave
+    response = obter_sessao(MYMEMORY_URL, 'traducao').get(MYMEMORY_URL, params=_params_mymemory(texto), timeout=5)
+    return _resposta_mymemory(response.status_code, response.json() if response.status_code == 200 else {})
+
+def traduzir_com_libre(texto: str) -> str:
+    """Traduz usando translate library (fallback)"""
+    if not LIBRE_DISPONIVEL or not texto or texto == "N/A":
+        return texto
+    
+    if texto.startswith(('http', 'www', 'https', '$', 'R$')):
+        return texto
+    
+    try:
+        return _libre_bruto(texto)
+    except Exception as e:
+        logging.warning(f"Libre Translate falhou: {e}")
+        return texto
+
+def _libre_bruto(texto: str) -> str:
+    from translate import Translator as LibreTranslator
+    translator = LibreTranslator(from_lang="en", to_lang="pt")
+    return translator.translate(texto[:500])
+
+def _google_bruto(texto: str) -> str:
+    from deep_translator import GoogleTranslator
+    translator = GoogleTranslator(source='en', target='pt')
+    if len(texto) > 4500:
+        partes = []
+        palavras = texto.split('. ')
+        parte_atual = ""
+        
+        for frase in palavras:
+            if len(parte_atual) + len(frase) < 4000:
+                parte_atual += frase + ". "
+            else:
+                partes.append(translator.translate(parte_atual.strip()))
+                parte_atual = frase + ". "
+        
+        if parte_atual:
+            partes.append(translator.translate(parte_atual.strip()))
+        
+        return ' '.join(partes)
+    return translator.translate(texto)
+
+_modelos_gemini = {}
+_modelos_gemini_lock = threading.Lock()
+# genai.configure vale para o processo inteiro: um único GenerativeModel, da chave configurada por último
+_modelo_gemini = {'chave': None, 'modelo': None}
+
+def obter_modelo_gemini(gemini_key: str):
+    """
+    Modelo Gemini reaproveitado pelo processo. Como genai.configure é global, só uma chave
+    vale por vez: trocar de chave reconfigura o processo e a anterior deixa de ser usada.
+    Modelos de `registrar_modelo_gemini` trazem o próprio cliente e continuam por chave.
+    """
+    with _modelos_gemini_lock:
+        if gemini_key in _modelos_gemini:
+            return _modelos_gemini[gemini_key]
+        if _modelo_gemini['chave'] != gemini_key:
+            import google.generativeai as genai
+            if _modelo_gemini['chave'] is not None:
+                logging.warning("Chave Gemini trocada: o processo passa a usar só a nova chave")
+            genai.configure(api_key=gemini_key)
+            _modelo_gemini['chave'] = gemini_key
+            _modelo_gemini['modelo'] = genai.GenerativeModel(GEMINI_CONFIG['modelo'])
+        return _modelo_gemini['modelo']
+
+def registrar_modelo_gemini(gemini_key: str, modelo):
+    """
+    Usa `modelo` (qualquer objeto com generate_content/generate_content_async e cliente
+    próprio) para a chave, no lugar do GenerativeModel global: clientes por chave, proxies
+    ou dublês de benchmark
+    """
+    with _modelos_gemini_lock:
+        _modelos_gemini[gemini_key] = modelo
+
+def _prompt_gemini_json(entrada: Dict[str, str]) -> str:
+    return f"""Traduza para português brasileiro, de forma natural e fluida, cada valor do objeto JSON abaixo (textos de um produto).
+Mantenha termos técnicos quando apropriado. Responda apenas com um objeto JSON com exatamente as mesmas chaves e os valores traduzidos.
+
+{json.dumps(entrada, ensure_ascii=False)}"""
+
+def _traduzir_json_gemini(textos: List[str], gemini_key: str) -> Dict[str, str]:
+    """Uma requisição estruturada; retorna só os textos com tradução válida na resposta"""
+    entrada = {str(i): texto for i, texto in enumerate(textos)}
+    try:
+        with medir('provedor', 'gemini_json'):
+            response = obter_modelo_gemini(gemini_key).generate_content(
+                _prompt_gemini_json(entrada),
+                generation_config={'response_mime_type': 'application/json'}
+            )
+            saida = json.loads(response.text)
+    except Exception as e:
+        logging.warning(f"Gemini (JSON) falhou: {e}")
+        return {}
+    
+    if not isinstance(saida, dict):
+        return {}
+    return {
+        entrada[chave]: valor.strip()
+        for chave, valor in saida.items()
+        if chave in entrada and isinstance(valor, str) and valor.strip()
+    }
+
+def traduzir_lote_gemini(textos: List[str], gemini_key: str) -> Dict[str, str]:
+    """
+    Traduz vários textos (ex: todos os de um produto) com Gemini em requisições JSON únicas
+    de até GEMINI_CONFIG['max_caracteres']. Campos ausentes ou inválidos na resposta são
+    re-pedidos sozinhos; o que ainda falhar vai texto a texto por `traduzir_com_gemini`.
+    """
+    if not GEMINI_DISPONIVEL or not gemini_key:
+        return {texto: traduzir_texto(texto) for texto in dict.fromkeys(textos)}
+    
+    resultados = {}
+    pendentes = []
+    for texto in dict.fromkeys(textos):
+        if not texto or texto == "N/A" or texto.startswith(('http', 'www', 'https', '$', 'R$')):
+            resultados[texto] = texto
+            continue
+        em_memoria = memoria_traducao.obter(texto, 'gemini')
+        if em_memoria is not None:
+            resultados[texto] = em_memoria
+        else:
+            pendentes.append(texto)
+    
+    for _ in range(1 + GEMINI_CONFIG['tentativas']):
+        if not pendentes:
+            break
+        falhas = []
+        for pacote in _dividir_em_pacotes(pendentes, GEMINI_CONFIG['max_caracteres']):
+            traducoes = _traduzir_json_gemini(pacote, gemini_key)
+            for texto in pacote:
+                if texto in traducoes:
+                    resultados[texto] = traducoes[texto]
+                    memoria_traducao.salvar(texto, traducoes[texto], 'gemini')
+                else:
+                    falhas.append(texto)
+        pendentes = falhas
+    
+    for texto in pendentes:
+        resultados[texto] = traduzir_com_gemini(texto, gemini_key)
+    return resultados
+
+def _prompt_gemini(texto: str) -> str:
+    return f"""Traduza o seguinte texto de produto do inglês para português brasileiro de forma natural e fluida.
+Mantenha termos técnicos quando apropriado. Não adicione explicações, apenas retorne a tradução.
+
+Texto: {texto}
+
+Tradução:"""
+
+def traduzir_com_gemini(texto: str, gemini_key: str = None) -> str:
+    """Traduz texto usando Gemini API para melhor qualidade"""
+    if not GEMINI_DISPONIVEL or not gemini_key:
+        return traduzir_texto(texto)
+    
+    if not texto or texto == "N/A":
+        return texto
+    
+    if texto.startswith(('http', 'www', 'https', '$', 'R$')):
+        return texto
+    
+    em_memoria = memoria_traducao.obter(texto, 'gemini')
+    if em_memoria is not None:
+        return em_memoria
+    
+    try:
+        with medir('provedor', 'gemini'):
+            response = obter_modelo_gemini(gemini_key).generate_content(_prompt_gemini(texto))
+            traducao = response.text.strip()
+        memoria_traducao.salvar(texto, traducao, 'gemini')
+        return traducao
+        
+    except Exception as e:
+        logging.warning(f"Gemini falhou: {e}")
+        return traduzir_texto(texto)
+
+class SaudeProvedor:
+    """Latência e taxa de erro (médias móveis) e estado do circuit breaker de um provedor"""
+
+    def __init__(self, nome: str):
+        self.nome = nome
+        self.latencia = None
+        self.taxa_erro = 0.0
+        self.sucessos = 0
+        self.falhas = 0
+        self.falhas_seguidas = 0
+        self.aberto_ate = 0.0
+        self.teste_em_andamento = False
+
+    @property
+    def estado(self) -> str:
+        if self.falhas_seguidas < ROTEADOR_CONFIG['limite_falhas']:
+            return 'fechado'
+        return 'aberto' if time.monotonic() < self.aberto_ate else 'meio-aberto'
+
+    def custo(self) -> float:
+        """
+        Tempo esperado até uma tradução bem-sucedida. Sem histórico vale a latência
+        `latencia_inicial`: um provedor nunca testado passa à frente de outro mais lento
+        """
+        latencia = ROTEADOR_CONFIG['latencia_inicial'] if self.latencia is None else self.latencia
+        return latencia / max(1 - self.taxa_erro, 0.05)
+
+class RoteadorTraducao:
+    """
+    Cascata adaptativa de provedores de tradução. Cada chamada alimenta a latência e a taxa
+    de erro do provedor; a ordem da cascata segue o menor custo esperado (empates mantêm a
+    ordem configurada). Após `limite_falhas` falhas seguidas o circuito abre e o provedor é
+    pulado por `tempo_abertura` segundos; depois uma única chamada de teste decide se ele volta.
+    """
+
+    def __init__(self, provedores: Dict[str, callable]):
+        self._provedores = provedores
+        self._saude = {nome: SaudeProvedor(nome) for nome in provedores}
+        self._lock = threading.Lock()
+
+    def reservar(self, nome: str) -> bool:
+        """Diz se o provedor pode ser chamado agora (e reserva a chamada de teste, se meio-aberto)"""
+        saude = self._saude[nome]
+        with self._lock:
+            estado = saude.estado
+            if estado == 'fechado':
+                return True
+            if estado == 'meio-aberto' and not saude.teste_em_andamento:
+                saude.teste_em_andamento = True
+                return True
+            return False
+
+    def liberar(self, nome: str):
+        """Desfaz a reserva de `reservar` quando a chamada termina sem `registrar` (ex: cancelada)"""
+        with self._lock:
+            self._saude[nome].teste_em_andamento = False
+
+    def disponivel(self, nome: str) -> bool:
+        return nome in self._saude and self._saude[nome].estado != 'aberto'
+
+    def ordem(self) -> List[str]:
+        with self._lock:
+            nomes = list(self._provedores)
+            return sorted(nomes, key=lambda nome: (self._saude[nome].custo(), nomes.index(nome)))
+
+    def registrar(self, nome: str, latencia: float, sucesso: bool):
+        alfa = ROTEADOR_CONFIG['alfa']
+        saude = self._saude[nome]
+        with self._lock:
+            saude.latencia = latencia if saude.latencia is None else (1 - alfa) * saude.latencia + alfa * latencia
+            saude.taxa_erro = (1 - alfa) * saude.taxa_erro + alfa * (0.0 if sucesso else 1.0)
+            saude.teste_em_andamento = False
+            if sucesso:
+                saude.sucessos += 1
+                saude.falhas_seguidas = 0
+            else:
+                saude.falhas += 1
+                saude.falhas_seguidas += 1
+                if saude.falhas_seguidas >= ROTEADOR_CONFIG['limite_falhas']:
+                    saude.aberto_ate = time.monotonic() + ROTEADOR_CONFIG['tempo_abertura']
+
+    def chamar(self, nome: str, texto: str) -> str:
+        """Chama um provedor específico registrando o resultado; retorna o texto original em falha"""
+        if not self.reservar(nome):
+            return texto
+        inicio = time.monotonic()
+        try:
+            with medir('provedor', nome):
+                resultado = self._provedores[nome](texto)
+        except Exception as e:
+            self.registrar(nome, time.monotonic() - inicio, False)
+            logging.warning(f"{nome} falhou: {e}")
+            return texto
+        self.registrar(nome, time.monotonic() - inicio, True)
+        return resultado or texto
+
+    def traduzir(self, texto: str, excluir: tuple = ()) -> str:
+        """Tenta os provedores na ordem atual até algum devolver uma tradução"""
+        for nome in self.ordem():
+            if nome in excluir:
+                continue
+            resultado = self.chamar(nome, texto)
+            if resultado != texto:
+                return resultado
+        return texto
+
+    def saude(self) -> Dict[str, dict]:
+        """Estado de cada provedor, na ordem atual da cascata"""
+        return {
+            nome: {
+                'estado': self._saude[nome].estado,
+                'latencia_ms': round(self._saude[nome].latencia * 1000) if self._saude[nome].latencia is not None else None,
+                'taxa_erro': round(self._saude[nome].taxa_erro, 3),
+                'sucessos': self._saude[nome].sucessos,
+                'falhas': self._saude[nome].falhas,
+            }
+            for nome in self.ordem()
+        }
+
+_provedores_traducao = {'mymemory': _mymemory_bruto}
+if LIBRE_DISPONIVEL:
+    _provedores_traducao['libre'] = _libre_bruto
+if TRADUTOR_DISPONIVEL:
+    _provedores_traducao['google'] = _google_bruto
+if ROTEADOR_CONFIG['provedores']:
+    _provedores_traducao = {
+        nome: _provedores_traducao[nome] for nome in ROTEADOR_CONFIG['provedores'] if nome in _provedores_traducao
+    }
+roteador_traducao = RoteadorTraducao(_provedores_traducao)
+
+def traduzir_texto(texto: str, metodo: str = "auto") -> str:
+    """Traduz texto tentando múltiplos métodos (cascata de fallback)"""
+    if not texto or texto == "N/A" or len(texto) < 3:
+        return texto
+    
+    if texto.startswith(('http', 'www', 'https', '$', 'R$')):
+        return texto
+    
+    em_memoria = memoria_traducao.obter(texto, 'auto')
+    if em_memoria is not None:
+        return em_memoria
+    
+    # Cascata MyMemory -> Libre -> Deep Translator, reordenada pela saúde dos provedores
+    resultado = roteador_traducao.traduzir(texto)
+    
+    memoria_traducao.salvar(texto, resultado, 'auto')
+    return resultado
+
+def _dividir_em_pacotes(textos: List[str], limite: int, separador: str = '\n') -> List[List[str]]:
+    """Agrupa textos em pacotes cujo tamanho unido por `separador` não passa de `limite`"""
+    pacotes, atual, tamanho = [], [], 0
+    for texto in textos:
+        if atual and tamanho + len(separador) + len(texto) > limite:
+            pacotes.append(atual)
+            atual, tamanho = [], 0
+        atual.append(texto)
+        tamanho += len(texto) + (len(separador) if len(atual) > 1 else 0)
+    if atual:
+        pacotes.append(atual)
+    return pacotes
+
+def _traduzir_pacote(textos: List[str], traduzir) -> List[str]:
+    """
+    Traduz vários textos numa só requisição, unidos por quebra de linha.
+    Retorna None se a resposta não tiver o mesmo número de linhas (pacote inválido).
+    """
+    if len(textos) == 1:
+        return [traduzir(textos[0])]
+    unido = '\n'.join(textos)
+    resultado = traduzir(unido)
+    if not resultado or resultado == unido:
+        return None
+    partes = resultado.split('\n')
+    if len(partes) != len(textos):
+        return None
+    return [p.strip() for p in partes]
+
+class FilaTraducao:
+    """
+    Fila de tradução para lotes de produtos: junta os textos de todos os produtos, remove
+    duplicatas e resolve tudo de uma vez — memória de tradução, depois pacotes multi-texto
+    no MyMemory (até 500 caracteres) e no Google (até 4000), e por fim o restante da cascata
+    texto a texto. `traduzir_e_converter_dados(..., fila=fila)` usa os resultados.
+    """
+
+    def __init__(self, gemini_key: str = None, max_workers: int = 10):
+        self.gemini_key = gemini_key
+        self.max_workers = max_workers
+        self._pendentes = {'auto': {}, 'gemini': {}}
+        self.resultados = {}
+        self.pedidos = 0
+        self.chamadas_api = 0
+
+    def adicionar(self, texto: str, provedor: str = 'auto'):
+        self.pedidos += 1
+        if (provedor, texto) not in self.resultados:
+            self._pendentes[provedor][texto] = None
+
+    def obter(self, texto: str, provedor: str = 'auto'):
+        return self.resultados.get((provedor, texto))
+
+    def resolver(self):
+        auto = list(self._pendentes['auto'])
+        gemini = list(self._pendentes['gemini'])
+        self._pendentes = {'auto': {}, 'gemini': {}}
+        self._resolver_auto(auto)
+        
+        if gemini:
+            for texto, traducao in traduzir_lote_gemini(gemini, self.gemini_key).items():
+                self.resultados[('gemini', texto)] = traducao
+            self.chamadas_api += len(_dividir_em_pacotes(gemini, GEMINI_CONFIG['max_caracteres']))
+
+    def _resolver_auto(self, textos: List[str]):
+        restantes = []
+        for texto in textos:
+            if not texto or texto == "N/A" or len(texto) < 3 or texto.startswith(('http', 'www', 'https', '$', 'R$')):
+                self.resultados[('auto', texto)] = texto
+                continue
+            em_memoria = memoria_traducao.obter(texto, 'auto')
+            if em_memoria is not None:
+                self.resultados[('auto', texto)] = em_memoria
+            else:
+                restantes.append(texto)
+        
+        # Textos longos seguem sozinhos pela cascata (o MyMemory trunca em 500)
+        longos = [t for t in restantes if len(t) > 500 or '\n' in t]
+        conjunto_longos = set(longos)
+        curtos = [t for t in restantes if t not in conjunto_longos]
+        
+        # Provedores com circuito aberto são pulados
+        if roteador_traducao.disponivel('mymemory'):
+            curtos = self._resolver_pacotes(curtos, lambda t: roteador_traducao.chamar('mymemory', t), 500)
+        if roteador_traducao.disponivel('google'):
+            curtos = self._resolver_pacotes(curtos, lambda t: roteador_traducao.chamar('google', t), 4000)
+        
+        individuais = longos + curtos
+        if individuais:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                traducoes = list(executor.map(com_contexto(traduzir_texto), individuais))
+            self.chamadas_api += len(individuais)
+            for texto, traducao in zip(individuais, traducoes):
+                self.resultados[('auto', texto)] = traducao
+
+    def _resolver_pacotes(self, textos: List[str], traduzir, limite: int) -> List[str]:
+        """Traduz em pacotes; retorna os textos que não foram resolvidos"""
+        pacotes = _dividir_em_pacotes(textos, limite)
+        if not pacotes:
+            return []
+        
+        falhas = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            respostas = list(executor.map(com_contexto(lambda pacote: _traduzir_pacote(pacote, traduzir)), pacotes))
+        self.chamadas_api += len(pacotes)
+        
+        for pacote, traducoes in zip(pacotes, respostas):
+            if traducoes is None:
+                falhas.extend(pacote)
+                continue
+            for texto, traducao in zip(pacote, traducoes):
+                if traducao and traducao != texto:
+                    self.resultados[('auto', texto)] = traducao
+                    memoria_traducao.salvar(texto, traducao, 'auto')
+                else:
+                    falhas.append(texto)
+        return falhas
+
+    def estatisticas(self) -> dict:
+        return {
+            'pedidos': self.pedidos,
+            'textos_unicos': len(self.resultados),
+            'chamadas_api': self.chamadas_api,
+        }
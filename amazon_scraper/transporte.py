@@ -0,0 +1,350 @@
+"""URLs da Amazon, headers, limitadores de taxa por domínio e sessões HTTP compartilhadas."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict
+from urllib.parse import urlparse, urlunparse
+import time
+import re
+import random
+import threading
+import asyncio
+
+from .config import (
+    BLOQUEIO_CONFIG, DOMINIOS_AMAZON, LIMITES_TAXA, LIMITE_TAXA_PADRAO, POLITICAS_RETRY, TRANSPORTE_CONFIG,
+    USER_AGENTS,
+)
+
+def limpar_url_amazon(url: str) -> str:
+    """Remove parâmetros desnecessários da URL"""
+    parsed = urlparse(url)
+    clean_url = urlunparse((parsed.scheme, parsed.netloc, parsed.path, '', '', ''))
+    return clean_url
+
+def obter_headers():
+    """Gera headers mais realistas para evitar bloqueios"""
+    return {
+        'User-Agent': random.choice(USER_AGENTS),
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Cache-Control': 'max-age=0',
+    }
+
+def validar_url_amazon(url: str) -> bool:
+    parsed = urlparse(url)
+    return any(d in parsed.netloc for d in DOMINIOS_AMAZON)
+
+def obter_dominio_amazon(url: str) -> str:
+    """Retorna o domínio Amazon da URL (ex: 'amazon.com.br') ou None"""
+    netloc = urlparse(url).netloc.lower()
+    # Mais longo primeiro: 'amazon.com.br' também contém 'amazon.com'
+    for dominio in sorted(DOMINIOS_AMAZON, key=len, reverse=True):
+        if dominio in netloc:
+            return dominio
+    return None
+
+class LimitadorTaxa:
+    """Token bucket thread-safe: até `taxa` requisições/segundo com rajadas de `capacidade`"""
+
+    def __init__(self, taxa: float, capacidade: int = 1):
+        self.taxa = taxa
+        self.taxa_base = taxa
+        self.capacidade = capacidade
+        self._tokens = float(capacidade)
+        self._ultimo = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _tentar_adquirir(self) -> float:
+        """Consome um token se houver; senão retorna quantos segundos esperar"""
+        with self._lock:
+            agora = time.monotonic()
+            self._tokens = min(self.capacidade, self._tokens + (agora - self._ultimo) * self.taxa)
+            self._ultimo = agora
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.taxa
+
+    def adquirir(self):
+        """Bloqueia até haver um token disponível"""
+        while (espera := self._tentar_adquirir()) > 0:
+            time.sleep(espera)
+
+    async def adquirir_async(self):
+        """Versão assíncrona de `adquirir` (não bloqueia o event loop)"""
+        while (espera := self._tentar_adquirir()) > 0:
+            await asyncio.sleep(espera)
+
+    def ajustar(self, fator: float):
+        """Ritmo passa a `fator` vezes a taxa configurada"""
+        with self._lock:
+            self.taxa = self.taxa_base * fator
+
+_limitadores = {}
+_limitadores_lock = threading.Lock()
+
+def obter_limitador(url: str) -> LimitadorTaxa:
+    """Limitador compartilhado pelo processo para o domínio Amazon da URL"""
+    dominio = obter_dominio_amazon(url) or urlparse(url).netloc
+    with _limitadores_lock:
+        if dominio not in _limitadores:
+            config = LIMITES_TAXA.get(dominio, LIMITE_TAXA_PADRAO)
+            _limitadores[dominio] = LimitadorTaxa(config['taxa'], config['capacidade'])
+        return _limitadores[dominio]
+
+def detectar_bloqueio(conteudo: bytes, status: int = 200) -> str:
+    """
+    Motivo do bloqueio ('http_503', 'captcha'...) se a resposta for uma página de bloqueio da
+    Amazon, senão None. Olha só o status e o início dos bytes brutos: não decodifica nem monta
+    a árvore (páginas de bloqueio têm poucos KB; as de produto, centenas).
+    """
+    if status in BLOQUEIO_CONFIG['status']:
+        return f'http_{status}'
+    limite = BLOQUEIO_CONFIG['bytes_inspecionados']
+    for marcador, motivo in BLOQUEIO_CONFIG['marcadores']:
+        if conteudo.find(marcador, 0, limite) != -1:
+            return motivo
+    return None
+
+def atraso_backoff(tentativa: int) -> float:
+    """Espera antes de recolocar uma URL bloqueada na fila: exponencial com jitter (metade fixa, metade aleatória)"""
+    teto = min(BLOQUEIO_CONFIG['backoff_max'], BLOQUEIO_CONFIG['backoff_base'] * 2 ** tentativa)
+    return teto / 2 + random.uniform(0, teto / 2)
+
+def _concluir_espera(vez: asyncio.Future):
+    if not vez.done():
+        vez.set_result(None)
+
+class ControleBloqueio:
+    """
+    Coletas simultâneas num domínio, com limite adaptativo (AIMD): cada bloqueio corta o limite
+    pela metade — e o ritmo do limitador de taxa na mesma proporção —, e `aumento_apos` coletas
+    seguidas sem bloqueio devolvem uma vaga. `taxa_bloqueio` é uma média móvel.
+    Uso: `with controle:` em volta da requisição (ou adquirir_async/liberar no motor assíncrono).
+    """
+
+    def __init__(self, limitador: LimitadorTaxa, maximo: int, minimo: int = 1):
+        self.limitador = limitador
+        self.maximo = maximo
+        self.minimo = minimo
+        self.limite = maximo
+        self.em_uso = 0
+        self.taxa_bloqueio = 0.0
+        self.coletas = 0
+        self.bloqueios = 0
+        self._sucessos_seguidos = 0
+        self._condicao = threading.Condition()
+        # (loop, future) de cada corrotina esperando vaga; acordadas a cada vaga liberada ou aberta
+        self._espera_async = []
+
+    def adquirir(self):
+        with self._condicao:
+            while self.em_uso >= self.limite:
+                self._condicao.wait()
+            self.em_uso += 1
+
+    async def adquirir_async(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condicao:
+                if self.em_uso < self.limite:
+                    self.em_uso += 1
+                    return
+                vez = loop.create_future()
+                self._espera_async.append((loop, vez))
+            try:
+                await vez
+            finally:
+                with self._condicao:
+                    if (loop, vez) in self._espera_async:
+                        self._espera_async.remove((loop, vez))
+
+    def _acordar_async(self):
+        """Acorda as corrotinas em espera (de qualquer loop/thread) para disputarem a vaga; requer _condicao"""
+        for loop, vez in self._espera_async:
+            try:
+                loop.call_soon_threadsafe(_concluir_espera, vez)
+            except RuntimeError:
+                # Loop já fechado: ninguém mais espera nesse future
+                pass
+        self._espera_async.clear()
+
+    def liberar(self):
+        with self._condicao:
+            self.em_uso -= 1
+            self._condicao.notify()
+            self._acordar_async()
+
+    def __enter__(self):
+        self.adquirir()
+        return self
+
+    def __exit__(self, *exc):
+        self.liberar()
+
+    def registrar(self, bloqueado: bool):
+        alfa = BLOQUEIO_CONFIG['alfa']
+        with self._condicao:
+            self.coletas += 1
+            self.taxa_bloqueio = (1 - alfa) * self.taxa_bloqueio + alfa * (1.0 if bloqueado else 0.0)
+            if bloqueado:
+                self.bloqueios += 1
+                self._sucessos_seguidos = 0
+                self.limite = max(self.minimo, self.limite // 2)
+            else:
+                self._sucessos_seguidos += 1
+                if self._sucessos_seguidos >= BLOQUEIO_CONFIG['aumento_apos'] and self.limite < self.maximo:
+                    self.limite += 1
+                    self._sucessos_seguidos = 0
+                    self._condicao.notify_all()
+                    self._acordar_async()
+            self.limitador.ajustar(self.limite / self.maximo)
+
+_controles = {}
+_controles_lock = threading.Lock()
+
+def obter_controle_bloqueio(url: str) -> ControleBloqueio:
+    """Controle de concorrência compartilhado pelo processo para o domínio Amazon da URL"""
+    dominio = obter_dominio_amazon(url) or urlparse(url).netloc
+    limitador = obter_limitador(url)
+    with _controles_lock:
+        if dominio not in _controles:
+            _controles[dominio] = ControleBloqueio(
+                limitador, BLOQUEIO_CONFIG['concorrencia_max'], BLOQUEIO_CONFIG['concorrencia_min'])
+        return _controles[dominio]
+
+def estatisticas_bloqueio() -> Dict[str, dict]:
+    """Por domínio: limite atual de coletas simultâneas, taxa de bloqueio, coletas e bloqueios"""
+    with _controles_lock:
+        controles = list(_controles.items())
+    return {
+        dominio: {
+            'limite': controle.limite,
+            'maximo': controle.maximo,
+            'taxa_bloqueio': controle.taxa_bloqueio,
+            'coletas': controle.coletas,
+            'bloqueios': controle.bloqueios,
+            'taxa_req_s': controle.limitador.taxa,
+        }
+        for dominio, controle in controles
+    }
+
+_sessoes = {}
+_sessoes_lock = threading.Lock()
+
+_contadores_retry_lock = threading.Lock()
+
+class RetryContado(Retry):
+    """
+    Retry do urllib3 que conta as novas tentativas feitas. O urllib3 cria uma cópia a cada
+    tentativa (`new`); todas as cópias somam no mesmo contador da sessão.
+    """
+
+    def __init__(self, *args, contador: dict = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.contador = contador if contador is not None else {'novas_tentativas': 0}
+
+    def new(self, **kwargs):
+        novo = super().new(**kwargs)
+        novo.contador = self.contador
+        return novo
+
+    def increment(self, *args, **kwargs):
+        # Levanta MaxRetryError quando as tentativas acabam: só conta o que vai ser repetido
+        novo = super().increment(*args, **kwargs)
+        with _contadores_retry_lock:
+            self.contador['novas_tentativas'] += 1
+        return novo
+
+def politica_retry(politica: str = 'padrao') -> Retry:
+    """Retry do urllib3 para uma das POLITICAS_RETRY"""
+    config = POLITICAS_RETRY[politica]
+    return RetryContado(
+        total=config['tentativas'],
+        read=0,
+        backoff_factor=config['backoff'],
+        status_forcelist=config['status'],
+        allowed_methods=['GET'],
+        raise_on_status=False,
+    )
+
+def _criar_sessao(retry: Retry) -> requests.Session:
+    adapter = HTTPAdapter(
+        pool_connections=TRANSPORTE_CONFIG['pool_connections'],
+        pool_maxsize=TRANSPORTE_CONFIG['pool_maxsize'],
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def obter_sessao(url: str, politica: str = 'padrao') -> requests.Session:
+    """Sessão keep-alive compartilhada pelo processo para o host da URL, com a política de retry dada"""
+    host = urlparse(url).netloc.lower()
+    with _sessoes_lock:
+        if (host, politica) not in _sessoes:
+            _sessoes[(host, politica)] = _criar_sessao(politica_retry(politica))
+        return _sessoes[(host, politica)]
+
+def estatisticas_transporte() -> Dict[str, dict]:
+    """
+    Estatísticas dos pools por host: requisições, conexões criadas, reuso, conexões abertas e
+    novas tentativas feitas pelo urllib3 (cada uma também conta em `requisicoes`)
+    """
+    stats = {}
+    with _sessoes_lock:
+        sessoes = list(_sessoes.items())
+    
+    # Um host pode ter uma sessão por política de retry: as estatísticas somam todas
+    por_host = {}
+    for (host, _), session in sessoes:
+        por_host.setdefault(host, []).append(session)
+    
+    for host, sessoes_host in por_host.items():
+        requisicoes = conexoes_criadas = conexoes_abertas = 0
+        adapters = {adapter for session in sessoes_host for adapter in session.adapters.values()}
+        contadores = {id(a.max_retries.contador): a.max_retries.contador
+                      for a in adapters if isinstance(a.max_retries, RetryContado)}
+        novas_tentativas = sum(contador['novas_tentativas'] for contador in contadores.values())
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for chave in pools.keys():
+                pool = pools.get(chave)
+                if pool is None:
+                    continue
+                requisicoes += pool.num_requests
+                conexoes_criadas += pool.num_connections
+                # A fila do pool é pré-preenchida com None; só contam conexões reais ociosas
+                conexoes_abertas += sum(1 for c in list(pool.pool.queue) if c is not None)
+        
+        stats[host] = {
+            'requisicoes': requisicoes,
+            'conexoes_criadas': conexoes_criadas,
+            'taxa_reuso': (1 - conexoes_criadas / requisicoes) if requisicoes else 0.0,
+            'conexoes_abertas': conexoes_abertas,
+            'novas_tentativas': novas_tentativas,
+        }
+    return stats
+
+_RE_ASIN_URL = re.compile(r'/(?:dp|gp/product)/([A-Za-z0-9]{10})(?![A-Za-z0-9])')
+
+def asin_da_url(url: str) -> str:
+    """ASIN canônico (maiúsculo) do caminho /dp/ ou /gp/product/ da URL, ou None"""
+    asin_match = _RE_ASIN_URL.search(url)
+    return asin_match.group(1).upper() if asin_match else None
+
+def normalizar_entrada_produto(entrada: str, dominio_padrao: str = 'amazon.com') -> str:
+    """Aceita URL ou ASIN puro e retorna uma URL de produto"""
+    entrada = entrada.strip()
+    if re.fullmatch(r'[A-Z0-9]{10}', entrada.upper()):
+        return f"https://www.{dominio_padrao}/dp/{entrada.upper()}"
+    return entrada
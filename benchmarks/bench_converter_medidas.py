@@ -0,0 +1,268 @@
+"""
+Micro-benchmark de converter_medidas: compara o motor pré-compilado com a implementação
+anterior (copiada abaixo) em strings/segundo e confere que a saída é idêntica no corpus.
+Mede também converter_medidas_serie sobre o corpus repetido como uma coluna de catálogo.
+
+Uso: python benchmarks/bench_converter_medidas.py [repeticoes]
+"""
+import glob
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from amazon_scraper import medidas, pipeline  # noqa: E402
+from amazon_scraper.medidas import (  # noqa: E402
+    CONVERSAO_CALCADOS_FEM,
+    CONVERSAO_CALCADOS_MASC,
+    CONVERSAO_FEMININO,
+    CONVERSAO_MEDIDAS,
+    CONVERSAO_TAMANHOS,
+    formatar_numero_br,
+)
+
+PASTA_PAGINAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'paginas')
+
+CORPUS_BASE = [
+    "5.5 lbs", "2.2 pounds", "10 oz", "12 onças", "1,5 libras", "88.2 Pounds", "0.3 lb",
+    "10 inches", "12 x 4 x 5 inches", "52.3 x 22.1 x 44.5 in", "27,5 polegadas", "6 ft", "3 feet",
+    "100 yards", "2 miles", "1.200,50 pés", "1,200.50 ft", "0.5 mile",
+    "1 gallon", "3 galões", "2 quarts", "16 fl oz", "2 cups", "1 pint", "0.5 gal", "1.5 gallons",
+    "450 sq in", "200 sq ft", "2 acre", "36,000 BTU", "5 hp", "1 us ton",
+    "98.6°F", "-4°F", "550 degrees F", "104 °F", "86 graus F", "32 F",
+    "S", "M", "L", "XL", "XXL", "Size L", "10 L", "Men's", "Women's Shoe 7", "Men's boot 10",
+    "8", "12", "2XL",
+    "In Stock", "Only 7 left in stock - order soon.", "Brand: GrillCo", "N/A", "",
+    "Lightweight mesh upper weighs only 10 oz per shoe",
+    "Holds a standard 20 lb propane tank (not included) – 1 year warranty",
+    "Works in temperatures from -4°F to 104 °F and holds up to 550 degrees F at the grate",
+    "Product measures 10 x 5 x 3 inches and weighs 2.2 pounds; capacity 1.5 gallons",
+    "Stainless Steel 3-Burner Propane Gas Grill, 36,000 BTU, 450 sq in Cooking Area",
+]
+GENEROS = ['unisex', 'feminino', 'masculino', 'infantil']
+
+
+def converter_medidas_original(texto: str, genero_ctx: str = 'unisex') -> str:
+    """Implementação anterior (regex montada/compilada a cada chamada), mantida como referência"""
+    if not texto or texto == "N/A":
+        return texto
+    
+    texto_final = texto
+    
+    # --- 1. Conversão de Temperatura (F -> C) ---
+    # Busca padrões como 98.6°F, 98.6 F, 98.6 degrees F, 98.6 graus F
+    padrao_temp = r'(-?[\d\.,]+)\s*(?:°|º|deg|degrees|graus)?\s*F\b'
+    
+    def conv_temp(match):
+        orig = match.group(0)
+        try:
+            val_str = match.group(1).replace(',', '.')
+            # Se existirem multiplos pontos (ex 1.200.5), falha
+            if val_str.count('.') > 1: return orig
+            
+            val_f = float(val_str)
+            val_c = (val_f - 32) * 5/9
+            return f"{formatar_numero_br(val_c, 1)}°C ({orig})"
+        except:
+            return orig
+
+    texto_final = re.sub(padrao_temp, conv_temp, texto_final, flags=re.IGNORECASE)
+
+    # --- 2. Conversão de Medidas Físicas (Peso, Dimensão, Volume) ---
+    # Captura números com vírgulas OU pontos + unidade com possíveis acentos
+    padrao_fisico = r'((?:[\d]+(?:[.,][\d]{3})*|\d+)(?:[.,]\d+)?(?:\s*[xX]\s*(?:[\d]+(?:[.,][\d]{3})*|\d+)(?:[.,]\d+)?)*)\s*([a-zA-Z\u00C0-\u00FF"\']+(?:\s+[a-zA-Z\u00C0-\u00FF]+)?)'
+    
+    def conv_fisico(match):
+        numeros_str = match.group(1)
+        unidade_raw = match.group(2).lower()
+        unidade = unidade_raw.replace('.', '') 
+        
+        info_unidade = None
+        
+        # Tentativa exata e singular
+        if unidade in CONVERSAO_MEDIDAS:
+            info_unidade = CONVERSAO_MEDIDAS[unidade]
+        else:
+            if unidade.endswith('s') and unidade[:-1] in CONVERSAO_MEDIDAS:
+                info_unidade = CONVERSAO_MEDIDAS[unidade[:-1]]
+            elif unidade.endswith('oes') and unidade[:-3]+'ao' in CONVERSAO_MEDIDAS: # galões -> galão
+                info_unidade = CONVERSAO_MEDIDAS[unidade[:-3]+'ao']
+        
+        if info_unidade:
+            novo_std = info_unidade['para']
+            fator = info_unidade['multiplicador']
+            precisao = info_unidade['precisao']
+            tipo = info_unidade.get('tipo', 'geral')
+            
+            # Heurística para detectar formato de número (BR vs US)
+            # Se unidade é PT (ex: libras, pés), assume vírgula = decimal
+            unidade_pt = any(u in unidade for u in ['libra', 'polegada', 'pé', 'jarda', 'milha', 'onça', 'galão'])
+            
+            partes = re.split(r'\s*[xX]\s*', numeros_str)
+            partes_convertidas = []
+            
+            for parte in partes:
+                try:
+                    val_float = 0.0
+                    parte_limpa = parte.replace(' ', '')
+                    
+                    if unidade_pt: 
+                        # Formato BR: 1.200,50 ou 1200,50
+                        # Remove pontos de milhar, troca vírgula decimal por ponto
+                        aux = parte_limpa.replace('.', '').replace(',', '.')
+                        val_float = float(aux)
+                    else:
+                        # Formato US: 1,200.50 ou 1200.50
+                        # Remove vírgulas de milhar
+                        aux = parte_limpa.replace(',', '')
+                        val_float = float(aux)
+                        
+                    val_conv = val_float * fator
+                    
+                    # Lógica de escala inteligente
+                    std_final = novo_std
+                    val_final = val_conv
+                    
+                    if tipo == 'peso':
+                        if std_final == 'kg' and val_final < 1:
+                            val_final *= 1000
+                            std_final = 'g'
+                            precisao = 0
+                        elif std_final == 'g' and val_final >= 1000:
+                            val_final /= 1000
+                            std_final = 'kg'
+                            precisao = 2
+                            
+                    elif tipo == 'linear':
+                        if std_final == 'm' and val_final < 1:
+                            val_final *= 100
+                            std_final = 'cm'
+                            precisao = 1
+                        elif std_final == 'cm' and val_final >= 100:
+                            val_final /= 100
+                            std_final = 'm'
+                            precisao = 2
+                    
+                    elif tipo == 'volume':
+                         if std_final == 'L' and val_final < 1:
+                             val_final *= 1000
+                             std_final = 'ml'
+                             precisao = 0
+                    
+                    partes_convertidas.append(formatar_numero_br(val_final, precisao))
+                    novo_std = std_final 
+                    
+                except ValueError:
+                    partes_convertidas.append(parte)
+            
+            valores_formatados = " x ".join(partes_convertidas)
+            return f"{valores_formatados} {novo_std}"
+            
+        return match.group(0)
+
+    texto_final = re.sub(padrao_fisico, conv_fisico, texto_final, flags=re.IGNORECASE)
+
+    # --- 3. Conversão de Tamanhos (Roupas/Calçados) ---
+    # Apenas se o texto for curto (provavelmente um campo de "Tamanho") ou parecer um tamanho isolado
+    if len(texto) < 50: 
+        # Calçados
+        if 'shoe' in texto.lower() or 'tênis' in texto.lower() or 'calçado' in texto.lower() or 'boot' in texto.lower():
+            mapa = CONVERSAO_CALCADOS_MASC if genero_ctx == 'masculino' else CONVERSAO_CALCADOS_FEM
+            # Procura número isolado
+            match_num = re.search(r'\b(\d+(?:\.\d)?)\b', texto_final)
+            if match_num:
+                num_us = match_num.group(1)
+                if num_us in mapa:
+                    texto_final = texto_final.replace(num_us, f"BR {mapa[num_us]} (US {num_us})")
+        
+        # Roupas (Numérico Feminino)
+        elif genero_ctx == 'feminino' and re.match(r'^\s*\d+\s*$', texto_final):
+             num = texto_final.strip()
+             if num in CONVERSAO_FEMININO:
+                 texto_final = f"BR {CONVERSAO_FEMININO[num]} (US {num})"
+
+        # Letras (S, M, L...) - Single Pass Replacement + Lookbehind Protection
+        # Cria padrão que evita correspondência se precedido por dígito e espaço/hífen
+        # Ex: "10 L" -> "10 GG" (Não queremos isso). "Size L" -> "Size GG" (OK)
+        
+        def replace_callback(match):
+            key = match.group(0).upper() # Normalize case for lookup
+            return CONVERSAO_TAMANHOS.get(key, match.group(0))
+
+        # Ordenar chaves por tamanho reverso para evitar match parcial (ex: XXL vs XL) - embora aqui tenhamos word boundary
+        keys = sorted(CONVERSAO_TAMANHOS.keys(), key=len, reverse=True)
+        # Regex: (?<![\d.,]\s)(?<!['])\b(XXL|XL|L|...)\b
+        # Evita: "10 L" (Liters), "Men's" ('s -> S -> M)
+        pattern = r'(?<![\d.,]\s)(?<![\'])\b(' + '|'.join(map(re.escape, keys)) + r')\b'
+        
+        texto_final = re.sub(pattern, replace_callback, texto_final, flags=re.IGNORECASE)
+
+    return texto_final
+
+
+def montar_corpus() -> list:
+    """Strings fixas + todos os textos extraídos das páginas salvas"""
+    corpus = list(CORPUS_BASE)
+    for caminho in sorted(glob.glob(os.path.join(PASTA_PAGINAS, '*.html'))):
+        with open(caminho, 'rb') as f:
+            conteudo = f.read()
+        dados = pipeline.extrair_dados_pagina(conteudo, f"https://www.amazon.com/dp/{os.path.basename(caminho)[:10]}")
+        for valor in dados.values():
+            if isinstance(valor, str):
+                corpus.append(valor)
+            elif isinstance(valor, list):
+                corpus.extend(valor)
+            elif isinstance(valor, dict):
+                corpus.extend(valor.keys())
+                corpus.extend(valor.values())
+    return [(texto, genero) for texto in corpus for genero in GENEROS]
+
+
+def medir(funcao, corpus: list, repeticoes: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        for texto, genero in corpus:
+            funcao(texto, genero)
+    return len(corpus) * repeticoes / (time.perf_counter() - inicio)
+
+
+def main() -> int:
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    corpus = montar_corpus()
+
+    divergencias = 0
+    for texto, genero in corpus:
+        esperado = converter_medidas_original(texto, genero)
+        obtido = medidas.converter_medidas(texto, genero)
+        if obtido != esperado:
+            divergencias += 1
+            print(f"DIVERGÊNCIA [{genero}] {texto!r}: {obtido!r} != {esperado!r}")
+
+    textos = [texto for texto, _ in corpus] * repeticoes
+    generos = [genero for _, genero in corpus] * repeticoes
+    obtidos = medidas.converter_medidas_serie(textos, generos)
+    for texto, genero, obtido in zip(textos[:len(corpus)], generos, obtidos):
+        esperado = medidas.converter_medidas(texto, genero)
+        if obtido != esperado:
+            divergencias += 1
+            print(f"DIVERGÊNCIA serie [{genero}] {texto!r}: {obtido!r} != {esperado!r}")
+
+    antes = medir(converter_medidas_original, corpus, repeticoes)
+    depois = medir(medidas.converter_medidas, corpus, repeticoes)
+    inicio = time.perf_counter()
+    medidas.converter_medidas_serie(pd.Series(textos), pd.Series(generos))
+    serie = len(textos) / (time.perf_counter() - inicio)
+    print(f"corpus: {len(corpus)} strings x {repeticoes} repetições")
+    print(f"antes:  {antes:,.0f} strings/s")
+    print(f"depois: {depois:,.0f} strings/s ({depois / antes:.1f}x)")
+    print(f"serie:  {serie:,.0f} strings/s ({serie / antes:.1f}x)")
+    print(f"{divergencias} divergência(s)")
+    return 1 if divergencias else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
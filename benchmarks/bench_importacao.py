@@ -0,0 +1,63 @@
+"""
+Tempo de importação a frio do pacote (o caminho do CLI: cli + pipeline + exportacao), medido em
+processos Python novos. Falha se a mediana passar do orçamento ou se algum módulo pesado que
+deveria ser carregado só sob demanda (Streamlit, pandas, provedores de tradução, pyarrow...)
+for importado.
+
+Uso: python benchmarks/bench_importacao.py [orcamento_ms] [repeticoes]
+     (o orçamento também pode vir de ORCAMENTO_IMPORTACAO_MS; padrão 500 ms)
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULOS_PROIBIDOS = [
+    'streamlit', 'pandas', 'numpy', 'google.generativeai', 'deep_translator', 'translate',
+    'pyarrow', 'openpyxl', 'httpx', 'selectolax',
+]
+
+CODIGO = """
+import json, sys, time
+inicio = time.perf_counter()
+import amazon_scraper.cli, amazon_scraper.pipeline, amazon_scraper.exportacao
+ms = (time.perf_counter() - inicio) * 1000
+print(json.dumps({'ms': ms, 'modulos': sorted(sys.modules)}))
+"""
+
+
+def medir_uma_vez() -> dict:
+    saida = subprocess.run(
+        [sys.executable, '-W', 'ignore', '-c', CODIGO],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    )
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    orcamento = float(sys.argv[1] if len(sys.argv) > 1 else os.getenv('ORCAMENTO_IMPORTACAO_MS', 500))
+    repeticoes = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    medicoes = [medir_uma_vez() for _ in range(repeticoes)]
+    tempos = [m['ms'] for m in medicoes]
+    carregados = set(medicoes[-1]['modulos'])
+    proibidos = [m for m in MODULOS_PROIBIDOS if m in carregados]
+
+    print(f"importação a frio: mediana {statistics.median(tempos):.0f} ms "
+          f"(min {min(tempos):.0f}, max {max(tempos):.0f}, {repeticoes} processos)")
+    print(f"orçamento: {orcamento:.0f} ms")
+    if proibidos:
+        print(f"módulos pesados importados: {', '.join(proibidos)}")
+
+    if statistics.median(tempos) > orcamento or proibidos:
+        print("FALHOU")
+        return 1
+    print("ok")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+"""
+Benchmark offline do pipeline, etapa por etapa, sem tocar a rede:
+- detecção de página de bloqueio e parsing das páginas salvas em benchmarks/paginas (cada backend disponível);
+- converter_medidas sobre os textos extraídos (e converter_medidas_serie sobre a coluna inteira);
+- traduzir_e_converter_dados com um MyMemory local (servidor HTTP em /get) e com um cliente
+  Gemini falso, ambos com latência e taxa de erro configuráveis;
+- cada exportador (CSV, JSON, VTEX, streaming CSV/JSONL, Excel, Parquet).
+Para cada etapa: vazão e percentis p50/p90/p99 da latência por chamada.
+
+Uso: python benchmarks/bench_pipeline.py [--latencia-ms 40] [--jitter-ms 20] [--taxa-erro 0.02]
+                                         [--repeticoes 5] [--produtos 2000]
+"""
+import argparse
+import glob
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTA_PAGINAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'paginas')
+sys.path.insert(0, RAIZ)
+
+
+class Falhas:
+    """Latência (média + jitter, em ms) e taxa de erro compartilhadas pelos dublês"""
+
+    def __init__(self, latencia_ms: float, jitter_ms: float, taxa_erro: float, semente: int = 42):
+        self.latencia_ms = latencia_ms
+        self.jitter_ms = jitter_ms
+        self.taxa_erro = taxa_erro
+        self._aleatorio = random.Random(semente)
+        self._trava = threading.Lock()
+
+    def esperar(self):
+        with self._trava:
+            atraso = max(0.0, self._aleatorio.gauss(self.latencia_ms, self.jitter_ms))
+        time.sleep(atraso / 1000)
+
+    def falhou(self) -> bool:
+        with self._trava:
+            return self._aleatorio.random() < self.taxa_erro
+
+
+def traducao_falsa(texto: str) -> str:
+    return f"[pt] {texto}"
+
+
+def servidor_mymemory(falhas: Falhas) -> ThreadingHTTPServer:
+    """Dublê local de https://api.mymemory.translated.net/get"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != '/get':
+                self.send_error(404)
+                return
+            falhas.esperar()
+            if falhas.falhou():
+                self.send_error(503)
+                return
+            texto = parse_qs(url.query).get('q', [''])[0]
+            corpo = json.dumps({
+                'responseStatus': 200,
+                'responseData': {'translatedText': traducao_falsa(texto)},
+            }).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def log_message(self, *args):
+            pass
+
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
+
+
+class RespostaGemini:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class ModeloGeminiFalso:
+    """Responde aos dois prompts do pacote (lote JSON e texto único) como o Gemini faria"""
+
+    def __init__(self, falhas: Falhas):
+        self.falhas = falhas
+        self.chamadas = 0
+
+    def generate_content(self, prompt: str, generation_config=None):
+        self.chamadas += 1
+        self.falhas.esperar()
+        if self.falhas.falhou():
+            raise RuntimeError("503 Service Unavailable (simulado)")
+        if generation_config and generation_config.get('response_mime_type') == 'application/json':
+            entrada = json.loads(prompt.rsplit('\n', 1)[-1])
+            return RespostaGemini(json.dumps({k: traducao_falsa(v) for k, v in entrada.items()}, ensure_ascii=False))
+        texto = prompt.split('Texto: ', 1)[1].rsplit('\n\nTradução:', 1)[0]
+        return RespostaGemini(traducao_falsa(texto))
+
+
+def percentil(valores: list, p: float) -> float:
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, max(0, round(p / 100 * (len(ordenados) - 1))))
+    return ordenados[indice]
+
+
+def relatar(etapa: str, latencias: list, itens: int = None, unidade: str = 'itens'):
+    """Uma linha do relatório: vazão pelo tempo total e percentis por chamada (ms)"""
+    total = sum(latencias)
+    itens = itens if itens is not None else len(latencias)
+    ms = [s * 1000 for s in latencias]
+    print(f"{etapa:<42} {len(latencias):>6} {itens / total if total else 0:>12,.0f} {unidade + '/s':<10}"
+          f"{percentil(ms, 50):>9.3f} {percentil(ms, 90):>9.3f} {percentil(ms, 99):>9.3f}")
+
+
+def cronometrar(funcao, *args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    return time.perf_counter() - inicio, resultado
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--latencia-ms', type=float, default=40)
+    parser.add_argument('--jitter-ms', type=float, default=20)
+    parser.add_argument('--taxa-erro', type=float, default=0.02)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--produtos', type=int, default=2000, help='produtos nos exportadores em streaming')
+    args = parser.parse_args()
+
+    falhas = Falhas(args.latencia_ms, args.jitter_ms, args.taxa_erro)
+    servidor = servidor_mymemory(falhas)
+    pasta_temporaria = tempfile.mkdtemp(prefix='bench_pipeline_')
+
+    # Configuração do pacote antes de importá-lo: só o MyMemory local, sem memória em disco
+    os.environ['MYMEMORY_URL'] = f"http://127.0.0.1:{servidor.server_address[1]}/get"
+    os.environ['PROVEDORES_TRADUCAO'] = 'mymemory'
+    os.environ['MEMORIA_TRADUCAO_DB'] = ''
+    os.environ['CACHE_PAGINAS_DIR'] = pasta_temporaria
+
+    from amazon_scraper import exportacao, medidas, parsing, pipeline, traducao, transporte
+
+    paginas = []
+    for caminho in sorted(glob.glob(os.path.join(PASTA_PAGINAS, '*.html'))):
+        with open(caminho, 'rb') as f:
+            paginas.append((f.read(), f"https://www.amazon.com/dp/{os.path.basename(caminho)[:10]}"))
+
+    print(f"MyMemory/Gemini simulados: {args.latencia_ms:.0f}±{args.jitter_ms:.0f} ms, "
+          f"{args.taxa_erro:.0%} de erro; {len(paginas)} páginas, {args.repeticoes} repetições\n")
+    print(f"{'etapa':<42} {'n':>6} {'vazão':>12} {'':<10}{'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9}")
+
+    # --- Detecção de bloqueio (bytes brutos) ---
+    latencias = [cronometrar(transporte.detectar_bloqueio, conteudo)[0]
+                 for _ in range(args.repeticoes * 20) for conteudo, _ in paginas]
+    relatar("detectar_bloqueio", latencias, unidade='páginas')
+
+    # --- Parsing ---
+    backends = ['html.parser'] + [b for b, ok in (('lxml', parsing.LXML_DISPONIVEL),
+                                                   ('selectolax', parsing.SELECTOLAX_DISPONIVEL)) if ok]
+    produtos = []
+    for backend in backends:
+        latencias = []
+        for _ in range(args.repeticoes):
+            for conteudo, url in paginas:
+                segundos, dados = cronometrar(pipeline.extrair_dados_pagina, conteudo, url, backend=backend)
+                latencias.append(segundos)
+                if backend == 'html.parser' and len(produtos) < len(paginas):
+                    produtos.append(dados)
+        relatar(f"parsing [{backend}]", latencias, unidade='páginas')
+
+    # --- converter_medidas ---
+    textos = [valor for dados in produtos for valor in pipeline._textos_do_produto(dados)]
+    textos = [texto for tipo, texto in textos if tipo == 'valor']
+    latencias = []
+    for _ in range(args.repeticoes * 20):
+        for texto in textos:
+            latencias.append(cronometrar(medidas.converter_medidas, texto, 'unisex')[0])
+    relatar("converter_medidas", latencias, unidade='textos')
+    coluna = textos * 200
+    segundos, _ = cronometrar(medidas.converter_medidas_serie, coluna, 'unisex')
+    relatar(f"converter_medidas_serie ({len(coluna)} células)", [segundos], itens=len(coluna), unidade='textos')
+
+    # --- traduzir_e_converter_dados (memória de tradução limpa a cada produto: tudo vai à "rede") ---
+    for nome, usar_gemini in (('MyMemory local', False), ('Gemini falso', True)):
+        gemini_key = None
+        if usar_gemini:
+            gemini_key = 'chave-bench'
+            modelo = ModeloGeminiFalso(falhas)
+            traducao.registrar_modelo_gemini(gemini_key, modelo)
+        latencias = []
+        for _ in range(args.repeticoes):
+            for dados in produtos:
+                traducao.memoria_traducao.limpar()
+                latencias.append(cronometrar(pipeline.traduzir_e_converter_dados, dados, usar_gemini, gemini_key)[0])
+        relatar(f"traduzir_e_converter_dados [{nome}]", latencias, unidade='produtos')
+
+        traducao.memoria_traducao.limpar()
+        segundos, _ = cronometrar(pipeline.traduzir_e_converter_lote, produtos * args.repeticoes,
+                                  usar_gemini, gemini_key)
+        relatar(f"traduzir_e_converter_lote [{nome}]", [segundos], itens=len(produtos) * args.repeticoes,
+                unidade='produtos')
+
+    traducao.memoria_traducao.limpar()
+    traduzidos = [pipeline.traduzir_e_converter_dados(dados) for dados in produtos]
+
+    # --- Exportadores (um produto por chamada) ---
+    por_produto = [
+        ('gerar_csv', exportacao.gerar_csv),
+        ('gerar_json', exportacao.gerar_json),
+        ('gerar_vtex_markdown', exportacao.gerar_vtex_markdown),
+    ]
+    if exportacao.OPENPYXL_DISPONIVEL:
+        por_produto.append(('gerar_excel (1 produto)', lambda d: exportacao.gerar_excel([d])))
+    if exportacao.PYARROW_DISPONIVEL:
+        por_produto.append(('gerar_parquet_zip (1 produto)', lambda d: exportacao.gerar_parquet_zip([d])))
+    for nome, funcao in por_produto:
+        latencias = [cronometrar(funcao, dados)[0] for _ in range(args.repeticoes * 20) for dados in traduzidos]
+        relatar(nome, latencias, unidade='produtos')
+
+    # --- Exportadores de catálogo (args.produtos produtos) ---
+    catalogo = [traduzidos[i % len(traduzidos)] for i in range(args.produtos)]
+    em_lote = [
+        ('exportar_produtos [jsonl]', lambda: exportacao.exportar_produtos(iter(catalogo), io.StringIO(), 'jsonl')),
+        ('exportar_produtos [csv]', lambda: exportacao.exportar_produtos(iter(catalogo), io.StringIO(), 'csv')),
+    ]
+    if exportacao.OPENPYXL_DISPONIVEL:
+        em_lote.append(('gerar_excel [catálogo]', lambda: exportacao.gerar_excel(catalogo)))
+    if exportacao.PYARROW_DISPONIVEL:
+        prefixo = os.path.join(pasta_temporaria, 'catalogo')
+        em_lote.append(('exportar_parquet [catálogo]', lambda: exportacao.exportar_parquet(catalogo, prefixo)))
+    for nome, funcao in em_lote:
+        latencias = [cronometrar(funcao)[0] for _ in range(args.repeticoes)]
+        relatar(nome, latencias, itens=args.produtos * args.repeticoes, unidade='produtos')
+
+    saude = traducao.roteador_traducao.saude().get('mymemory', {})
+    # Novas tentativas do urllib3 não aparecem no roteador: sem esta linha virariam latência do MyMemory
+    transporte_mymemory = transporte.estatisticas_transporte().get(urlparse(os.environ['MYMEMORY_URL']).netloc, {})
+    print(f"\nMyMemory local: {saude.get('sucessos', 0)} ok / {saude.get('falhas', 0)} falhas, "
+          f"{transporte_mymemory.get('requisicoes', 0)} requisições HTTP "
+          f"({transporte_mymemory.get('novas_tentativas', 0)} novas tentativas do transporte); "
+          f"Gemini falso: {modelo.chamadas} chamadas")
+    servidor.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""
+Gera benchmarks/paginas/B0COMPL005.html: uma página de produto em tamanho real (~1,5 MB), com a
+estrutura de uma página salva da Amazon — <head> com dezenas de blocos de script/estilo e JSON de
+estado, menu de navegação com milhares de links, aninhamento profundo em volta do centerCol,
+carrosséis de produtos relacionados (com a-price-whole/a-icon-star/a-dynamic-image depois dos
+verdadeiros), avaliações longas, templates e comentários com marcação que imita os seletores.
+Serve para que verificar_backends e os benchmarks de parsing passem pelos caminhos que o
+FiltroPagina pula numa página real, não só pelas páginas sintéticas pequenas.
+
+A saída é determinística (semente fixa). Uso: python benchmarks/gerar_pagina_completa.py
+"""
+import json
+import os
+import random
+
+PASTA_PAGINAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'paginas')
+ARQUIVO = os.path.join(PASTA_PAGINAS, 'B0COMPL005.html')
+
+PALAVRAS = (
+    "stainless steel portable outdoor kitchen cordless rechargeable lightweight durable premium "
+    "compact adjustable waterproof ergonomic professional heavy duty easy clean dishwasher safe "
+    "non-stick family camping travel home office battery charging fast quiet powerful design "
+    "quality warranty customer support includes accessories perfect gift size color black silver"
+).split()
+
+
+def frase(aleatorio: random.Random, minimo: int, maximo: int) -> str:
+    return ' '.join(aleatorio.choice(PALAVRAS) for _ in range(aleatorio.randint(minimo, maximo))).capitalize()
+
+
+def cabecalho(aleatorio: random.Random) -> list:
+    partes = [
+        '<!doctype html><html lang="en-us" class="a-no-js" data-19ax5a9jf="dingo"><head>',
+        '<meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">',
+        '<title>Amazon.com: Cordless Stick Vacuum Cleaner, 450W Brushless Motor : Home &amp; Kitchen</title>',
+        '<link rel="canonical" href="https://www.amazon.com/dp/B0COMPL005">',
+    ]
+    for i in range(40):
+        partes.append(f'<link rel="stylesheet" href="https://m.media-amazon.com/images/I/{i:02d}AUIClients-{i}.css">')
+    # Blocos de script com marcação dentro de strings: o parser não pode tratá-los como tags
+    for i in range(60):
+        corpo = ''.join(
+            f'P.when("A","jQuery","ready").execute("m{i}_{j}",function(A,$){{var h="<span id=\\"productTitle\\">'
+            f'{frase(aleatorio, 2, 5)}</span><div id=\\"availability\\">x</div>";if(a<b&&c>d){{A.state("s{j}",'
+            f'{{"k":{j},"v":"{frase(aleatorio, 4, 10)}"}});}}}});\n'
+            for j in range(25)
+        )
+        partes.append(f'<script type="text/javascript">{corpo}</script>')
+    estilo = ''.join(
+        f'.a-size-{i} .a-price-whole{{font-size:{10 + i % 20}px}}#c{i} span.a-icon-star{{margin:{i % 7}px}}\n'
+        for i in range(3000)
+    )
+    partes.append(f'<style type="text/css">{estilo}</style>')
+    partes.append('</head>')
+    return partes
+
+
+def navegacao(aleatorio: random.Random) -> list:
+    partes = ['<body class="a-m-us a-aui_72554-c"><div id="a-page"><header id="navbar-main" class="nav-opt-sprite">']
+    partes.append('<div id="hmenu-container"><div id="hmenu-content">')
+    for menu in range(40):
+        partes.append(f'<ul class="hmenu hmenu-translateX-right" data-menu-id="{menu}">')
+        for item in range(60):
+            partes.append(
+                f'<li><a class="hmenu-item" href="/s?node={menu * 1000 + item}">'
+                f'<div>{frase(aleatorio, 1, 3)}</div></a></li>'
+            )
+        partes.append('</ul>')
+    partes.append('</div></div></header>')
+    return partes
+
+
+def centro() -> list:
+    # ~40 níveis de <div> em volta do bloco do produto, como nas páginas reais
+    abertura = ''.join(f'<div class="a-section a-spacing-none nivel-{n}">' for n in range(40))
+    fechamento = '</div>' * 40
+    produto = '''
+<div id="dp" class="home_improvement en_US"><div id="dp-container" class="a-container" role="main">
+<div id="ppd"><div id="leftCol" class="a-column"><div id="imageBlock"><div id="main-image-container">
+<ul class="a-unordered-list a-nostyle a-horizontal list maintain-height"><li class="image item itemNo0 selected">
+<span class="a-list-item"><div id="imgTagWrapperId" class="imgTagWrapper">
+<img alt="Cordless Stick Vacuum" src="https://m.media-amazon.com/images/I/61vacuumMain._AC_SX679_.jpg"
+ data-old-hires="https://m.media-amazon.com/images/I/61vacuumMain._AC_SL1500_.jpg"
+ id="landingImage" class="a-dynamic-image a-stretch-vertical" data-a-dynamic-image="{}">
+</div></span></li></ul></div></div></div>
+<div id="centerCol" class="centerColAlign">
+<div id="title_feature_div" class="celwidget"><div id="titleSection" class="a-section a-spacing-none">
+<h1 id="title" class="a-size-large a-spacing-none"><span id="productTitle" class="a-size-large product-title-word-break">
+        Cordless Stick Vacuum Cleaner, 450W Brushless Motor, 55 Min Runtime, 1.5 L Dust Cup, Weighs 5.5 lbs
+</span></h1></div></div>
+<div id="bylineInfo_feature_div" class="celwidget"><a id="bylineInfo" class="a-link-normal" href="/stores/CleanCo/page/1">Visit the CleanCo Store</a></div>
+<div id="averageCustomerReviews_feature_div" class="celwidget"><div id="averageCustomerReviews">
+<span id="acrPopover" class="reviewCountTextLinkedHistogram noUnderline" title="4.4 out of 5 stars">
+<span class="a-declarative"><a href="javascript:void(0)" class="a-popover-trigger a-declarative">
+<span class="a-size-base a-color-base">4.4</span><i class="a-icon a-icon-star a-star-4-5 cm-cr-review-stars-spacing-big"><span class="a-icon-alt">4.4 out of 5 stars</span></i></a></span></span>
+<span class="a-letter-space"></span><a id="acrCustomerReviewLink" href="#customerReviews"><span id="acrCustomerReviewText" class="a-size-base">12,482 ratings</span></a>
+</div></div>
+<div id="corePriceDisplay_desktop_feature_div" class="celwidget"><div class="a-section a-spacing-none aok-align-center">
+<span class="a-price aok-align-center reinventPricePriceToPayMargin priceToPay"><span class="a-offscreen">$189.99</span>
+<span aria-hidden="true"><span class="a-price-symbol">$</span><span class="a-price-whole">189<span class="a-price-decimal">.</span></span><span class="a-price-fraction">99</span></span></span>
+</div></div>
+<div id="feature-bullets" class="a-section a-spacing-medium a-spacing-top-small">
+<h1 class="a-size-base-plus a-text-bold"> About this item </h1>
+<ul class="a-unordered-list a-vertical a-spacing-mini">
+<li><span class="a-list-item"> 450W BRUSHLESS MOTOR: 30,000 Pa of suction lifts fine dust and pet hair from carpets and hard floors. </span></li>
+<li><span class="a-list-item"> 55 MIN RUNTIME: the 2,500 mAh removable battery runs up to 55 minutes in eco mode and recharges in 4.5 hours. </span></li>
+<li><span class="a-list-item"> LARGE 1.5 L DUST CUP: empties with one press; the 5-stage filtration captures 99.97% of particles down to 0.3 microns. </span></li>
+<li><span class="a-list-item"> LIGHTWEIGHT: weighs only 5.5 lbs and converts to a handheld for stairs, sofas and car seats; 47 inches long. </span></li>
+<li><span class="a-list-item"> SMART DISPLAY: shows the battery level and the suction mode; LED head lights up dust under furniture. </span></li>
+<li><span class="a-list-item"> WHAT YOU GET: vacuum, wall mount, crevice tool, 2-in-1 brush, charger and a 2-year warranty. </span></li>
+<li><span class="a-list-item"> Short </span></li>
+</ul></div>
+<div id="availability_feature_div"><div id="availability" class="a-section a-spacing-base">
+<span class="a-size-medium a-color-success"> In Stock </span></div></div>
+</div></div></div>'''
+    return [abertura, produto, fechamento]
+
+
+def carrosseis(aleatorio: random.Random) -> list:
+    partes = []
+    for carrossel in range(8):
+        partes.append(f'<div class="a-carousel-container celwidget" id="sims-{carrossel}"><ol class="a-carousel">')
+        for item in range(60):
+            preco = aleatorio.randint(9, 400)
+            partes.append(
+                f'<li class="a-carousel-card"><div class="a-section sims-item">'
+                f'<img class="a-dynamic-image" src="https://m.media-amazon.com/images/I/{carrossel}{item}sim.jpg" alt="">'
+                f'<div class="p13n-sc-truncate">{frase(aleatorio, 6, 14)}</div>'
+                f'<i class="a-icon a-icon-star a-star-4"><span class="a-icon-alt">{aleatorio.randint(30, 50) / 10} out of 5 stars</span></i>'
+                f'<span class="a-price"><span class="a-price-whole">{preco}<span class="a-price-decimal">.</span></span>'
+                f'<span class="a-price-fraction">{aleatorio.randint(0, 99):02d}</span></span>'
+                f'</div></li>'
+            )
+        partes.append('</ol></div>')
+    return partes
+
+
+def detalhes(aleatorio: random.Random) -> list:
+    tecnicos = [
+        ('Brand', 'CleanCo'), ('Special Feature', 'Cordless, Lightweight, LED Head'),
+        ('Color', 'Silver'), ('Product Dimensions', '10.2"D x 9.8"W x 47.2"H'),
+        ('Capacity', '1.5 Liters'), ('Power Source', 'Battery Powered'), ('Wattage', '450 watts'),
+        ('Item Weight', '5.5 Pounds'), ('Voltage', '25.2 Volts'), ('Included Components', frase(aleatorio, 8, 12)),
+    ]
+    adicionais = [
+        ('ASIN', 'B0COMPL005'), ('Customer Reviews', '4.4 out of 5 stars ' * 40),
+        ('Best Sellers Rank', '#412 in Home &amp; Kitchen ' + frase(aleatorio, 40, 60)),
+        ('Date First Available', 'March 3, 2023'), ('Manufacturer', 'CleanCo Technology Ltd.'),
+        ('Item model number', 'CC-V450'),
+    ]
+
+    def tabela(id_tabela: str, linhas: list) -> str:
+        corpo = ''.join(
+            f'<tr><th class="a-color-secondary a-size-base prodDetSectionEntry"> {chave} </th>'
+            f'<td class="a-size-base prodDetAttrValue"> {valor} </td></tr>'
+            for chave, valor in linhas
+        )
+        return f'<table id="{id_tabela}" class="a-keyvalue prodDetTable" role="presentation"><tbody>{corpo}</tbody></table>'
+
+    return [
+        '<div id="prodDetails" class="a-section"><div class="a-row a-spacing-top-base">'
+        '<div class="a-column a-span6"><div class="a-section table-padding">',
+        tabela('productDetails_techSpec_section_1', tecnicos),
+        '</div></div><div class="a-column a-span6 a-span-last"><div class="a-section table-padding">',
+        tabela('productDetails_detailBullets_sections1', adicionais),
+        '</div></div></div></div>',
+    ]
+
+
+def avaliacoes(aleatorio: random.Random) -> list:
+    partes = ['<div id="reviewsMedley" class="a-row"><div id="cm-cr-dp-review-list">']
+    for avaliacao in range(60):
+        partes.append(
+            f'<div id="R{avaliacao:05d}" data-hook="review" class="a-section review aok-relative">'
+            f'<div class="a-profile-content"><span class="a-profile-name">{frase(aleatorio, 1, 2)}</span></div>'
+            f'<i data-hook="review-star-rating" class="a-icon a-icon-star a-star-{aleatorio.randint(1, 5)} review-rating">'
+            f'<span class="a-icon-alt">{aleatorio.randint(1, 5)}.0 out of 5 stars</span></i>'
+            f'<span data-hook="review-body" class="a-size-base review-text"><div class="a-expander-content">'
+            + ' '.join(frase(aleatorio, 10, 25) + '.' for _ in range(12))
+            + '</div></span></div>'
+        )
+    partes.append('</div></div>')
+    return partes
+
+
+def rodape(aleatorio: random.Random) -> list:
+    partes = []
+    # Estado da página em JSON (como os blocos a-state/twister das páginas reais)
+    for bloco in range(25):
+        estado = {
+            'asin': 'B0COMPL005',
+            'variacoes': [
+                {'asin': f'B0VAR{bloco:02d}{i:03d}', 'titulo': frase(aleatorio, 6, 12),
+                 'preco': f'${aleatorio.randint(50, 300)}.{aleatorio.randint(0, 99):02d}',
+                 'html': '<span class="a-price-whole">0</span><div id="availability">Out of Stock</div>'}
+                for i in range(120)
+            ],
+        }
+        partes.append(f'<script type="a-state" data-a-state=\'{{"key":"twister-{bloco}"}}\'>'
+                      f'{json.dumps(estado)}</script>')
+    # Templates e comentários com marcação idêntica à dos seletores
+    for i in range(20):
+        partes.append(
+            f'<script type="text/template" id="tpl-{i}"><table id="productDetails_techSpec_section_2" '
+            f'class="prodDetTable"><tr><th class="prodDetSectionEntry">Fake</th>'
+            f'<td class="prodDetAttrValue">Template {i}</td></tr></table></script>'
+            f'<!-- <span id="productTitle">Comentário {i}</span> <a id="bylineInfo">x</a> -->'
+        )
+    partes.append('<noscript><img height="1" width="1" src="https://fls-na.amazon.com/1/batch/1/OP/noscript"></noscript>')
+    partes.append('<div id="navFooter" class="navLeftFooter">')
+    for coluna in range(12):
+        partes.append('<ul class="navFooterLinkCol">' + ''.join(
+            f'<li class="nav_first"><a class="nav_a" href="/footer/{coluna}/{i}">{frase(aleatorio, 1, 4)}</a></li>'
+            for i in range(40)
+        ) + '</ul>')
+    partes.append('</div></div></body></html>')
+    return partes
+
+
+def main() -> int:
+    aleatorio = random.Random(5)
+    partes = (cabecalho(aleatorio) + navegacao(aleatorio) + centro() + carrosseis(aleatorio)
+              + detalhes(aleatorio) + avaliacoes(aleatorio) + rodape(aleatorio))
+    conteudo = '\n'.join(partes).encode('utf-8')
+    with open(ARQUIVO, 'wb') as f:
+        f.write(conteudo)
+    print(f"{ARQUIVO}: {len(conteudo) / 1024 / 1024:.2f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,70 @@
+"""
+Confere que todos os backends de parsing extraem exatamente os mesmos dados que os extrair_*
+sobre a árvore completa do html.parser, para cada página salva em benchmarks/paginas.
+
+Uso: python benchmarks/verificar_backends.py
+"""
+import glob
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from amazon_scraper import parsing, pipeline  # noqa: E402
+from amazon_scraper.config import SELECTORS  # noqa: E402
+
+PASTA_PAGINAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'paginas')
+BACKENDS = ['html.parser', 'lxml', 'selectolax']
+
+
+def extrair_referencia(conteudo: bytes, url: str) -> dict:
+    """Extração original: árvore completa do html.parser, um find por campo"""
+    soup = BeautifulSoup(conteudo, 'html.parser')
+    return {
+        "titulo_h1": parsing.extrair_texto(soup, SELECTORS["titulo"]),
+        "url_imagem": parsing.extrair_imagem(soup),
+        "preco": parsing.extrair_texto(soup, SELECTORS["preco"]),
+        "avaliacao": parsing.extrair_texto(soup, SELECTORS["avaliacao"]),
+        "num_avaliacoes": parsing.extrair_texto(soup, SELECTORS["num_avaliacoes"]),
+        "disponibilidade": parsing.extrair_texto(soup, SELECTORS["disponibilidade"]),
+        "marca": parsing.extrair_texto(soup, SELECTORS["marca"]),
+        "about_item": parsing.extrair_about_item(soup),
+        "product_info": parsing.extrair_product_info(soup),
+        "technical_details": parsing.extrair_technical_details(soup),
+        "asin": parsing.extrair_asin(soup, url),
+    }
+
+
+def main() -> int:
+    disponiveis = {
+        'html.parser': True,
+        'lxml': parsing.LXML_DISPONIVEL,
+        'selectolax': parsing.SELECTOLAX_DISPONIVEL,
+    }
+    divergencias = 0
+
+    for caminho in sorted(glob.glob(os.path.join(PASTA_PAGINAS, '*.html'))):
+        with open(caminho, 'rb') as f:
+            conteudo = f.read()
+        url = f"https://www.amazon.com/dp/{os.path.basename(caminho)[:10]}"
+        esperado = extrair_referencia(conteudo, url)
+
+        for backend in BACKENDS:
+            if not disponiveis[backend]:
+                continue
+            obtido = pipeline.extrair_dados_pagina(conteudo, url, backend=backend)
+            for campo, valor in esperado.items():
+                if obtido.get(campo) != valor:
+                    divergencias += 1
+                    print(f"[{backend}] {os.path.basename(caminho)} {campo}: {obtido.get(campo)!r} != {valor!r}")
+
+    for backend in BACKENDS:
+        print(f"{backend}: {'ok' if disponiveis[backend] else 'indisponível'}")
+    print(f"{divergencias} divergência(s)")
+    return 1 if divergencias else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""
+Confere que tabelas_catalogo monta as tabelas Arrow de catálogos heterogêneos: colunas que
+são lista num produto e texto em outro, colunas ausentes em parte dos produtos e specs.
+Grava o Parquet e relê para conferir os valores.
+
+Uso: python benchmarks/verificar_exportacao.py
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from amazon_scraper.exportacao import exportar_parquet, tabelas_catalogo  # noqa: E402
+
+REGISTROS = [
+    {'ASIN': 'B0MISTO001', 'Sobre este item': ['Tecido leve', 'Secagem rápida'], 'Preço': '$24.99',
+     'Informações do Produto': {'Peso do item': '1.1 pounds'}},
+    {'ASIN': 'B0MISTO002', 'Sobre este item': 'N/A', 'Preço': None, 'Cor': 'Azul'},
+    {'ASIN': 'B0MISTO003', 'Sobre este item': None, 'Cor': ['Azul', 'Preto']},
+]
+
+
+def main() -> int:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    erros = []
+
+    def conferir(condicao: bool, mensagem: str):
+        print(f"{'ok  ' if condicao else 'ERRO'} {mensagem}")
+        if not condicao:
+            erros.append(mensagem)
+
+    produtos, specs = tabelas_catalogo(REGISTROS)
+    conferir(produtos.schema.field('Sobre este item').type == pa.list_(pa.string()),
+             "coluna mista (lista e texto) vira list<string>")
+    conferir(produtos.column('Sobre este item').to_pylist() == [['Tecido leve', 'Secagem rápida'], ['N/A'], None],
+             "texto solto numa coluna de listas entra como lista de um item; None continua nulo")
+    conferir(produtos.column('Cor').to_pylist() == [None, ['Azul'], ['Azul', 'Preto']],
+             "coluna ausente no primeiro produto e mista nos demais")
+    conferir(produtos.schema.field('Preço').type == pa.string() and produtos.column('Preço').to_pylist() == ['$24.99', None, None],
+             "coluna só de textos continua string")
+    conferir(specs.num_rows == 1, "specs: uma linha por especificação")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminhos = exportar_parquet(REGISTROS, os.path.join(pasta, 'catalogo'))
+        conferir(pq.read_table(caminhos[0]).equals(produtos), "Parquet relido igual à tabela de produtos")
+
+    print(f"{len(erros)} erro(s)")
+    return 1 if erros else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Confere o modo incremental com um MyMemory local que falha numa tradução e depois volta:
+1. primeira coleta com o provedor falhando para um campo: o campo sai sem tradução e fica fora do snapshot;
+2. segunda coleta, mesmos dados, provedor de volta: só esse campo vai para a rede e sai traduzido;
+3. terceira coleta: nenhuma requisição.
+
+Uso: python benchmarks/verificar_incremental.py
+"""
+import glob
+import json
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTA_PAGINAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'paginas')
+sys.path.insert(0, RAIZ)
+
+
+def servidor_mymemory(estado: dict) -> ThreadingHTTPServer:
+    """MyMemory local: traduz com o prefixo '[pt] ' e responde 503 a textos com estado['alvo'] enquanto estado['falhar']"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            texto = parse_qs(urlparse(self.path).query).get('q', [''])[0]
+            estado['textos'].append(texto)
+            if estado['falhar'] and estado['alvo'] in texto:
+                self.send_error(503)
+                return
+            traducao = '\n'.join(f"[pt] {linha}" for linha in texto.split('\n'))
+            corpo = json.dumps({'responseStatus': 200, 'responseData': {'translatedText': traducao}}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def log_message(self, *args):
+            pass
+
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
+
+
+def main() -> int:
+    estado = {'falhar': True, 'alvo': None, 'textos': []}
+    servidor = servidor_mymemory(estado)
+    os.environ['MYMEMORY_URL'] = f"http://127.0.0.1:{servidor.server_address[1]}/get"
+    os.environ['PROVEDORES_TRADUCAO'] = 'mymemory'
+    os.environ['MEMORIA_TRADUCAO_DB'] = ''
+    os.environ['SNAPSHOTS_DIR'] = tempfile.mkdtemp(prefix='verificar_incremental_')
+
+    from amazon_scraper import pipeline, traducao
+    from amazon_scraper.cache import snapshots_produtos
+
+    produtos = []
+    for caminho in sorted(glob.glob(os.path.join(PASTA_PAGINAS, '*.html'))):
+        with open(caminho, 'rb') as f:
+            produtos.append(pipeline.extrair_dados_pagina(f.read(), f"https://www.amazon.com/dp/{os.path.basename(caminho)[:10]}"))
+    # O título de um produto falha na primeira coleta
+    produto = next(dados for dados in produtos if dados['titulo_h1'] != 'N/A')
+    alvo = estado['alvo'] = produto['titulo_h1']
+    url = produto['url_produto']
+
+    erros = []
+
+    def conferir(condicao: bool, mensagem: str):
+        print(f"{'ok  ' if condicao else 'ERRO'} {mensagem}")
+        if not condicao:
+            erros.append(mensagem)
+
+    resultados = pipeline.traduzir_e_converter_incremental(produtos)
+    saida = {dados['URL do Produto']: dados for dados in resultados}
+    # (o título também passa por converter_medidas: compara só o prefixo da tradução falsa)
+    conferir(not saida[url]['Título'].startswith('[pt] '), "1ª coleta, provedor falhando: título sai sem tradução")
+    snapshot = snapshots_produtos.obter(url)
+    conferir('titulo_h1' not in snapshot['campos'] and 'titulo_h1' not in snapshot['hashes'],
+             "1ª coleta: campo com falha fica fora do snapshot")
+    conferir('preco' in snapshot['campos'], "1ª coleta: os demais campos entram no snapshot")
+
+    estado['falhar'] = False
+    estado['textos'].clear()
+    traducao.memoria_traducao.limpar()
+    resultados = pipeline.traduzir_e_converter_incremental(produtos)
+    saida = {dados['URL do Produto']: dados for dados in resultados}
+    conferir(estado['textos'] == [alvo],
+             f"2ª coleta, provedor de volta: só o campo com falha vai para a rede ({estado['textos']})")
+    conferir(saida[url]['Título'].startswith('[pt] '), "2ª coleta: título sai traduzido")
+
+    estado['textos'].clear()
+    traducao.memoria_traducao.limpar()
+    pipeline.traduzir_e_converter_incremental(produtos)
+    conferir(not estado['textos'], f"3ª coleta: nenhuma requisição ({len(estado['textos'])})")
+
+    servidor.shutdown()
+    print(f"{len(erros)} erro(s)")
+    return 1 if erros else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())